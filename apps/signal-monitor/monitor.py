@@ -4,19 +4,22 @@ Signal Monitor - Real-time monitoring for trading signals
 Sends alerts via Telegram when GREEN signals appear or positions hit targets
 """
 
+import sys
 import time
-import csv
 import json
 import requests
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'trading'))
+from signal_store import get_signal_store
+
 class SignalMonitor:
     """Monitor signals and send real-time alerts"""
     
     def __init__(self):
-        self.signals_csv = Path('../../trading/signals-database.csv')
+        self.store = get_signal_store()
         self.state_file = Path('monitor_state.json')
         
         # Telegram bot config (from MEMORY.md)
@@ -54,19 +57,9 @@ class SignalMonitor:
             json.dump(state, f, indent=2)
     
     def load_signals(self) -> List[Dict]:
-        """Load signals from CSV"""
-        
-        if not self.signals_csv.exists():
-            return []
-        
-        signals = []
-        with open(self.signals_csv, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('Ticker'):
-                    signals.append(row)
+        """Load signals from the signal store"""
         
-        return signals
+        return self.store.all()
     
     def send_telegram(self, message: str):
         """Send Telegram alert"""
@@ -157,7 +150,7 @@ class SignalMonitor:
         ticker = signal.get('Ticker', 'UNKNOWN')
         source = signal.get('Source', 'Unknown')
         conviction = signal.get('Conviction_Score', 'N/A')
-        notes = signal.get('Notes', '')[:100]
+        notes = (signal.get('Notes') or '')[:100]
         
         message = f"""🟢 *NEW GREEN SIGNAL*
 
@@ -236,7 +229,7 @@ class SignalMonitor:
         print(f"\n{'='*60}")
         print(f"🐓 roostr Signal Monitor")
         print(f"{'='*60}")
-        print(f"\n📊 Monitoring: {self.signals_csv}")
+        print(f"\n📊 Monitoring: {self.store.db_path}")
         print(f"⏱️  Check interval: {interval}s")
         print(f"📱 Alerts via Telegram to: {self.telegram_user_id}")
         print(f"\n🛑 Press Ctrl+C to stop\n")
@@ -6,10 +6,13 @@ Access from phone, tablet, or any device on the network
 
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 import json
-import csv
 from datetime import datetime
 from pathlib import Path
 import socket
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'trading'))
+from signal_store import get_signal_store
 
 class DashboardHandler(SimpleHTTPRequestHandler):
     """Custom handler for dashboard API endpoints"""
@@ -101,21 +104,9 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             self.send_error(404, "Dashboard not found")
     
     def load_signals(self):
-        """Load signals from CSV"""
-        
-        signals = []
-        csv_path = Path('../../trading/signals-database.csv')
-        
-        if not csv_path.exists():
-            return signals
-        
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('Ticker'):
-                    signals.append(row)
+        """Load signals from the signal store"""
         
-        return signals
+        return get_signal_store().all()
     
     def calculate_metrics(self, signals):
         """Calculate portfolio metrics"""
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Agent Pool - Concurrent evaluation for the V2 agent ensembles
+==============================================================
+
+The V2 agents are mostly I/O-bound (yfinance, Reddit, news), so running
+them one after another costs the sum of their latencies. evaluate_agents()
+runs every agent on a thread pool and returns once the slowest one
+finishes, or when the per-agent timeout expires. Agents that time out or
+crash get an ABSTAIN opinion so the ensemble always has a full roster.
+
+Usage:
+    opinions = evaluate_agents(LEGENDARY_INVESTORS_V2, 'AAPL',
+                               opinion_cls=InvestorOpinion, snapshot=snapshot)
+
+Author: Joselo 🐓
+Version: 1.0.0
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, Optional
+
+AGENT_TIMEOUT = 30.0  # Seconds each agent gets before it abstains
+
+
+def abstain_opinion(opinion_cls, agent, ticker: str, reason: str):
+    """ABSTAIN opinion in the same format the agents use for data errors"""
+    return opinion_cls(
+        agent_name=agent.name,
+        ticker=ticker,
+        conviction=5.0,
+        action='ABSTAIN',
+        rationale=f"Unable to evaluate {ticker}: {reason}",
+        key_metrics={'error': reason},
+        data_quality='LOW',
+        timestamp=datetime.now().isoformat()
+    )
+
+
+def evaluate_agents(agents: Dict,
+                    ticker: str,
+                    opinion_cls,
+                    signal: Optional[Dict] = None,
+                    snapshot=None,
+                    parallel: bool = True,
+                    timeout: float = AGENT_TIMEOUT,
+                    max_workers: Optional[int] = None) -> Dict:
+    """
+    Evaluate every agent on a ticker.
+
+    Args:
+        agents: agent_id → agent registry (e.g. LEGENDARY_INVESTORS_V2)
+        ticker: Ticker to evaluate
+        opinion_cls: Opinion dataclass used for ABSTAIN fallbacks
+        signal: Optional signal dict passed to each agent
+        snapshot: Shared TickerSnapshot passed to each agent
+        parallel: Run agents concurrently (False = original serial loop)
+        timeout: Seconds each agent may take before it abstains
+        max_workers: Thread pool size (default: one thread per agent)
+
+    Returns:
+        agent_id → opinion, in registry order
+    """
+    if not parallel:
+        return {
+            agent_id: agent.evaluate(ticker, signal, snapshot=snapshot)
+            for agent_id, agent in agents.items()
+        }
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or max(len(agents), 1),
+                                  thread_name_prefix=f"agents-{ticker}")
+    started = time.time()
+    futures = {
+        agent_id: executor.submit(agent.evaluate, ticker, signal, snapshot=snapshot)
+        for agent_id, agent in agents.items()
+    }
+    wait(futures.values(), timeout=timeout)
+    # Don't block on stragglers; their results are discarded
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    opinions = {}
+    for agent_id, future in futures.items():
+        agent = agents[agent_id]
+        if future.cancelled() or not future.done():
+            print(f"⏱️  {agent.name} timed out on {ticker} after {timeout:.0f}s")
+            opinions[agent_id] = abstain_opinion(opinion_cls, agent, ticker,
+                                                 f"timed out after {timeout:.0f}s")
+        elif future.exception() is not None:
+            print(f"❌ {agent.name} error on {ticker}: {future.exception()}")
+            opinions[agent_id] = abstain_opinion(opinion_cls, agent, ticker,
+                                                 str(future.exception()))
+        else:
+            opinions[agent_id] = future.result()
+
+    print(f"✅ {len(agents)} agents evaluated {ticker} in {time.time() - started:.1f}s")
+    return opinions
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Batch Pipeline - Multi-ticker 18-agent evaluation
+==================================================
+
+Evaluates N tickers in three stages instead of one signal at a time:
+
+1. Prefetch: one bulk yf.download tops up the bar store for every
+   ticker, and each ticker's fundamentals snapshot is fetched once on a
+   bounded thread pool (yfinance has no multi-ticker info endpoint).
+2. Fan out: each ticker's agent work (PortfolioManager + the data-driven
+   V2 ensembles) runs on a process pool, using the prefetched data only.
+3. Collect: one conviction document per ticker plus a summary table.
+
+Usage:
+    python agents/run_18_agents.py --batch --tickers AAPL MSFT NVDA
+    python agents/run_18_agents.py --batch --scan-all --workers 8
+
+Author: Joselo 🐓
+Version: 1.0.0
+"""
+
+import os
+import sys
+import csv
+import math
+import time
+from pathlib import Path
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.append(str(Path(__file__).parent.parent))
+
+from bar_store import get_bar_store
+from fundamentals_snapshot import TickerSnapshot, get_snapshot, put_snapshot
+
+PREFETCH_DAYS = 365   # Bars to prefetch (covers the 6mo / 3mo / 1mo agent windows)
+FETCH_WORKERS = 8     # Concurrent fundamentals requests during prefetch
+
+
+def _prefetch_snapshot(ticker: str) -> Tuple[str, Optional[TickerSnapshot], Optional[str]]:
+    try:
+        snapshot = get_snapshot(ticker).prefetch(include_news=True)
+        snapshot.history('6mo')
+        snapshot.history('3mo')
+        snapshot.history('1mo')
+        return ticker, snapshot, None
+    except Exception as e:
+        return ticker, None, str(e)
+
+
+def prefetch_data(tickers: List[str],
+                  fetch_workers: int = FETCH_WORKERS) -> Dict[str, TickerSnapshot]:
+    """
+    Bulk-load market and fundamental data for every ticker.
+
+    Returns:
+        ticker → fully fetched TickerSnapshot (tickers that failed are omitted)
+    """
+    started = time.time()
+
+    requests_made = get_bar_store().update(tickers, datetime.now() - timedelta(days=PREFETCH_DAYS))
+    print(f"📈 Price bars ready for {len(tickers)} tickers ({requests_made} bulk request(s))")
+
+    snapshots = {}
+    with ThreadPoolExecutor(max_workers=fetch_workers) as pool:
+        for ticker, snapshot, error in pool.map(_prefetch_snapshot, tickers):
+            if snapshot is None:
+                print(f"⚠️  Fundamentals unavailable for {ticker}: {error}")
+                continue
+            snapshots[ticker] = snapshot
+
+    print(f"📊 Fundamentals ready for {len(snapshots)}/{len(tickers)} tickers "
+          f"in {time.time() - started:.1f}s")
+    return snapshots
+
+
+def evaluate_ticker(signal: Dict, snapshot: Optional[TickerSnapshot] = None) -> Dict:
+    """
+    Full 18-agent evaluation of one signal (runs inside a pool worker).
+
+    The conviction document is the PortfolioManager's, with the data-driven
+    V2 ensemble summaries attached under 'data_driven'.
+    """
+    from portfolio_manager import PortfolioManager, RiskManager
+    from quant_agents_v2 import run_full_quant_analysis
+    from legendary_investors_v2 import run_legendary_analysis
+
+    ticker = signal['ticker']
+    if snapshot is not None:
+        put_snapshot(snapshot)
+    snapshot = get_snapshot(ticker)
+
+    portfolio_manager = PortfolioManager(risk_manager=RiskManager())
+    conviction_doc = portfolio_manager.evaluate_signal(signal)
+
+    # Data is already local, so agents run serially inside each worker
+    quant = run_full_quant_analysis(ticker, signal, snapshot=snapshot, parallel=False)
+    legendary = run_legendary_analysis(ticker, signal, snapshot=snapshot, parallel=False)
+    conviction_doc['data_driven'] = {
+        'quant_agents': quant['summary'],
+        'legendary_investors': legendary['summary']
+    }
+    return conviction_doc
+
+
+def _signal_for(ticker: str, signals_by_ticker: Dict[str, Dict],
+                snapshot: Optional[TickerSnapshot]) -> Dict:
+    signal = dict(signals_by_ticker.get(ticker) or {
+        "ticker": ticker,
+        "catalyst": "",
+        "source": "Batch",
+        "asset_class": "unknown",
+        "conviction": 5
+    })
+
+    # Fill a missing entry price from the latest prefetched close
+    try:
+        missing_price = not signal.get('price') or math.isnan(float(signal['price']))
+    except (TypeError, ValueError):
+        missing_price = True
+    if missing_price and snapshot is not None:
+        hist = snapshot.history('1mo')
+        if not hist.empty:
+            signal['price'] = round(float(hist['Close'].iloc[-1]), 4)
+    return signal
+
+
+def write_summary(conviction_docs: List[Dict], output_dir: Path) -> Path:
+    """Write the batch summary table as CSV"""
+    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+    output_path = output_dir / f"batch_summary_{timestamp}.csv"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    fields = ['ticker', 'final_decision', 'risk_validated_conviction', 'conviction_rating',
+              'legendary_consensus', 'quant_consensus',
+              'data_driven_legendary', 'data_driven_quant', 'entry_price']
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for row in summary_rows(conviction_docs):
+            writer.writerow(row)
+
+    return output_path
+
+
+def summary_rows(conviction_docs: List[Dict]) -> List[Dict]:
+    rows = []
+    for doc in sorted(conviction_docs, key=lambda d: d['risk_validated_conviction'], reverse=True):
+        data_driven = doc.get('data_driven', {})
+        rows.append({
+            'ticker': doc['ticker'],
+            'final_decision': doc['final_decision'],
+            'risk_validated_conviction': doc['risk_validated_conviction'],
+            'conviction_rating': doc['conviction_rating'],
+            'legendary_consensus': doc['legendary_investors']['consensus'],
+            'quant_consensus': doc['quant_agents']['consensus'],
+            'data_driven_legendary': data_driven.get('legendary_investors', {}).get('consensus', 'N/A'),
+            'data_driven_quant': data_driven.get('quant_agents', {}).get('consensus', 'N/A'),
+            'entry_price': doc['entry_price']
+        })
+    return rows
+
+
+def print_summary_table(conviction_docs: List[Dict]):
+    """Print the batch summary table"""
+    print("\n" + "=" * 86)
+    print(f"🐓 roostr Capital - Batch 18-Agent Summary ({len(conviction_docs)} tickers)")
+    print("=" * 86)
+    print(f"{'TICKER':<8} {'DECISION':<9} {'CONV':>5}  {'RATING':<10} {'LEGEND':<6} {'QUANT':<6} "
+          f"{'V2 LEGEND':<11} {'V2 QUANT':<11}")
+    print("-" * 86)
+    for row in summary_rows(conviction_docs):
+        print(f"{row['ticker']:<8} {row['final_decision']:<9} {row['risk_validated_conviction']:>5.2f}  "
+              f"{row['conviction_rating']:<10} {row['legendary_consensus']:<6} {row['quant_consensus']:<6} "
+              f"{row['data_driven_legendary']:<11} {row['data_driven_quant']:<11}")
+    print("=" * 86)
+
+
+def run_batch(tickers: List[str],
+              signals_by_ticker: Optional[Dict[str, Dict]] = None,
+              output_dir: Optional[Path] = None,
+              workers: Optional[int] = None,
+              fetch_workers: int = FETCH_WORKERS,
+              save_document=None) -> List[Dict]:
+    """
+    Evaluate many tickers: bulk prefetch, then a process pool of agent runs.
+
+    Args:
+        tickers: Tickers to evaluate (duplicates are dropped)
+        signals_by_ticker: Optional ticker → signal dict (e.g. from the database)
+        output_dir: Where conviction documents and the summary go
+        workers: Process pool size (default: CPU count)
+        fetch_workers: Concurrent fundamentals requests during prefetch
+        save_document: Callable(conviction_doc, output_dir) used to save each doc
+
+    Returns:
+        List of conviction documents (one per ticker that evaluated)
+    """
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+    signals_by_ticker = {k.upper(): v for k, v in (signals_by_ticker or {}).items()}
+    started = time.time()
+
+    print(f"🐓 Batch evaluating {len(tickers)} tickers...")
+    snapshots = prefetch_data(tickers, fetch_workers=fetch_workers)
+
+    conviction_docs = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for ticker in tickers:
+            snapshot = snapshots.get(ticker)
+            signal = _signal_for(ticker, signals_by_ticker, snapshot)
+            futures[pool.submit(evaluate_ticker, signal, snapshot)] = ticker
+
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                conviction_doc = future.result()
+            except Exception as e:
+                print(f"❌ Error evaluating {ticker}: {e}")
+                continue
+
+            if save_document and output_dir is not None:
+                save_document(conviction_doc, output_dir)
+            conviction_docs.append(conviction_doc)
+
+    print_summary_table(conviction_docs)
+    if output_dir is not None and conviction_docs:
+        summary_path = write_summary(conviction_docs, output_dir)
+        print(f"\n✅ Summary table saved: {summary_path}")
+
+    print(f"⏱️  Batch finished in {time.time() - started:.1f}s")
+    return conviction_docs
@@ -6,6 +6,7 @@ Runs all agents on a signal, produces consensus recommendation with full rationa
 
 import json
 import os
+import sys
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
@@ -15,6 +16,24 @@ from datetime import datetime
 AGENTS_DIR = Path(__file__).parent
 SIGNALS_DB = AGENTS_DIR.parent / "signals-database.csv"
 
+sys.path.append(str(AGENTS_DIR.parent))
+from keyword_matcher import KeywordMatcher
+
+# Phase 1 rule keywords, one matcher per agent (built once, one scan of the notes)
+RULE_KEYWORDS = {
+    "buffett_quality": KeywordMatcher({
+        "moat": ["moat", "pricing power", "brand", "network effect", "switching cost"],
+        "disqualifiers": ["can't explain", "complex", "leverage"],
+    }),
+    "burry_contrarian": KeywordMatcher({
+        "contrarian": ["hated", "pessimism", "forced selling", "mispriced", "overlooked"],
+        "downside": ["asset", "cash flow", "balance sheet", "coverage"],
+    }),
+    "risk_manager": KeywordMatcher({
+        "risk_flags": ["binary", "catalyst", "volatile", "illiquid", "concentrated"],
+    }),
+}
+
 @dataclass
 class AgentVote:
     """Single agent's vote on a signal"""
@@ -99,15 +118,16 @@ class AgentPersonality:
         vote = "HOLD"
         factors = {}
         concerns = []
+        matcher = RULE_KEYWORDS.get(self.agent_id)
+        counts = matcher.counts(notes) if matcher else {}
         
         # Agent-specific logic based on personality
         if self.agent_id == "buffett_quality":
             # Buffett: Look for moat indicators in notes
-            moat_keywords = ["moat", "pricing power", "brand", "network effect", "switching cost"]
-            moat_score = sum(1 for kw in moat_keywords if kw.lower() in notes.lower())
+            moat_score = counts["moat"]
             
             # Check for disqualifiers
-            if any(d.lower() in notes.lower() for d in ["can't explain", "complex", "leverage"]):
+            if counts["disqualifiers"]:
                 conviction = 2.0
                 vote = "PASS"
                 rationale = "I don't understand this business well enough to invest with confidence."
@@ -125,11 +145,8 @@ class AgentPersonality:
                 
         elif self.agent_id == "burry_contrarian":
             # Burry: Look for contrarian setups, downside protection
-            contrarian_keywords = ["hated", "pessimism", "forced selling", "mispriced", "overlooked"]
-            downside_keywords = ["asset", "cash flow", "balance sheet", "coverage"]
-            
-            contrarian_score = sum(1 for kw in contrarian_keywords if kw.lower() in notes.lower())
-            downside_score = sum(1 for kw in downside_keywords if kw.lower() in notes.lower())
+            contrarian_score = counts["contrarian"]
+            downside_score = counts["downside"]
             
             if contrarian_score >= 1 and downside_score >= 1:
                 conviction = 8.0
@@ -149,8 +166,7 @@ class AgentPersonality:
                 
         elif self.agent_id == "risk_manager":
             # Risk Manager: Check for risk flags
-            risk_flags = ["binary", "catalyst", "volatile", "illiquid", "concentrated"]
-            risk_count = sum(1 for flag in risk_flags if flag.lower() in notes.lower())
+            risk_count = counts["risk_flags"]
             
             if risk_count >= 3:
                 conviction = 0.0
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Fundamentals Snapshot - Fetch-once ticker data for the agent ensemble
+======================================================================
+
+Every V2 agent used to call yf.Ticker(ticker).info on its own, so one
+ticker cost 12+ identical HTTP round-trips. A TickerSnapshot fetches each
+piece of data (info, balance sheet, news, price history) at most once and
+is shared by every agent evaluating that ticker.
+
+Snapshots are cached per ticker with a TTL, so back-to-back runs on the
+same watchlist reuse them too.
+
+Usage:
+    snapshot = get_snapshot('AAPL')
+    opinion = WarrenBuffett().evaluate('AAPL', snapshot=snapshot)
+
+Author: Joselo 🐓
+Version: 1.0.0
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import yfinance as yf
+
+sys.path.append(str(Path(__file__).parent.parent))
+from bar_store import get_bar_store
+
+SNAPSHOT_TTL = 15 * 60  # Seconds a cached snapshot stays valid
+
+# yfinance period strings → calendar days of bars to read from the bar store
+PERIOD_DAYS = {
+    '1mo': 30,
+    '3mo': 91,
+    '6mo': 183,
+    '1y': 365,
+    '2y': 730
+}
+
+
+class TickerSnapshot:
+    """
+    Lazily fetched, shared view of one ticker's data.
+
+    Mirrors the parts of yf.Ticker the agents use (info, balance_sheet,
+    news, history), so agents can treat it as a drop-in replacement.
+    """
+
+    def __init__(self, ticker: str, info: Optional[Dict] = None):
+        self.ticker = ticker.upper()
+        self.created_at = time.time()
+        self._lock = threading.Lock()
+        self._data: Dict = {}
+        self._yf_ticker = None
+        if info is not None:
+            self._data['info'] = info
+
+    def _get(self, key: str, fetch):
+        with self._lock:
+            if key not in self._data:
+                self._data[key] = fetch()
+            return self._data[key]
+
+    def _ticker(self):
+        # Only called under self._lock
+        if self._yf_ticker is None:
+            self._yf_ticker = yf.Ticker(self.ticker)
+        return self._yf_ticker
+
+    @property
+    def info(self) -> Dict:
+        return self._get('info', lambda: self._ticker().info or {})
+
+    @property
+    def balance_sheet(self):
+        return self._get('balance_sheet', lambda: self._ticker().balance_sheet)
+
+    @property
+    def news(self) -> List[Dict]:
+        return self._get('news', lambda: self._ticker().news or [])
+
+    def history(self, period: str = '6mo'):
+        """Daily OHLCV bars for a yfinance-style period, via the bar store"""
+        days = PERIOD_DAYS.get(period, 183)
+        start = datetime.now() - timedelta(days=days)
+        return self._get(f'history:{period}',
+                         lambda: get_bar_store().get_bars(self.ticker, start))
+
+    def prefetch(self, include_news: bool = False):
+        """Warm the snapshot so later agent calls never block on I/O"""
+        self.info
+        self.balance_sheet
+        if include_news:
+            self.news
+        return self
+
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    def __getstate__(self):
+        # Ship only the fetched data (e.g. to process-pool workers)
+        with self._lock:
+            return {'ticker': self.ticker, 'created_at': self.created_at,
+                    'data': dict(self._data)}
+
+    def __setstate__(self, state):
+        self.ticker = state['ticker']
+        self.created_at = state['created_at']
+        self._data = state['data']
+        self._lock = threading.Lock()
+        self._yf_ticker = None
+
+
+_cache: Dict[str, TickerSnapshot] = {}
+_cache_lock = threading.Lock()
+
+
+def get_snapshot(ticker: str, ttl: int = SNAPSHOT_TTL) -> TickerSnapshot:
+    """Cached snapshot for a ticker, replaced once older than ttl seconds"""
+    key = ticker.upper()
+    with _cache_lock:
+        snapshot = _cache.get(key)
+        if snapshot is None or snapshot.age() > ttl:
+            snapshot = TickerSnapshot(key)
+            _cache[key] = snapshot
+        return snapshot
+
+
+def put_snapshot(snapshot: TickerSnapshot):
+    """Seed the cache with an already-fetched snapshot"""
+    with _cache_lock:
+        _cache[snapshot.ticker] = snapshot
+
+
+def clear_snapshots():
+    """Drop every cached snapshot"""
+    with _cache_lock:
+        _cache.clear()
@@ -28,9 +28,11 @@ import requests
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-import yfinance as yf
 import numpy as np
 
+from fundamentals_snapshot import TickerSnapshot, get_snapshot
+from agent_pool import AGENT_TIMEOUT, evaluate_agents
+
 # Try importing optional dependencies
 try:
     from textblob import TextBlob
@@ -99,7 +101,8 @@ class AswathDamodaran:
     def __init__(self):
         self.name = "Aswath Damodaran"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate using DCF and comparable analysis.
         
@@ -111,7 +114,7 @@ class AswathDamodaran:
         - 0-1 = Strong SELL (extremely overvalued)
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get financial data
@@ -269,7 +272,8 @@ class BenjaminGraham:
     def __init__(self):
         self.name = "Benjamin Graham"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate using Graham's value screens.
         
@@ -281,7 +285,7 @@ class BenjaminGraham:
         - Positive earnings last 10 years (proxy: current earnings)
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             balance_sheet = stock.balance_sheet
             
@@ -443,7 +447,8 @@ class PeterLynch:
     def __init__(self):
         self.name = "Peter Lynch"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate using PEG ratio and growth metrics.
         
@@ -454,7 +459,7 @@ class PeterLynch:
         - Understandable business
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -621,7 +626,8 @@ class CathieWood:
             'space', 'satellite', '3d printing', 'cloud', 'saas'
         ]
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate disruptive innovation potential.
         
@@ -632,7 +638,7 @@ class CathieWood:
         - 5-year vision (not 1-year)
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -781,7 +787,8 @@ class PhilFisher:
     def __init__(self):
         self.name = "Phil Fisher"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate quality of growth and competitive position.
         
@@ -793,7 +800,7 @@ class PhilFisher:
         - Strong competitive position (market share proxy)
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -957,7 +964,8 @@ class RakeshJhunjhunwala:
     def __init__(self):
         self.name = "Rakesh Jhunjhunwala"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate long-term growth potential and quality.
         
@@ -968,7 +976,7 @@ class RakeshJhunjhunwala:
         - Patient capital approach
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -1126,7 +1134,8 @@ class BillAckman:
     def __init__(self):
         self.name = "Bill Ackman"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate activist/catalyst potential and conviction level.
         
@@ -1136,7 +1145,7 @@ class BillAckman:
         - High conviction = large position
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -1294,7 +1303,8 @@ class StanleyDruckenmiller:
     def __init__(self):
         self.name = "Stanley Druckenmiller"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate macro tailwinds and risk/reward asymmetry.
         
@@ -1304,7 +1314,7 @@ class StanleyDruckenmiller:
         - Position sizing based on conviction
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -1490,7 +1500,8 @@ class MohnishPabrai:
     def __init__(self):
         self.name = "Mohnish Pabrai"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate asymmetric risk/reward using Dhandho framework.
         
@@ -1500,7 +1511,7 @@ class MohnishPabrai:
         - Heads I win big, tails I don't lose much
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -1680,7 +1691,8 @@ class WarrenBuffett:
     def __init__(self):
         self.name = "Warren Buffett"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate business quality and moat strength.
         
@@ -1692,7 +1704,7 @@ class WarrenBuffett:
         - Reasonable valuation vs owner earnings
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -1864,7 +1876,8 @@ class CharlieMunger:
     def __init__(self):
         self.name = "Charlie Munger"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate using mental models and inversion.
         
@@ -1875,7 +1888,7 @@ class CharlieMunger:
         - Patient, rational decision-making
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -2021,7 +2034,8 @@ class MichaelBurry:
     def __init__(self):
         self.name = "Michael Burry"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> InvestorOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> InvestorOpinion:
         """
         Evaluate contrarian deep value opportunities.
         
@@ -2032,7 +2046,7 @@ class MichaelBurry:
         - Go against consensus when math supports it
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Get metrics
@@ -2206,9 +2220,16 @@ LEGENDARY_INVESTORS_V2 = {
 }
 
 
-def run_legendary_analysis(ticker: str, signal: Optional[Dict] = None) -> Dict:
+def run_legendary_analysis(ticker: str, signal: Optional[Dict] = None,
+                           snapshot: Optional[TickerSnapshot] = None,
+                           parallel: bool = True,
+                           timeout: float = AGENT_TIMEOUT) -> Dict:
     """
-    Run all 9 legendary investor agents on a ticker.
+    Run all 12 legendary investor agents on a ticker.
+    
+    The ticker's data is fetched once (see fundamentals_snapshot) and
+    shared by every agent. With parallel=True the agents run concurrently
+    and any agent slower than timeout seconds abstains.
     
     Returns:
         Dict with individual opinions and aggregated summary
@@ -2224,10 +2245,14 @@ def run_legendary_analysis(ticker: str, signal: Optional[Dict] = None) -> Dict:
         'summary': {}
     }
     
+    # Fetch ticker data once and share it across every agent
+    snapshot = snapshot or get_snapshot(ticker)
+    
     # Run each agent
-    for agent_id, agent in LEGENDARY_INVESTORS_V2.items():
-        print(f"Running {agent.name}...")
-        opinion = agent.evaluate(ticker, signal)
+    opinions = evaluate_agents(LEGENDARY_INVESTORS_V2, ticker, InvestorOpinion,
+                               signal=signal, snapshot=snapshot,
+                               parallel=parallel, timeout=timeout)
+    for agent_id, opinion in opinions.items():
         results['agents'][agent_id] = asdict(opinion)
     
     # Aggregate results
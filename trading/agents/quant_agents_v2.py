@@ -23,9 +23,11 @@ import requests
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-import yfinance as yf
 import numpy as np
 
+from fundamentals_snapshot import TickerSnapshot, get_snapshot
+from agent_pool import AGENT_TIMEOUT, evaluate_agents
+
 # Try importing optional dependencies
 try:
     import praw
@@ -70,7 +72,8 @@ class ValuationAgent:
     def __init__(self):
         self.name = "Quant Valuation"
         
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> QuantOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> QuantOpinion:
         """
         Evaluate valuation using multiple methods.
         
@@ -83,7 +86,7 @@ class ValuationAgent:
         """
         try:
             # Fetch data
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             # Extract key metrics
@@ -266,7 +269,8 @@ class TechnicalsAgent:
     def __init__(self):
         self.name = "Quant Technicals"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> QuantOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> QuantOpinion:
         """
         Evaluate technical setup.
         
@@ -278,9 +282,8 @@ class TechnicalsAgent:
         - 0-1 = Strong bearish (multiple warnings)
         """
         try:
-            # Fetch price history
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="6mo")
+            # Fetch price history (6 months, from the local bar store)
+            hist = (snapshot or get_snapshot(ticker)).history(period="6mo")
             
             if hist.empty:
                 raise ValueError("No price data available")
@@ -474,7 +477,8 @@ class FundamentalsAgent:
     def __init__(self):
         self.name = "Quant Fundamentals"
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> QuantOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> QuantOpinion:
         """
         Evaluate fundamental strength.
         
@@ -486,7 +490,7 @@ class FundamentalsAgent:
         - 0-1 = Poor fundamentals
         """
         try:
-            stock = yf.Ticker(ticker)
+            stock = snapshot or get_snapshot(ticker)
             info = stock.info
             
             scores = []
@@ -698,7 +702,8 @@ class SentimentAgent:
             except:
                 pass
     
-    def evaluate(self, ticker: str, signal: Optional[Dict] = None) -> QuantOpinion:
+    def evaluate(self, ticker: str, signal: Optional[Dict] = None,
+                 snapshot: Optional[TickerSnapshot] = None) -> QuantOpinion:
         """
         Evaluate sentiment from multiple sources.
         
@@ -710,6 +715,7 @@ class SentimentAgent:
         - 0-1 = Very bearish sentiment
         """
         try:
+            snapshot = snapshot or get_snapshot(ticker)
             scores = []
             metrics = {}
             
@@ -721,13 +727,13 @@ class SentimentAgent:
                 metrics['reddit_mentions'] = reddit_mentions
             
             # News Sentiment (using yfinance news)
-            news_score, news_count = self._analyze_news(ticker)
+            news_score, news_count = self._analyze_news(ticker, snapshot)
             scores.append(news_score)
             metrics['news_score'] = news_score
             metrics['news_count'] = news_count
             
             # Social momentum proxy (search volume trend)
-            momentum_score = self._analyze_momentum(ticker)
+            momentum_score = self._analyze_momentum(ticker, snapshot)
             scores.append(momentum_score)
             metrics['momentum_score'] = momentum_score
             
@@ -826,11 +832,10 @@ class SentimentAgent:
         except:
             return 5.0, 0
     
-    def _analyze_news(self, ticker: str) -> Tuple[float, int]:
+    def _analyze_news(self, ticker: str, snapshot: TickerSnapshot) -> Tuple[float, int]:
         """Analyze news sentiment"""
         try:
-            stock = yf.Ticker(ticker)
-            news = stock.news
+            news = snapshot.news
             
             if not news:
                 return 5.0, 0
@@ -856,14 +861,13 @@ class SentimentAgent:
         except:
             return 5.0, 0
     
-    def _analyze_momentum(self, ticker: str) -> float:
+    def _analyze_momentum(self, ticker: str, snapshot: TickerSnapshot) -> float:
         """
         Analyze social momentum using volume as proxy
         (real implementation would use Google Trends, Twitter API, etc.)
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="1mo")
+            hist = snapshot.history(period="1mo")
             
             if hist.empty:
                 return 5.0
@@ -896,13 +900,20 @@ QUANT_AGENTS_V2 = {
 }
 
 
-def run_full_quant_analysis(ticker: str, signal: Optional[Dict] = None) -> Dict:
+def run_full_quant_analysis(ticker: str, signal: Optional[Dict] = None,
+                            snapshot: Optional[TickerSnapshot] = None,
+                            parallel: bool = True,
+                            timeout: float = AGENT_TIMEOUT) -> Dict:
     """
     Run all 4 Quant agents on a ticker and aggregate results.
     
     Returns comprehensive analysis with individual agent opinions
-    and ensemble conviction score.
+    and ensemble conviction score. With parallel=True the agents run
+    concurrently and any agent slower than timeout seconds abstains.
     """
+    # Fetch ticker data once and share it across every agent
+    snapshot = snapshot or get_snapshot(ticker)
+    
     results = {
         'ticker': ticker,
         'timestamp': datetime.now().isoformat(),
@@ -913,9 +924,10 @@ def run_full_quant_analysis(ticker: str, signal: Optional[Dict] = None) -> Dict:
     all_opinions = []
     
     # Run each agent
-    for agent_id, agent in QUANT_AGENTS_V2.items():
-        print(f"🔍 Running {agent.name}...")
-        opinion = agent.evaluate(ticker, signal)
+    opinions = evaluate_agents(QUANT_AGENTS_V2, ticker, QuantOpinion,
+                               signal=signal, snapshot=snapshot,
+                               parallel=parallel, timeout=timeout)
+    for agent_id, opinion in opinions.items():
         results['agents'][agent_id] = asdict(opinion)
         all_opinions.append(opinion)
     
@@ -13,6 +13,8 @@ Usage:
     python agents/run_18_agents.py --ticker TAO --price 176.05 --catalyst "AI blockchain"
     python agents/run_18_agents.py --from-database --ticker TAO
     python agents/run_18_agents.py --scan-all
+    python agents/run_18_agents.py --batch --tickers AAPL MSFT NVDA --workers 8
+    python agents/run_18_agents.py --batch --scan-all
 
 Author: Joselo 🐓
 Version: 1.0.0
@@ -23,72 +25,45 @@ import sys
 import os
 import argparse
 import json
-import pandas as pd
 from datetime import datetime
 from pathlib import Path
 
 # Add agents directory to path
 sys.path.insert(0, os.path.dirname(__file__))
+sys.path.append(str(Path(__file__).parent.parent))
 
 from portfolio_manager import PortfolioManager, RiskManager
 from legendary_investors import LEGENDARY_INVESTORS
 from quant_agents import QUANT_AGENTS
+from signal_store import get_signal_store
+
+
+def _row_to_signal(row: dict) -> dict:
+    """Signal store row → agent signal dict"""
+    return {
+        "ticker": row['Ticker'],
+        "price": row.get('Price_Entry') or row.get('Price_Current') or 0,
+        "catalyst": row.get('Notes') or row.get('Catalyst') or '',
+        "source": row.get('Source') or 'Database',
+        "conviction": row.get('Conviction_Score') or 5,
+        "asset_class": row.get('Asset_Class') or 'unknown',
+        "date_found": row.get('Date_Found') or datetime.now().strftime('%Y-%m-%d')
+    }
 
 
 def load_signal_from_database(ticker: str) -> dict:
-    """Load signal from signals-database.csv"""
-    db_path = Path(__file__).parent.parent / "signals-database.csv"
-    
-    if not db_path.exists():
-        raise FileNotFoundError(f"Database not found: {db_path}")
-    
-    df = pd.read_csv(db_path)
+    """Load the most recent signal for a ticker from the signal store"""
+    latest = get_signal_store().latest(ticker)
     
-    # Find most recent signal for ticker
-    ticker_signals = df[df['Ticker'].str.upper() == ticker.upper()]
-    
-    if ticker_signals.empty:
+    if latest is None:
         raise ValueError(f"No signals found for {ticker}")
     
-    # Get most recent
-    latest = ticker_signals.iloc[-1]
-    
-    signal = {
-        "ticker": latest['Ticker'],
-        "price": latest.get('Price_Entry', latest.get('Price_Current', 0)),
-        "catalyst": latest.get('Notes', latest.get('Catalyst', '')),
-        "source": latest.get('Source', 'Database'),
-        "conviction": latest.get('Conviction_Score', 5),
-        "asset_class": latest.get('Asset_Class', 'unknown'),
-        "date_found": latest.get('Date_Found', datetime.now().strftime('%Y-%m-%d'))
-    }
-    
-    return signal
+    return _row_to_signal(latest)
 
 
 def scan_all_signals() -> list:
     """Load all signals from database"""
-    db_path = Path(__file__).parent.parent / "signals-database.csv"
-    
-    if not db_path.exists():
-        return []
-    
-    df = pd.read_csv(db_path)
-    
-    signals = []
-    for _, row in df.iterrows():
-        signal = {
-            "ticker": row['Ticker'],
-            "price": row.get('Price_Entry', row.get('Price_Current', 0)),
-            "catalyst": row.get('Notes', row.get('Catalyst', '')),
-            "source": row.get('Source', 'Database'),
-            "conviction": row.get('Conviction_Score', 5),
-            "asset_class": row.get('Asset_Class', 'unknown'),
-            "date_found": row.get('Date_Found', datetime.now().strftime('%Y-%m-%d'))
-        }
-        signals.append(signal)
-    
-    return signals
+    return [_row_to_signal(row) for row in get_signal_store().all()]
 
 
 def save_conviction_document(conviction_doc: dict, output_dir: Path):
@@ -161,6 +136,12 @@ def main():
     parser.add_argument('--from-database', action='store_true', help='Load from signals-database.csv')
     parser.add_argument('--scan-all', action='store_true', help='Evaluate all signals in database')
     
+    # Batch mode
+    parser.add_argument('--batch', action='store_true',
+                        help='Bulk-prefetch data and evaluate many tickers on a process pool')
+    parser.add_argument('--tickers', nargs='+', help='Tickers for --batch mode')
+    parser.add_argument('--workers', type=int, default=None, help='Process pool size for --batch (default: CPU count)')
+    
     # Output
     parser.add_argument('--output-dir', default='../conviction-docs', help='Output directory for conviction docs')
     parser.add_argument('--quiet', action='store_true', help='Suppress detailed output')
@@ -174,7 +155,29 @@ def main():
     output_dir = Path(__file__).parent.parent / args.output_dir
     
     # Determine input mode
-    if args.scan_all:
+    if args.batch:
+        from batch_pipeline import run_batch
+        
+        # Latest database signal per ticker (later rows win)
+        signals_by_ticker = {}
+        if args.scan_all or not args.tickers:
+            for signal in scan_all_signals():
+                signals_by_ticker[str(signal['ticker']).upper()] = signal
+        
+        tickers = args.tickers or list(signals_by_ticker.keys())
+        if not tickers:
+            print("❌ Error: --batch needs --tickers or signals in the database")
+            sys.exit(1)
+        
+        run_batch(
+            tickers,
+            signals_by_ticker=signals_by_ticker,
+            output_dir=output_dir,
+            workers=args.workers,
+            save_document=save_conviction_document
+        )
+        
+    elif args.scan_all:
         # Scan all signals
         signals = scan_all_signals()
         print(f"🐓 Evaluating {len(signals)} signals from database...")
@@ -12,13 +12,22 @@ Date: Feb 11, 2026
 """
 
 import os
+import sys
 import json
 import pandas as pd
-import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import requests
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from signal_store import SignalStore, get_signal_store
+from ticker_extractor import TickerExtractor
+
+# Common false positives
+TICKER_BLACKLIST = frozenset({'CEO', 'USA', 'SEC', 'ETF', 'IPO', 'DD', 'YOLO', 'WSB', 'IMO', 'FOMO'})
+TICKER_EXTRACTOR = TickerExtractor(blacklist=TICKER_BLACKLIST, min_standalone=3)
 
 class SocialArbitrageAgent:
     """
@@ -146,20 +155,7 @@ class SocialArbitrageAgent:
         Extract stock tickers from text.
         Format: $TICKER or TICKER (3-5 uppercase letters)
         """
-        # Pattern 1: $TICKER format
-        pattern1 = r'\$([A-Z]{1,5})\b'
-        # Pattern 2: Standalone TICKER (3-5 caps, not part of word)
-        pattern2 = r'\b([A-Z]{3,5})\b'
-        
-        tickers = []
-        tickers.extend(re.findall(pattern1, text))
-        tickers.extend(re.findall(pattern2, text))
-        
-        # Filter out common false positives
-        blacklist = {'CEO', 'USA', 'SEC', 'ETF', 'IPO', 'DD', 'YOLO', 'WSB', 'IMO', 'FOMO'}
-        tickers = [t for t in tickers if t not in blacklist]
-        
-        return list(set(tickers))  # Remove duplicates
+        return TICKER_EXTRACTOR.extract(text)
     
     def get_market_cap(self, ticker: str) -> Optional[float]:
         """
@@ -247,8 +243,8 @@ class SocialArbitrageAgent:
         report.append("\n" + "=" * 80)
         return "\n".join(report)
     
-    def save_to_database(self, signals: List[Dict], db_path='signals-database.csv'):
-        """Append signals to signals database"""
+    def save_to_database(self, signals: List[Dict], store: Optional[SignalStore] = None):
+        """Append signals to the signal store"""
         if not signals:
             print("⚠️  No signals to save.")
             return
@@ -275,27 +271,16 @@ class SocialArbitrageAgent:
                 'Price_Entry', 'Date_Entry', 'Notes']
         df_new = df_new[cols]
         
-        # Load existing database
-        if os.path.exists(db_path):
-            df_existing = pd.read_csv(db_path)
-            
-            # Avoid duplicates (same ticker + date)
-            df_new = df_new[~df_new[['Ticker', 'Date_Found']].apply(tuple, axis=1).isin(
-                df_existing[['Ticker', 'Date_Found']].apply(tuple, axis=1)
-            )]
-            
-            if df_new.empty:
-                print("✅ All signals already in database.")
-                return
-            
-            # Append new signals
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-        else:
-            df_combined = df_new
+        # Insert only new (Ticker, Date_Found) pairs - the unique index dedupes
+        store = store or get_signal_store()
+        saved = store.insert_new(df_new.to_dict('records'))
+        
+        if not saved:
+            print("✅ All signals already in database.")
+            return
         
-        # Save
-        df_combined.to_csv(db_path, index=False)
-        print(f"✅ Saved {len(df_new)} new signals to {db_path}")
+        store.sync_csv()
+        print(f"✅ Saved {saved} new signals to {store.db_path}")
     
     def run_scan(self, save=True, min_conviction=5.0) -> List[Dict]:
         """
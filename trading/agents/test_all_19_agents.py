@@ -19,10 +19,12 @@ import json
 from datetime import datetime
 from typing import Dict, List
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # Import agent modules
 from quant_agents_v2 import QUANT_AGENTS_V2, run_full_quant_analysis
 from legendary_investors_v2 import LEGENDARY_INVESTORS_V2, run_legendary_analysis
+from fundamentals_snapshot import get_snapshot
 
 
 def run_19_agent_deliberation(ticker: str) -> Dict:
@@ -51,24 +53,27 @@ def run_19_agent_deliberation(ticker: str) -> Dict:
     }
     
     # ========================================================================
-    # PHASE 1: Run 4 Quant Agents
+    # PHASES 1-5: Run 4 Quant Agents + 12 Legendary Investors concurrently
+    # (one shared data snapshot, so the ticker is only fetched once)
     # ========================================================================
+    snapshot = get_snapshot(ticker)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        quant_future = pool.submit(run_full_quant_analysis, ticker, snapshot=snapshot)
+        legendary_future = pool.submit(run_legendary_analysis, ticker, snapshot=snapshot)
+        quant_results = quant_future.result()
+        legendary_results = legendary_future.result()
+    
     print("\n📊 PHASE 1: QUANTITATIVE ANALYSIS (4 agents)")
     print("-" * 80)
     
-    quant_results = run_full_quant_analysis(ticker)
     results['agents']['quant'] = quant_results['agents']
     
     for agent_id, opinion in quant_results['agents'].items():
         print(f"✓ {opinion['agent_name']}: {opinion['action']} ({opinion['conviction']}/10)")
     
-    # ========================================================================
-    # PHASE 2-5: Run 12 Legendary Investors
-    # ========================================================================
     print("\n🏛️  PHASES 2-5: LEGENDARY INVESTORS (12 agents)")
     print("-" * 80)
     
-    legendary_results = run_legendary_analysis(ticker)
     results['agents']['legendary'] = legendary_results['agents']
     
     for agent_id, opinion in legendary_results['agents'].items():
@@ -17,11 +17,16 @@ Date: Feb 11, 2026
 """
 
 import os
+import sys
 import json
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from signal_store import SignalStore, get_signal_store
 
 class ValueAgent:
     """
@@ -336,8 +341,8 @@ class ValueAgent:
         
         return sample[:n]
     
-    def save_to_database(self, signals: List[Dict], db_path='signals-database.csv'):
-        """Append signals to signals database"""
+    def save_to_database(self, signals: List[Dict], store: Optional[SignalStore] = None):
+        """Append signals to the signal store"""
         if not signals:
             print("⚠️  No signals to save.")
             return
@@ -364,26 +369,16 @@ class ValueAgent:
                 'Price_Entry', 'Date_Entry', 'Notes']
         df_new = df_new[cols]
         
-        # Load existing database
-        if os.path.exists(db_path):
-            df_existing = pd.read_csv(db_path)
-            
-            # Avoid duplicates
-            df_new = df_new[~df_new[['Ticker', 'Date_Found']].apply(tuple, axis=1).isin(
-                df_existing[['Ticker', 'Date_Found']].apply(tuple, axis=1)
-            )]
-            
-            if df_new.empty:
-                print("✅ All signals already in database.")
-                return
-            
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-        else:
-            df_combined = df_new
+        # Insert only new (Ticker, Date_Found) pairs - the unique index dedupes
+        store = store or get_signal_store()
+        saved = store.insert_new(df_new.to_dict('records'))
+        
+        if not saved:
+            print("✅ All signals already in database.")
+            return
         
-        # Save
-        df_combined.to_csv(db_path, index=False)
-        print(f"✅ Saved {len(df_new)} new value signals to {db_path}")
+        store.sync_csv()
+        print(f"✅ Saved {saved} new value signals to {store.db_path}")
     
     def generate_report(self, signals: List[Dict]) -> str:
         """Generate human-readable report"""
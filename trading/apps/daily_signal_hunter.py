@@ -20,6 +20,9 @@ HUNTING_LOG = BASE_DIR / "hunting-log.jsonl"
 WATCH_LIST = BASE_DIR / "watch-list.csv"
 SIGNALS_DB = BASE_DIR / "signals-database.csv"
 
+sys.path.insert(0, str(BASE_DIR))
+from signal_store import get_signal_store
+
 # Scoring weights (matches MARKET-ANALYSIS-FRAMEWORK.md)
 SCORE_WEIGHTS = {
     'source_quality': 2.0,
@@ -366,26 +369,16 @@ def update_watch_list(signal, conviction_score):
         writer.writerows(watch_list)
 
 def add_to_signals_database(signal, conviction_score, classification):
-    """Add GREEN signals to signals-database.csv for deployment consideration"""
+    """Add GREEN signals to the signal store for deployment consideration"""
     if classification != "GREEN":
         return
     
-    fieldnames = ['ticker', 'source', 'conviction', 'date_found', 'catalyst', 'status', 'entry_clarity']
-    
-    # Check if already in database
-    existing = []
-    if SIGNALS_DB.exists():
-        with open(SIGNALS_DB, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Only keep fields that match our schema
-                existing.append({k: row.get(k, '') for k in fieldnames})
+    store = get_signal_store()
     
-    # Check for duplicates
-    for item in existing:
-        if item.get('ticker') == signal['symbol']:
-            log_to_file(f"   Signal {signal['symbol']} already in database")
-            return
+    # Check if already in database (indexed ticker lookup)
+    if store.latest(signal['symbol']) is not None:
+        log_to_file(f"   Signal {signal['symbol']} already in database")
+        return
     
     # Add new signal
     new_entry = {
@@ -397,13 +390,8 @@ def add_to_signals_database(signal, conviction_score, classification):
         'status': 'new',
         'entry_clarity': 5.0  # Default, will be refined
     }
-    existing.append(new_entry)
-    
-    # Write updated database
-    with open(SIGNALS_DB, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(existing)
+    store.insert_new([new_entry])
+    store.sync_csv(str(SIGNALS_DB))
     
     log_to_file(f"   ✅ Added {signal['symbol']} to signals database (GREEN)")
 
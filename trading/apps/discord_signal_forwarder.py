@@ -101,14 +101,11 @@ class DiscordSignalForwarder:
         scanner = DumbMoneyScanner(token=self.token)
         
         # Scan last 30 minutes (since last run)
-        raw_signals = []
-        for channel_id in channel_ids:
-            signals = await scanner.scan_channel(
-                channel_id,
-                hours_back=1,  # Last hour (overlap OK)
-                min_reactions=config.get('min_reactions', 10)
-            )
-            raw_signals.extend(signals)
+        raw_signals = await scanner.scan_channels(
+            channel_ids,
+            hours_back=1,  # Last hour (overlap OK)
+            min_reactions=config.get('min_reactions', 10)
+        )
         
         # Aggregate and filter
         aggregated = scanner.aggregate_signals(raw_signals)
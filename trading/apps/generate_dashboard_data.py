@@ -7,13 +7,16 @@ Runs: Hourly (syncs with price_updater)
 Output: dashboard-data.json (consumed by Next.js frontend)
 """
 
+import sys
 import pandas as pd
 import json
 from pathlib import Path
 from datetime import datetime
-import yfinance as yf
 
 TRADING_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(TRADING_DIR))
+from price_service import get_quotes
+
 POSITIONS_FILE = TRADING_DIR / "positions.csv"
 OUTPUT_FILE = TRADING_DIR / "dashboard-data.json"
 
@@ -27,17 +30,14 @@ def load_positions():
         return []
 
 def get_current_prices(tickers):
-    """Fetch current prices for all tickers"""
+    """Fetch current prices for all tickers (cached quotes first, then one concurrent round-trip)"""
+    quotes = get_quotes(tickers, allow_stale=True)
     prices = {}
     for ticker in tickers:
-        try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="1d")
-            if not hist.empty:
-                prices[ticker] = hist['Close'].iloc[-1]
-        except Exception as e:
-            print(f"⚠️  Error fetching {ticker}: {e}")
-            prices[ticker] = None
+        quote = quotes.get(ticker.upper())
+        if quote is None:
+            print(f"⚠️  Error fetching {ticker}: no quote from any provider")
+        prices[ticker] = quote['price'] if quote else None
     return prices
 
 def calculate_pnl(positions, prices):
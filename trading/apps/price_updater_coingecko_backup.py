@@ -5,7 +5,6 @@ Fetches TAO/SOL prices from CoinGecko and updates dashboard.html
 Run hourly via cron (respects CoinGecko rate limits)
 """
 
-import requests
 import json
 from datetime import datetime
 import re
@@ -16,8 +15,10 @@ import sys
 sys.path.append('/Users/agentjoselo/.openclaw/workspace/command-center')
 from activity_logger import log_trading, log_automation
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from price_service import get_quotes
+
 
-COINGECKO_API = "https://api.coingecko.com/api/v3/simple/price"
 DASHBOARD_PATH = "/Users/agentjoselo/.openclaw/workspace/trading/dashboard.html"
 POSITIONS_PATH = "/Users/agentjoselo/.openclaw/workspace/trading/PAPER-TRADING-LOG.md"
 CACHE_PATH = "/Users/agentjoselo/.openclaw/workspace/trading/.price_cache.json"
@@ -39,74 +40,37 @@ POSITIONS = {
 }
 
 def load_cache():
-    """Load cached prices"""
+    """Load cached prices (the per-ticker export written by PriceCache)"""
     if Path(CACHE_PATH).exists():
         try:
             with open(CACHE_PATH, 'r') as f:
-                return json.load(f)
+                cache = json.load(f)
+            return {
+                "prices": {symbol: cache[symbol]["price"] for symbol in POSITIONS if symbol in cache},
+                "timestamp": cache["timestamp"]
+            }
         except:
             return None
     return None
 
-def save_cache(prices):
-    """Save prices to cache"""
-    try:
-        with open(CACHE_PATH, 'w') as f:
-            json.dump({
-                "prices": prices,
-                "timestamp": datetime.now().isoformat()
-            }, f, indent=2)
-    except Exception as e:
-        print(f"Warning: Failed to save cache: {e}")
-
 def fetch_prices():
-    """Fetch current prices from CoinGecko (with rate limit handling)"""
-    ids = ",".join([p["id"] for p in POSITIONS.values()])
-    
+    """Fetch current prices via the shared price service (CoinGecko, Yahoo fallback)"""
     try:
-        response = requests.get(
-            COINGECKO_API,
-            params={
-                "ids": ids,
-                "vs_currencies": "usd"
-            },
-            timeout=10
-        )
+        # Display only: a cached quote (refreshed in the background) is fine
+        quotes = get_quotes(list(POSITIONS), allow_stale=True)
+        prices = {symbol: quotes[symbol]["price"] for symbol in POSITIONS if symbol in quotes}
+        if len(prices) == len(POSITIONS):
+            return prices
         
-        # Handle rate limiting
-        if response.status_code == 429:
-            print("⚠️  CoinGecko rate limit hit (429 Too Many Requests). Using cached prices.")
-            cache = load_cache()
-            if cache:
-                age = (datetime.now() - datetime.fromisoformat(cache["timestamp"])).total_seconds() / 60
-                print(f"   Cache age: {age:.1f} minutes")
-                return cache["prices"]
-            else:
-                print("   No cache available. Price update skipped.")
-                return None
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        prices = {}
-        for symbol, details in POSITIONS.items():
-            price = data.get(details["id"], {}).get("usd")
-            if price:
-                prices[symbol] = price
-        
-        # Save to cache for rate limit fallback
-        if prices:
-            save_cache(prices)
-        
-        return prices
-    except requests.exceptions.RequestException as e:
-        print(f"⚠️  Network error: {e}")
-        # Try cache as fallback
+        # Every provider failed for some position (rate limits, network)
+        print("⚠️  Live prices unavailable. Using cached prices.")
         cache = load_cache()
         if cache:
-            print(f"   Using cached prices from {cache['timestamp']}")
-            return cache["prices"]
-        return None
+            age = (datetime.now() - datetime.fromisoformat(cache["timestamp"])).total_seconds() / 60
+            print(f"   Cache age: {age:.1f} minutes")
+            return {**cache["prices"], **prices}
+        print("   No cache available. Price update skipped.")
+        return prices or None
     except Exception as e:
         print(f"❌ Error fetching prices: {e}")
         return None
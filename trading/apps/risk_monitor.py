@@ -3,14 +3,30 @@
 Risk Monitor v2 - Real-time stop-loss violation alerts (TradingView)
 Checks every 5min, alerts via Telegram if positions breach stops
 Now includes RSI context and real-time TradingView data
+
+One sweep fetches every position in a single multi-symbol TradingView
+scan. `--watch` keeps running: a full sweep every 5min, plus a fast
+re-check of just the positions near their stop.
 """
 
+import argparse
 import json
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from tradingview_ta import TA_Handler, Interval
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from price_service import TradingViewProvider
+
+WARNING_PCT = 5.0         # Warn when price is within this % of the stop
+NEAR_STOP_PCT = 10.0      # Watch mode re-checks positions within this % often
+FULL_SWEEP_SECONDS = 300  # Watch mode: every position
+NEAR_SWEEP_SECONDS = 30   # Watch mode: positions near their stop
+FETCH_WORKERS = 8         # Per-symbol fallback when the batch scan misses
+
 # Position configs (matches price_updater.py)
 POSITIONS = {
     "TAO": {
@@ -46,14 +62,49 @@ def fetch_live_data(ticker):
         print(f"⚠️  {ticker}: Error fetching live data - {e}")
         return None
 
-def check_stops():
-    """Check if any positions have violated their stop losses"""
+def fetch_live_data_batch(tickers=None):
+    """
+    Current price + RSI for many positions at once
+    
+    One get_multiple_analysis scan covers every symbol; anything it misses
+    is retried per symbol on a bounded thread pool.
+    """
+    tickers = [t for t in (tickers or POSITIONS) if t in POSITIONS]
+    if not tickers:
+        return {}
+    
+    try:
+        results = TradingViewProvider(POSITIONS).fetch(tickers)
+    except Exception as e:
+        print(f"⚠️  Batch TradingView scan failed - {e}")
+        results = {}
+    
+    missing = [t for t in tickers if t not in results]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(missing))) as pool:
+            for ticker, data in zip(missing, pool.map(fetch_live_data, missing)):
+                if data:
+                    results[ticker] = data
+    return results
+
+def scan_positions(tickers=None):
+    """
+    Evaluate positions against their stops
     
+    Returns:
+        (violations, warnings, distances) where distances maps each priced
+        ticker to its % distance above the stop
+    """
     violations = []
     warnings = []
+    distances = {}
+    
+    tickers = list(tickers or POSITIONS)
+    live_data = fetch_live_data_batch(tickers)
     
-    for ticker, pos in POSITIONS.items():
-        data = fetch_live_data(ticker)
+    for ticker in tickers:
+        pos = POSITIONS[ticker]
+        data = live_data.get(ticker)
         
         if not data:
             print(f"⚠️  {ticker}: No live data available")
@@ -67,6 +118,7 @@ def check_stops():
         
         # Calculate distances
         distance_to_stop = ((current_price - stop_price) / current_price) * 100
+        distances[ticker] = distance_to_stop
         pnl_pct = ((current_price - entry_price) / entry_price) * 100
         
         # Check if stop violated
@@ -82,7 +134,7 @@ def check_stops():
                 "signal": signal
             })
         # Warn if approaching stop (within 5%)
-        elif distance_to_stop <= 5.0:
+        elif distance_to_stop <= WARNING_PCT:
             warnings.append({
                 "ticker": ticker,
                 "current": current_price,
@@ -92,8 +144,18 @@ def check_stops():
                 "signal": signal
             })
     
+    return violations, warnings, distances
+
+def report(violations, warnings, quiet=False, alerted=()):
+    """
+    Print warnings/violations and log violations to risk-alerts.log
+
+    Violations for tickers in alerted (already reported by watch()) are
+    neither printed nor logged again; all violations are still returned.
+    """
     # Report status
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    new_violations = [v for v in violations if v['ticker'] not in alerted]
     
     # Show warnings first
     if warnings:
@@ -102,11 +164,11 @@ def check_stops():
             print(f"   {w['ticker']}: ${w['current']:.2f} (stop: ${w['stop']:.2f}) | {w['distance_pct']:.1f}% away | RSI {w['rsi']:.1f}")
     
     # Then violations
-    if violations:
+    if new_violations:
         print(f"\n🚨 STOP LOSS VIOLATIONS DETECTED ({timestamp})")
         print("=" * 60)
         
-        for v in violations:
+        for v in new_violations:
             print(f"\n🔴 {v['ticker']}")
             print(f"   Entry:   ${v['entry']:.2f}")
             print(f"   Current: ${v['current']:.2f} ({v['pnl_pct']:+.1f}%)")
@@ -121,15 +183,58 @@ def check_stops():
         alert_file = Path(__file__).parent.parent / "risk-alerts.log"
         with open(alert_file, "a") as f:
             f.write(f"\n[{timestamp}] STOP LOSS VIOLATION\n")
-            for v in violations:
+            for v in new_violations:
                 f.write(f"  {v['ticker']}: ${v['current']:.2f} <= ${v['stop']:.2f} (RSI {v['rsi']:.1f})\n")
-        
+    
+    if violations:
         return violations
     else:
-        if not warnings:
+        if not warnings and not quiet:
             print(f"✅ Risk Monitor ({timestamp}): All positions within stops")
         return []
 
+def check_stops(tickers=None):
+    """Check if any positions have violated their stop losses"""
+    violations, warnings, _ = scan_positions(tickers)
+    return report(violations, warnings)
+
+def watch(full_interval=FULL_SWEEP_SECONDS, near_interval=NEAR_SWEEP_SECONDS,
+          near_pct=NEAR_STOP_PCT):
+    """
+    Persistent monitor: full sweep every full_interval seconds, and every
+    near_interval seconds a re-check of positions within near_pct of stop
+    """
+    near = set()
+    alerted = set()
+    next_full = 0.0
+    
+    print(f"👀 Watching {len(POSITIONS)} positions "
+          f"(full sweep {full_interval}s, near-stop {near_interval}s)")
+    
+    while True:
+        full_sweep = time.time() >= next_full
+        tickers = list(POSITIONS) if full_sweep else sorted(near)
+        
+        if tickers:
+            violations, warnings, distances = scan_positions(tickers)
+            # Re-alert (print, log, Telegram) a ticker only after it recovers above its stop
+            report(violations, warnings, quiet=not full_sweep, alerted=alerted)
+            new_violations = [v for v in violations if v['ticker'] not in alerted]
+            if new_violations:
+                send_telegram_alert(new_violations)
+            alerted = (alerted - set(distances)) | {v['ticker'] for v in violations}
+            
+            for ticker, distance in distances.items():
+                if distance <= near_pct:
+                    near.add(ticker)
+                else:
+                    near.discard(ticker)
+        
+        if full_sweep:
+            next_full = time.time() + full_interval
+        until_full = max(0.0, next_full - time.time())
+        time.sleep(min(near_interval, until_full) if near else until_full)
+
 def send_telegram_alert(violations):
     """Send Telegram alert for stop violations"""
     
@@ -155,6 +260,17 @@ def send_telegram_alert(violations):
     print("(Use `message` tool to send to Telegram)")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Stop-loss risk monitor')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running; re-check near-stop positions every 30s')
+    args = parser.parse_args()
+    
+    if args.watch:
+        try:
+            watch()
+        except KeyboardInterrupt:
+            sys.exit(0)
+    
     violations = check_stops()
     
     if violations:
@@ -11,14 +11,16 @@ Version: 1.0.0
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import json
+from collections import Counter
 from dataclasses import dataclass, asdict
 import warnings
 warnings.filterwarnings('ignore')
 
+from bar_store import BarStore, get_bar_store
+
 
 @dataclass
 class Trade:
@@ -53,6 +55,90 @@ class BacktestConfig:
     max_hold_days: int = 90  # Force exit after 90 days
     
 
+# Exit reason codes returned by find_first_exits (index into this tuple)
+EXIT_REASONS = ('STOP_LOSS', 'TARGET', 'TIME', 'END_OF_DATA')
+
+# Relative stdev below which returns count as constant (float noise, not risk)
+FLAT_RETURNS_TOLERANCE = 1e-12
+
+
+def annualized_sharpe(returns: np.ndarray, periods: int = 252) -> float:
+    """
+    mean / stdev × sqrt(periods), 0 for fewer than 2 returns or flat returns
+
+    Near-identical returns leave a stdev of float rounding noise (~1e-16),
+    which would otherwise produce a Sharpe around 1e16.
+    """
+    returns = np.asarray(returns, dtype=float)
+    if len(returns) < 2:
+        return 0.0
+    mean, std = returns.mean(), returns.std()
+    if std <= FLAT_RETURNS_TOLERANCE * max(1.0, abs(mean)):
+        return 0.0
+    return float(mean / std * np.sqrt(periods))
+
+
+def find_first_exits(low: np.ndarray,
+                     high: np.ndarray,
+                     days_held: np.ndarray,
+                     stop_price,
+                     target_price,
+                     max_hold_days: int,
+                     is_long=True,
+                     lengths: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Locate the first stop / target / max-hold exit for one or many trades
+    
+    Rows are trades and columns are the bars after entry. Within a bar the
+    checks keep the order of the original loop: stop loss, then take profit,
+    then max hold. Trades that never trigger exit on their last bar with
+    END_OF_DATA.
+    
+    Args:
+        low: Low prices, shape (T,) or (n, T); NaN-padded for ragged rows
+        high: High prices, same shape as low
+        days_held: Calendar days since entry for each bar, same shape as low
+        stop_price: Scalar or (n,) stop levels
+        target_price: Scalar or (n,) target levels
+        max_hold_days: Force exit once this many days have been held
+        is_long: Scalar or (n,) bool, False for SHORT trades
+        lengths: Optional (n,) number of valid bars per row (default: all)
+        
+    Returns:
+        (exit_idx, exit_code) arrays of shape (n,), where exit_code indexes
+        EXIT_REASONS
+    """
+    low = np.atleast_2d(np.asarray(low, dtype=float))
+    high = np.atleast_2d(np.asarray(high, dtype=float))
+    days_held = np.atleast_2d(np.asarray(days_held))
+    n, T = low.shape
+    if n == 0 or T == 0:
+        return np.zeros(n, dtype=np.int64), np.full(n, 3)
+    
+    stop = np.broadcast_to(np.asarray(stop_price, dtype=float), (n,))[:, None]
+    target = np.broadcast_to(np.asarray(target_price, dtype=float), (n,))[:, None]
+    long_side = np.broadcast_to(np.asarray(is_long, dtype=bool), (n,))[:, None]
+    if lengths is None:
+        lengths = np.full(n, T)
+    lengths = np.asarray(lengths)
+    
+    valid = np.arange(T)[None, :] < lengths[:, None]
+    stop_hit = np.where(long_side, low <= stop, high >= stop) & valid
+    target_hit = np.where(long_side, high >= target, low <= target) & valid
+    time_hit = (days_held >= max_hold_days) & valid
+    
+    any_hit = stop_hit | target_hit | time_hit
+    triggered = any_hit.any(axis=1)
+    first = np.argmax(any_hit, axis=1)
+    
+    rows = np.arange(n)
+    code = np.where(stop_hit[rows, first], 0,
+                    np.where(target_hit[rows, first], 1, 2))
+    exit_idx = np.where(triggered, first, lengths - 1)
+    exit_code = np.where(triggered, code, 3)
+    return exit_idx, exit_code
+
+
 class Backtester:
     """
     Core backtesting engine for strategy validation
@@ -63,15 +149,23 @@ class Backtester:
         metrics = bt.calculate_metrics()
     """
     
-    def __init__(self, config: BacktestConfig = None):
+    def __init__(self, config: BacktestConfig = None, bar_store: BarStore = None):
         self.config = config or BacktestConfig()
+        self.bar_store = bar_store or get_bar_store()
         self.trades: List[Trade] = []
         self.equity_curve: List[Dict] = []
         self.daily_returns: pd.Series = None
         
+    @staticmethod
+    def _yf_symbol(ticker: str) -> str:
+        """Map a signal ticker to its yfinance symbol (crypto gets -USD)"""
+        if ticker in ['BTC', 'ETH', 'SOL', 'TAO', 'RNDR', 'FET']:
+            return f"{ticker}-USD"
+        return ticker
+    
     def load_historical_data(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
         """
-        Load historical price data from yfinance
+        Load historical price data (local bar store, topped up from yfinance)
         
         Args:
             ticker: Stock/crypto ticker symbol
@@ -82,27 +176,29 @@ class Backtester:
             DataFrame with OHLCV data
         """
         try:
-            # Add crypto suffix if needed
-            symbol = ticker
-            if ticker in ['BTC', 'ETH', 'SOL', 'TAO', 'RNDR', 'FET']:
-                symbol = f"{ticker}-USD"
-            
-            data = yf.download(symbol, start=start_date, end=end_date, progress=False)
+            symbol = self._yf_symbol(ticker)
+            data = self.bar_store.get_bars(symbol, start_date, end_date)
             
             if data.empty:
                 print(f"⚠️  No data found for {ticker}")
                 return pd.DataFrame()
             
-            # Flatten multi-index columns if present
-            if isinstance(data.columns, pd.MultiIndex):
-                data.columns = data.columns.get_level_values(0)
-            
             return data
             
         except Exception as e:
             print(f"❌ Error loading {ticker}: {e}")
             return pd.DataFrame()
     
+    def _exit_levels(self, entry_price: float, side: str = 'LONG') -> Tuple[float, float]:
+        """Stop loss and take profit prices for an entry"""
+        if side == 'LONG':
+            stop_price = entry_price * (1 - self.config.stop_loss_pct)
+            target_price = entry_price * (1 + self.config.take_profit_pct)
+        else:
+            stop_price = entry_price * (1 + self.config.stop_loss_pct)
+            target_price = entry_price * (1 - self.config.take_profit_pct)
+        return stop_price, target_price
+    
     def simulate_trade(self, 
                        ticker: str,
                        entry_date: datetime,
@@ -122,7 +218,52 @@ class Backtester:
         Returns:
             Trade object with full execution details
         """
-        # Calculate position sizing
+        stop_price, target_price = self._exit_levels(entry_price, side)
+        
+        # Simulate holding period
+        future_data = historical_data[historical_data.index > entry_date]
+        
+        if future_data.empty:
+            return None
+        
+        days_held = np.asarray((future_data.index - entry_date).days)
+        exit_idx, exit_code = find_first_exits(
+            future_data['Low'].to_numpy(dtype=float),
+            future_data['High'].to_numpy(dtype=float),
+            days_held,
+            stop_price,
+            target_price,
+            self.config.max_hold_days,
+            is_long=(side == 'LONG')
+        )
+        exit_idx, exit_code = int(exit_idx[0]), int(exit_code[0])
+        
+        exit_date = future_data.index[exit_idx]
+        exit_reason = EXIT_REASONS[exit_code]
+        if exit_reason == 'STOP_LOSS':
+            exit_price = stop_price
+        elif exit_reason == 'TARGET':
+            exit_price = target_price
+        else:
+            exit_price = future_data.iloc[exit_idx]['Close']
+        
+        return self._build_trade(ticker, entry_date, entry_price, exit_date,
+                                 exit_price, exit_reason, side)
+    
+    def _build_trade(self,
+                     ticker: str,
+                     entry_date: datetime,
+                     entry_price: float,
+                     exit_date: datetime,
+                     exit_price: float,
+                     exit_reason: str,
+                     side: str = 'LONG') -> Trade:
+        """
+        Price a completed round trip (sizing, fees, slippage, P&L)
+        
+        Position size is taken from the latest equity point, so trades must
+        be built in the order they are appended to the equity curve.
+        """
         capital = self.config.starting_capital
         if self.equity_curve:
             capital = self.equity_curve[-1]['total_equity']
@@ -130,69 +271,9 @@ class Backtester:
         position_value = capital * self.config.position_size_pct
         shares = position_value / entry_price
         
-        # Apply entry slippage and fees
         entry_slippage = entry_price * self.config.slippage_pct
-        entry_with_slippage = entry_price * (1 + self.config.slippage_pct)
         entry_fees = position_value * self.config.commission_pct
         
-        # Calculate stop loss and take profit levels
-        if side == 'LONG':
-            stop_price = entry_price * (1 - self.config.stop_loss_pct)
-            target_price = entry_price * (1 + self.config.take_profit_pct)
-        else:
-            stop_price = entry_price * (1 + self.config.stop_loss_pct)
-            target_price = entry_price * (1 - self.config.take_profit_pct)
-        
-        # Simulate holding period
-        future_data = historical_data[historical_data.index > entry_date]
-        
-        if future_data.empty:
-            return None
-        
-        exit_date = None
-        exit_price = None
-        exit_reason = None
-        
-        for date, row in future_data.iterrows():
-            days_held = (date - entry_date).days
-            
-            # Check stop loss
-            if side == 'LONG' and row['Low'] <= stop_price:
-                exit_date = date
-                exit_price = stop_price
-                exit_reason = 'STOP_LOSS'
-                break
-            elif side == 'SHORT' and row['High'] >= stop_price:
-                exit_date = date
-                exit_price = stop_price
-                exit_reason = 'STOP_LOSS'
-                break
-            
-            # Check take profit
-            if side == 'LONG' and row['High'] >= target_price:
-                exit_date = date
-                exit_price = target_price
-                exit_reason = 'TARGET'
-                break
-            elif side == 'SHORT' and row['Low'] <= target_price:
-                exit_date = date
-                exit_price = target_price
-                exit_reason = 'TARGET'
-                break
-            
-            # Check max hold period
-            if days_held >= self.config.max_hold_days:
-                exit_date = date
-                exit_price = row['Close']
-                exit_reason = 'TIME'
-                break
-        
-        # If no exit condition met, exit at last available price
-        if exit_date is None:
-            exit_date = future_data.index[-1]
-            exit_price = future_data.iloc[-1]['Close']
-            exit_reason = 'END_OF_DATA'
-        
         # Apply exit slippage and fees
         exit_with_slippage = exit_price * (1 - self.config.slippage_pct)
         exit_fees = (shares * exit_price) * self.config.commission_pct
@@ -238,23 +319,51 @@ class Backtester:
             Dictionary with trades and performance summary
         """
         print("🔄 Starting backtest simulation...")
-        self.trades = []
-        self.equity_curve = []
-        
-        # Initialize equity tracking
-        current_equity = self.config.starting_capital
-        self.equity_curve.append({
-            'date': signals['Date_Found'].min(),
-            'total_equity': current_equity,
-            'cash': current_equity,
-            'positions_value': 0
-        })
         
         # Sort signals by date
+        start_date = signals['Date_Found'].min()
         signals = signals.sort_values('Date_Found').copy()
         
-        # Process each signal
-        for idx, signal in signals.iterrows():
+        exits = self.find_signal_exits(signals)
+        self.replay_exits(exits, start_date)
+        
+        print(f"✅ Backtest complete: {len(self.trades)} trades executed")
+        
+        return {
+            'trades': [asdict(t) for t in self.trades],
+            'equity_curve': self.equity_curve,
+            'config': asdict(self.config)
+        }
+    
+    def find_signal_exits(self, signals: pd.DataFrame) -> List[Tuple]:
+        """
+        Entry and exit of every tradable signal, before any position sizing
+        
+        Exits only depend on each signal's own price path, so they can be
+        found once and replayed for any subset of the signals (see
+        replay_exits / walk-forward validation).
+        
+        Args:
+            signals: DataFrame with columns: Ticker, Date_Found, Price_Entry
+            
+        Returns:
+            (signal_pos, ticker, entry_date, entry_price, exit_date, exit_price,
+            exit_reason) per tradable signal, in the order of `signals`
+            (signal_pos is the row position in `signals`)
+        """
+        # Top up the bar store for every ticker in one bulk request
+        valid = signals.dropna(subset=['Price_Entry'])
+        if not valid.empty:
+            entry_dates = pd.to_datetime(valid['Date_Found'])
+            self.bar_store.update(
+                [self._yf_symbol(t) for t in valid['Ticker'].unique()],
+                (entry_dates.min() - timedelta(days=5)).strftime('%Y-%m-%d'),
+                (entry_dates.max() + timedelta(days=self.config.max_hold_days + 30)).strftime('%Y-%m-%d')
+            )
+        
+        # Load price windows for every signal up front
+        pending = []
+        for pos, (idx, signal) in enumerate(signals.iterrows()):
             if pd.isna(signal['Price_Entry']):
                 continue
             
@@ -271,28 +380,90 @@ class Backtester:
             if hist_data.empty:
                 continue
             
-            # Simulate the trade
-            trade = self.simulate_trade(ticker, entry_date, entry_price, hist_data)
+            future_data = hist_data[hist_data.index > entry_date]
+            if future_data.empty:
+                continue
             
-            if trade:
-                self.trades.append(trade)
-                
-                # Update equity curve
-                current_equity += trade.pnl_net
-                self.equity_curve.append({
-                    'date': trade.exit_date,
-                    'total_equity': current_equity,
-                    'trade_pnl': trade.pnl_net,
-                    'ticker': ticker
-                })
+            pending.append((pos, ticker, entry_date, entry_price, future_data))
+        
+        # Find every exit in one vectorized pass over a padded price matrix
+        n = len(pending)
+        width = max((len(p[4]) for p in pending), default=0)
+        low = np.full((n, width), np.nan)
+        high = np.full((n, width), np.nan)
+        close = np.full((n, width), np.nan)
+        days_held = np.zeros((n, width), dtype=np.int64)
+        lengths = np.zeros(n, dtype=np.int64)
+        stops = np.zeros(n)
+        targets = np.zeros(n)
+        
+        for i, (pos, ticker, entry_date, entry_price, future_data) in enumerate(pending):
+            m = len(future_data)
+            lengths[i] = m
+            low[i, :m] = future_data['Low'].to_numpy(dtype=float)
+            high[i, :m] = future_data['High'].to_numpy(dtype=float)
+            close[i, :m] = future_data['Close'].to_numpy(dtype=float)
+            days_held[i, :m] = np.asarray((future_data.index - entry_date).days)
+            stops[i], targets[i] = self._exit_levels(entry_price, 'LONG')
+        
+        exit_idx, exit_code = find_first_exits(
+            low, high, days_held, stops, targets,
+            self.config.max_hold_days, is_long=True, lengths=lengths
+        )
         
-        print(f"✅ Backtest complete: {len(self.trades)} trades executed")
+        exits = []
+        for i, (pos, ticker, entry_date, entry_price, future_data) in enumerate(pending):
+            j = int(exit_idx[i])
+            exit_reason = EXIT_REASONS[exit_code[i]]
+            if exit_reason == 'STOP_LOSS':
+                exit_price = float(stops[i])
+            elif exit_reason == 'TARGET':
+                exit_price = float(targets[i])
+            else:
+                exit_price = close[i, j]
+            exits.append((pos, ticker, entry_date, entry_price,
+                          future_data.index[j], exit_price, exit_reason))
+        return exits
+    
+    def replay_exits(self, exits: List[Tuple], start_date) -> List[Trade]:
+        """
+        Size and price pre-computed exits on a fresh equity curve
         
-        return {
-            'trades': [asdict(t) for t in self.trades],
-            'equity_curve': self.equity_curve,
-            'config': asdict(self.config)
-        }
+        Args:
+            exits: Rows from find_signal_exits, in date order
+            start_date: Date of the first equity point
+            
+        Returns:
+            The executed trades (also stored on self.trades)
+        """
+        self.trades = []
+        self.equity_curve = []
+        
+        # Initialize equity tracking
+        current_equity = self.config.starting_capital
+        self.equity_curve.append({
+            'date': start_date,
+            'total_equity': current_equity,
+            'cash': current_equity,
+            'positions_value': 0
+        })
+        
+        # Price trades in date order so sizing follows the equity curve
+        for pos, ticker, entry_date, entry_price, exit_date, exit_price, exit_reason in exits:
+            trade = self._build_trade(ticker, entry_date, entry_price,
+                                      exit_date, exit_price, exit_reason)
+            self.trades.append(trade)
+            
+            # Update equity curve
+            current_equity += trade.pnl_net
+            self.equity_curve.append({
+                'date': trade.exit_date,
+                'total_equity': current_equity,
+                'trade_pnl': trade.pnl_net,
+                'ticker': ticker
+            })
+        
+        return self.trades
     
     def calculate_metrics(self) -> Dict:
         """
@@ -304,18 +475,19 @@ class Backtester:
         if not self.trades:
             return {'error': 'No trades to analyze'}
         
-        trades_df = pd.DataFrame([asdict(t) for t in self.trades])
+        pnl_net = np.array([t.pnl_net for t in self.trades])
+        returns = np.array([t.return_pct for t in self.trades])
         
         # Basic metrics
         total_trades = len(self.trades)
-        winning_trades = len([t for t in self.trades if t.pnl_net > 0])
-        losing_trades = len([t for t in self.trades if t.pnl_net <= 0])
+        winning_trades = int((pnl_net > 0).sum())
+        losing_trades = int((pnl_net <= 0).sum())
         win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
         
         # P&L metrics
         total_pnl = sum([t.pnl_net for t in self.trades])
-        avg_win = trades_df[trades_df['pnl_net'] > 0]['pnl_net'].mean() if winning_trades > 0 else 0
-        avg_loss = trades_df[trades_df['pnl_net'] <= 0]['pnl_net'].mean() if losing_trades > 0 else 0
+        avg_win = pnl_net[pnl_net > 0].mean() if winning_trades > 0 else 0
+        avg_loss = pnl_net[pnl_net <= 0].mean() if losing_trades > 0 else 0
         
         # Risk metrics
         profit_factor = abs(avg_win * winning_trades / (avg_loss * losing_trades)) if losing_trades > 0 and avg_loss != 0 else float('inf')
@@ -326,29 +498,25 @@ class Backtester:
         total_return_pct = ((final_equity - initial_capital) / initial_capital) * 100
         
         # Drawdown calculation
-        equity_series = pd.DataFrame(self.equity_curve)['total_equity']
-        rolling_max = equity_series.expanding().max()
+        equity_series = np.array([point['total_equity'] for point in self.equity_curve])
+        rolling_max = np.maximum.accumulate(equity_series)
         drawdowns = (equity_series - rolling_max) / rolling_max * 100
         max_drawdown = drawdowns.min()
         
         # Sharpe Ratio (annualized)
-        returns = trades_df['return_pct'].values
-        if len(returns) > 1:
-            sharpe = (returns.mean() / returns.std()) * np.sqrt(252) if returns.std() > 0 else 0
-        else:
-            sharpe = 0
+        sharpe = annualized_sharpe(returns)
         
         # CAGR calculation
-        total_days = (pd.to_datetime(self.equity_curve[-1]['date']) - 
-                      pd.to_datetime(self.equity_curve[0]['date'])).days
+        total_days = (pd.Timestamp(self.equity_curve[-1]['date']) - 
+                      pd.Timestamp(self.equity_curve[0]['date'])).days
         years = total_days / 365.25
         cagr = (((final_equity / initial_capital) ** (1 / years)) - 1) * 100 if years > 0 else 0
         
         # Average holding period
-        avg_hold_days = trades_df['hold_days'].mean()
+        avg_hold_days = np.mean([t.hold_days for t in self.trades])
         
-        # Exit reason breakdown
-        exit_reasons = trades_df['exit_reason'].value_counts().to_dict()
+        # Exit reason breakdown (most common first)
+        exit_reasons = dict(Counter(t.exit_reason for t in self.trades).most_common())
         
         metrics = {
             'total_trades': total_trades,
@@ -367,8 +535,8 @@ class Backtester:
             'initial_capital': initial_capital,
             'final_equity': round(final_equity, 2),
             'exit_reasons': exit_reasons,
-            'total_fees_paid': round(trades_df['fees'].sum(), 2),
-            'total_slippage': round(trades_df['slippage'].sum(), 2)
+            'total_fees_paid': round(np.sum([t.fees for t in self.trades]), 2),
+            'total_slippage': round(np.sum([t.slippage for t in self.trades]), 2)
         }
         
         return metrics
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Local OHLCV Bar Store for roostr Trading
+Daily bars cached on disk and shared by every yfinance caller
+
+Each symbol is stored as one NumPy structured array (.npy) that is opened
+memory-mapped on read, plus a small sidecar JSON recording which date range
+has already been fetched. Reads inside that range never touch the network;
+anything outside it is topped up with a single yf.download per gap (batched
+across symbols that share the same gap).
+
+Yahoo back-adjusts history for splits (and dividends, with auto_adjust).
+Each top-up re-fetches the last ADJUSTMENT_CHECK_DAYS already stored; if
+those closes no longer match, history was re-adjusted and the symbol's whole
+covered range is re-downloaded and rewritten, so stored bars never mix
+pre- and post-adjustment prices.
+
+Today's bar is still forming, so a read whose range includes today re-fetches
+it once the last fetch is older than SESSION_TTL. Reads of ranges that end
+before today (backtests) never touch the network once covered.
+
+Usage:
+    store = get_bar_store()
+    store.update(['AAPL', 'MSFT'], '2024-01-01', '2025-01-01')  # bulk top-up
+    df = store.get_bars('AAPL', '2024-06-01', '2024-12-31')
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta, date
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+BAR_FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+BAR_DTYPE = np.dtype([('Date', 'datetime64[D]')] + [(f, 'f8') for f in BAR_FIELDS])
+
+# Stored days re-fetched by each top-up to detect split/dividend re-adjustment
+ADJUSTMENT_CHECK_DAYS = 7
+# Relative close difference that means history was re-adjusted
+ADJUSTMENT_TOLERANCE = 1e-4
+# Seconds before the current session's (in-progress) bar is re-fetched
+SESSION_TTL = 15 * 60
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.bar_store')
+
+
+def _to_day(value: DateLike) -> np.datetime64:
+    """Normalize any date-like value to a numpy day"""
+    return np.datetime64(pd.Timestamp(value).date(), 'D')
+
+
+class BarStore:
+    """On-disk daily bar cache with incremental "fetch only missing days" top-ups"""
+
+    def __init__(self, root: str = DEFAULT_ROOT):
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Paths / metadata
+    # ------------------------------------------------------------------
+
+    def _base_path(self, symbol: str) -> str:
+        safe = symbol.upper().replace('/', '_')
+        return os.path.join(self.root, safe)
+
+    def _load_meta(self, symbol: str) -> Optional[Dict]:
+        path = self._base_path(symbol) + '.json'
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, ValueError):
+            return None
+
+    def _session_stale(self, symbol: str) -> bool:
+        """Whether today's stored bar was fetched more than SESSION_TTL ago"""
+        meta = self._load_meta(symbol) or {}
+        return time.time() - meta.get('session_fetched_at', 0) > SESSION_TTL
+
+    def coverage(self, symbol: str) -> Optional[Tuple[np.datetime64, np.datetime64]]:
+        """Fetched range [start, end) for a symbol, or None if never fetched"""
+        meta = self._load_meta(symbol)
+        if not meta:
+            return None
+        return np.datetime64(meta['start'], 'D'), np.datetime64(meta['end'], 'D')
+
+    def _atomic_write(self, path: str, write_fn):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            write_fn(f)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    # Read API
+    # ------------------------------------------------------------------
+
+    def read_array(self, symbol: str) -> np.ndarray:
+        """Memory-mapped structured array of every stored bar (sorted by date)"""
+        path = self._base_path(symbol) + '.npy'
+        if not os.path.exists(path):
+            return np.empty(0, dtype=BAR_DTYPE)
+        return np.load(path, mmap_mode='r')
+
+    def read(self, symbol: str,
+             start: Optional[DateLike] = None,
+             end: Optional[DateLike] = None) -> pd.DataFrame:
+        """Stored bars in [start, end) as an OHLCV DataFrame (no network I/O)"""
+        bars = self.read_array(symbol)
+        lo, hi = 0, len(bars)
+        if start is not None:
+            lo = int(np.searchsorted(bars['Date'], _to_day(start), side='left'))
+        if end is not None:
+            hi = int(np.searchsorted(bars['Date'], _to_day(end), side='left'))
+        bars = bars[lo:hi]
+
+        df = pd.DataFrame({f: np.asarray(bars[f]) for f in BAR_FIELDS},
+                          index=pd.DatetimeIndex(np.asarray(bars['Date']).astype('datetime64[ns]'),
+                                                 name='Date'))
+        return df
+
+    def get_bars(self, symbol: str,
+                 start: DateLike,
+                 end: Optional[DateLike] = None,
+                 fetch: bool = True) -> pd.DataFrame:
+        """
+        Bars for [start, end), topping up missing days from yfinance first
+
+        Args:
+            symbol: yfinance symbol (e.g. 'AAPL', 'BTC-USD')
+            start: First date (inclusive)
+            end: Last date (exclusive), defaults to tomorrow; today's bar
+                is re-fetched once older than SESSION_TTL
+            fetch: If False, only return what is already on disk
+        """
+        if fetch:
+            self.update([symbol], start, end)
+        return self.read(symbol, start, end)
+
+    def get_many(self, symbols: List[str],
+                 start: DateLike,
+                 end: Optional[DateLike] = None,
+                 fetch: bool = True) -> Dict[str, pd.DataFrame]:
+        """Bars for many symbols, with a single bulk top-up beforehand"""
+        if fetch:
+            self.update(symbols, start, end)
+        return {s: self.read(s, start, end) for s in symbols}
+
+    # ------------------------------------------------------------------
+    # Write / top-up
+    # ------------------------------------------------------------------
+
+    def _clamp_range(self, start: DateLike, end: Optional[DateLike]) -> Tuple[np.datetime64, np.datetime64]:
+        # Never record coverage past tomorrow (today's bar is refreshed on its
+        # SESSION_TTL by missing_ranges)
+        tomorrow = _to_day(datetime.now() + timedelta(days=1))
+        start_day = _to_day(start)
+        end_day = tomorrow if end is None else min(_to_day(end), tomorrow)
+        return start_day, end_day
+
+    def missing_ranges(self, symbol: str,
+                       start: DateLike,
+                       end: Optional[DateLike] = None) -> List[Tuple[np.datetime64, np.datetime64]]:
+        """Date ranges [start, end) that still need fetching for a symbol"""
+        start_day, end_day = self._clamp_range(start, end)
+        if start_day >= end_day:
+            return []
+
+        cov = self.coverage(symbol)
+        if cov is None:
+            return [(start_day, end_day)]
+
+        cov_start, cov_end = cov
+        today = _to_day(datetime.now())
+        gaps = []
+        if start_day < cov_start:
+            gaps.append((start_day, cov_start))
+        if end_day > cov_end or (end_day > today and self._session_stale(symbol)):
+            # Re-fetch the last covered days: refreshes the current session
+            # and lets update() spot re-adjusted history
+            overlap_start = max(cov_start, cov_end - np.timedelta64(ADJUSTMENT_CHECK_DAYS, 'D'))
+            gaps.append((overlap_start, end_day))
+        return gaps
+
+    def update(self, symbols: List[str],
+               start: DateLike,
+               end: Optional[DateLike] = None) -> int:
+        """
+        Fetch only the missing days for each symbol
+
+        Symbols sharing the same gap are downloaded together in one request.
+
+        Returns:
+            Number of yfinance requests made
+        """
+        by_gap: Dict[Tuple[np.datetime64, np.datetime64], List[str]] = {}
+        for symbol in dict.fromkeys(s.upper() for s in symbols):
+            for gap in self.missing_ranges(symbol, start, end):
+                by_gap.setdefault(gap, []).append(symbol)
+
+        if not by_gap:
+            return 0
+
+        if not YFINANCE_AVAILABLE:
+            print("⚠️  yfinance not installed - bar store is read-only")
+            return 0
+
+        requests_made = 0
+        # Symbols whose history was re-adjusted → range to re-download whole
+        rewrite: Dict[Tuple[np.datetime64, np.datetime64], List[str]] = {}
+        for (gap_start, gap_end), group in by_gap.items():
+            frames = self._download(group, gap_start, gap_end)
+            requests_made += 1
+            if frames is None:
+                continue
+            for symbol in group:
+                df = frames.get(symbol)
+                if df is None or df.dropna(how='all').empty:
+                    # The request succeeded, so nothing traded in the gap
+                    # (weekends, holidays, delisted): record it as covered
+                    if self._fetch_failed(symbol):
+                        continue
+                    df = pd.DataFrame(columns=BAR_FIELDS)
+                elif self._readjusted(symbol, df):
+                    cov_start, _ = self.coverage(symbol)
+                    rewrite.setdefault((min(cov_start, gap_start), gap_end), []).append(symbol)
+                    continue
+                self.write(symbol, df, gap_start, gap_end)
+
+        for (range_start, range_end), group in rewrite.items():
+            print(f"🔁 Re-adjusted history (split/dividend): re-fetching {', '.join(group)}")
+            frames = self._download(group, range_start, range_end)
+            requests_made += 1
+            if frames is None:
+                continue
+            for symbol in group:
+                df = frames.get(symbol)
+                if df is not None and not df.dropna(how='all').empty:
+                    self.write(symbol, df, range_start, range_end, replace=True)
+
+        return requests_made
+
+    def _readjusted(self, symbol: str, df: pd.DataFrame) -> bool:
+        """
+        True if re-fetched bars disagree with stored closes
+
+        Only days before the last stored one are compared: the last stored
+        bar may have been a partial session.
+        """
+        stored = self.read_array(symbol)
+        if len(stored) < 2 or 'Close' not in df.columns:
+            return False
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        fetched = pd.Series(df['Close'].to_numpy(dtype=float),
+                            index=index.values.astype('datetime64[D]'))
+        final = stored[:-1]
+        common, stored_at, fetched_at = np.intersect1d(final['Date'], fetched.index.values,
+                                                       return_indices=True)
+        if not len(common):
+            return False
+        old = np.asarray(final['Close'])[stored_at]
+        new = fetched.to_numpy()[fetched_at]
+        valid = ~(np.isnan(old) | np.isnan(new)) & (old != 0)
+        return bool(np.any(np.abs(new[valid] / old[valid] - 1) > ADJUSTMENT_TOLERANCE))
+
+    @staticmethod
+    def _fetch_failed(symbol: str) -> bool:
+        """Whether yfinance recorded an error for symbol on the last download"""
+        errors = getattr(getattr(yf, 'shared', None), '_ERRORS', None) or {}
+        return symbol in errors
+
+    def _download(self, symbols: List[str],
+                  start: np.datetime64,
+                  end: np.datetime64) -> Optional[Dict[str, pd.DataFrame]]:
+        """One bulk yf.download, split per symbol (None if the request failed)"""
+        try:
+            data = yf.download(symbols, start=str(start), end=str(end),
+                               progress=False, group_by='ticker')
+        except Exception as e:
+            print(f"❌ Error downloading bars for {', '.join(symbols)}: {e}")
+            return None
+
+        if data is None or data.empty:
+            return {}
+
+        frames = {}
+        if isinstance(data.columns, pd.MultiIndex):
+            for symbol in symbols:
+                if symbol in data.columns.get_level_values(0):
+                    frames[symbol] = data[symbol]
+                elif symbol in data.columns.get_level_values(-1):
+                    frames[symbol] = data.xs(symbol, axis=1, level=-1)
+        elif len(symbols) == 1:
+            frames[symbols[0]] = data
+        return frames
+
+    def write(self, symbol: str,
+              df: pd.DataFrame,
+              start: Optional[DateLike] = None,
+              end: Optional[DateLike] = None,
+              replace: bool = False):
+        """
+        Merge bars into the store (new rows win on duplicate dates)
+
+        If start/end are given, the fetched range is also recorded as covered.
+        With replace=True, stored bars are discarded first (re-adjusted history).
+        """
+        symbol = symbol.upper()
+        base = self._base_path(symbol)
+        df = df[[f for f in BAR_FIELDS if f in df.columns]].dropna(how='all')
+
+        if not df.empty:
+            merged = self._merge(symbol, df, replace)
+            self._atomic_write(base + '.npy', lambda f: np.save(f, merged))
+
+        if start is not None and end is not None:
+            start_day, end_day = _to_day(start), _to_day(end)
+            previous = self._load_meta(symbol) or {}
+            cov = self.coverage(symbol)
+            if cov is not None:
+                start_day, end_day = min(start_day, cov[0]), max(end_day, cov[1])
+            meta = {
+                'symbol': symbol,
+                'start': str(start_day),
+                'end': str(end_day),
+                'updated': datetime.now().isoformat(),
+                'session_fetched_at': previous.get('session_fetched_at', 0)
+            }
+            if _to_day(end) > _to_day(datetime.now()):
+                # This fetch included today's (in-progress) session
+                meta['session_fetched_at'] = time.time()
+            self._atomic_write(base + '.json',
+                               lambda f: f.write(json.dumps(meta).encode('utf-8')))
+
+    def _merge(self, symbol: str, df: pd.DataFrame, replace: bool = False) -> np.ndarray:
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+
+        new = np.zeros(len(df), dtype=BAR_DTYPE)
+        new['Date'] = index.values.astype('datetime64[D]')
+        for f in BAR_FIELDS:
+            new[f] = df[f].to_numpy(dtype=float) if f in df.columns else np.nan
+
+        existing = np.empty(0, dtype=BAR_DTYPE) if replace else np.array(self.read_array(symbol))
+        if len(existing):
+            keep = ~np.isin(existing['Date'], new['Date'])
+            merged = np.concatenate([existing[keep], new])
+        else:
+            merged = new
+        return merged[np.argsort(merged['Date'], kind='stable')]
+
+
+_default_store: Optional[BarStore] = None
+
+
+def get_bar_store() -> BarStore:
+    """Process-wide BarStore rooted at trading/.bar_store"""
+    global _default_store
+    if _default_store is None:
+        _default_store = BarStore()
+    return _default_store
+
+
+# CLI Interface
+def main():
+    """Command-line interface: warm the store for a list of symbols"""
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python bar_store.py <TICKER> [TICKER2 ...] [--days N]")
+        print("Example: python bar_store.py AAPL MSFT BTC-USD --days 730")
+        sys.exit(1)
+
+    args = sys.argv[1:]
+    days = 365
+    if '--days' in args:
+        i = args.index('--days')
+        days = int(args[i + 1])
+        args = args[:i] + args[i + 2:]
+
+    store = get_bar_store()
+    start = datetime.now() - timedelta(days=days)
+    requests_made = store.update(args, start)
+    print(f"✅ Bar store updated ({requests_made} request(s))\n")
+
+    for symbol in args:
+        bars = store.read_array(symbol)
+        if len(bars):
+            print(f"{symbol.upper():10} {len(bars):6d} bars  {bars['Date'][0]} → {bars['Date'][-1]}")
+        else:
+            print(f"{symbol.upper():10} no data")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+CoinGecko Client for roostr Trading
+Shared, rate-aware access to the CoinGecko free API
+
+- One kept-alive HTTPS connection instead of a new socket per request
+- Token-bucket rate limiting; 429s wait (Retry-After / backoff) and retry
+- Ticker → CoinGecko ID lookups persisted to disk, so /search runs once per
+  ticker ever, not once per process
+- price() calls that land within a short window are coalesced into a single
+  /simple/price?ids=... request
+
+Usage:
+    client = get_coingecko_client()
+    data = client.simple_price(['bitcoin', 'solana'])
+    sol = client.price('solana')            # coalesced with concurrent callers
+    coin_id = client.lookup_id('TAO')
+"""
+
+import http.client
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+API_HOST = 'api.coingecko.com'
+API_PREFIX = '/api/v3'
+USER_AGENT = 'roostr-trading-bot/1.0'
+
+RATE_PER_MINUTE = 10     # Free tier budget (documented 10-30/min, be conservative)
+BURST = 3                # Requests allowed back-to-back before throttling
+MAX_RETRIES = 4          # 429 / connection retries before giving up
+COALESCE_WINDOW = 0.05   # Seconds price() waits to batch concurrent callers
+NOT_FOUND_TTL = 24 * 3600  # Seconds before re-searching a ticker with no match
+
+ID_MAP_FILE = '.coingecko_ids.json'
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a request may go out"""
+
+    def __init__(self, rate_per_minute: float = RATE_PER_MINUTE, capacity: int = BURST):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self.paused_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold every caller for `seconds` (e.g. after a 429) and drop the burst"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+SHARED_LIMITER = TokenBucket()
+
+
+class CoinGeckoClient:
+    """Kept-alive, rate-limited, coalescing CoinGecko API client"""
+
+    def __init__(self, cache_dir: str = '.',
+                 limiter: Optional[TokenBucket] = None,
+                 coalesce_window: float = COALESCE_WINDOW,
+                 timeout: int = 10):
+        self.timeout = timeout
+        self.coalesce_window = coalesce_window
+        # CoinGecko limits per IP, so every client shares one bucket by default
+        self.limiter = limiter or SHARED_LIMITER
+        self.requests_made = 0
+
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        self._conn_lock = threading.Lock()
+
+        self.id_map_path = os.path.join(cache_dir, ID_MAP_FILE)
+        self._ids_lock = threading.Lock()
+        self._ids = self._load_ids()
+
+        self._batch_lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._flush_scheduled = False
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        if self._conn is None:
+            self._conn = http.client.HTTPSConnection(API_HOST, timeout=self.timeout)
+        return self._conn
+
+    def _reset_connection(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_json(self, path: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        GET an API path (or full CoinGecko URL) and decode the JSON body
+
+        Waits for the rate limiter before every attempt; 429s pause the
+        limiter (Retry-After, else exponential backoff) and retry.
+
+        Returns:
+            Decoded JSON, or None if the request ultimately failed
+        """
+        if path.startswith('http'):
+            parts = urlsplit(path)
+            target = parts.path + (f"?{parts.query}" if parts.query else '')
+        else:
+            target = API_PREFIX + path + (f"?{urlencode(params, safe=',')}" if params else '')
+
+        backoff = 2.0
+        for attempt in range(MAX_RETRIES + 1):
+            self.limiter.acquire()
+            try:
+                with self._conn_lock:
+                    conn = self._connection()
+                    conn.request('GET', target, headers={'User-Agent': USER_AGENT,
+                                                         'Accept': 'application/json'})
+                    response = conn.getresponse()
+                    body = response.read()
+                    self.requests_made += 1
+            except (http.client.HTTPException, OSError) as e:
+                # Stale keep-alive socket or network blip: reconnect and retry
+                with self._conn_lock:
+                    self._reset_connection()
+                if attempt == MAX_RETRIES:
+                    print(f"❌ Network error: {e}")
+                    return None
+                continue
+
+            if response.status == 429:
+                retry_after = response.getheader('Retry-After')
+                wait = float(retry_after) if retry_after and retry_after.isdigit() else backoff
+                backoff = min(backoff * 2, 60.0)
+                if attempt == MAX_RETRIES:
+                    print(f"⚠️  Rate limited by CoinGecko (429), giving up after {attempt + 1} attempts")
+                    return None
+                print(f"⚠️  Rate limited by CoinGecko (429), waiting {wait:.0f}s...")
+                self.limiter.pause(wait)
+                continue
+
+            if response.status != 200:
+                print(f"❌ HTTP Error {response.status}: {response.reason}")
+                return None
+
+            try:
+                return json.loads(body.decode('utf-8'))
+            except ValueError as e:
+                print(f"❌ Unexpected error: {e}")
+                return None
+
+        return None
+
+    # ------------------------------------------------------------------
+    # Prices
+    # ------------------------------------------------------------------
+
+    def simple_price(self, coin_ids: List[str]) -> Optional[Dict[str, Dict]]:
+        """One /simple/price request for many coins (USD, market cap, 24h change)"""
+        ids = list(dict.fromkeys(coin_ids))
+        if not ids:
+            return {}
+        return self.get_json('/simple/price', {
+            'ids': ','.join(ids),
+            'vs_currencies': 'usd',
+            'include_market_cap': 'true',
+            'include_24hr_change': 'true',
+            'include_last_updated_at': 'true'
+        })
+
+    def price(self, coin_id: str) -> Optional[Dict]:
+        """
+        Price data for one coin, coalesced with concurrent callers
+
+        The first caller in a window waits coalesce_window seconds, then
+        fetches every coin requested meanwhile in one /simple/price call.
+        """
+        with self._batch_lock:
+            future = self._pending.get(coin_id)
+            if future is None:
+                future = Future()
+                self._pending[coin_id] = future
+            leader = not self._flush_scheduled
+            self._flush_scheduled = True
+
+        if leader:
+            time.sleep(self.coalesce_window)
+            with self._batch_lock:
+                batch, self._pending = self._pending, {}
+                self._flush_scheduled = False
+            try:
+                data = self.simple_price(list(batch)) or {}
+            except Exception:
+                data = {}
+            for batch_id, batch_future in batch.items():
+                batch_future.set_result(data.get(batch_id))
+
+        return future.result()
+
+    # ------------------------------------------------------------------
+    # Ticker → ID map
+    # ------------------------------------------------------------------
+
+    def _load_ids(self) -> Dict:
+        if not os.path.exists(self.id_map_path):
+            return {'ids': {}, 'not_found': {}}
+        try:
+            with open(self.id_map_path, 'r') as f:
+                data = json.load(f)
+            return {'ids': data.get('ids', {}), 'not_found': data.get('not_found', {})}
+        except (json.JSONDecodeError, ValueError):
+            return {'ids': {}, 'not_found': {}}
+
+    def _save_ids(self):
+        # Only called under self._ids_lock
+        tmp_path = f"{self.id_map_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._ids, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.id_map_path)
+        except OSError as e:
+            print(f"Warning: Could not save CoinGecko ID map: {e}")
+
+    def known_id(self, ticker: str) -> Optional[str]:
+        """Previously learned ID for a ticker (no network)"""
+        with self._ids_lock:
+            return self._ids['ids'].get(ticker.upper())
+
+    def lookup_id(self, ticker: str) -> Optional[str]:
+        """
+        CoinGecko ID for a ticker, searching the API only on first sight
+
+        Matches (and recent misses) are persisted in .coingecko_ids.json.
+        """
+        ticker = ticker.upper()
+        with self._ids_lock:
+            if ticker in self._ids['ids']:
+                return self._ids['ids'][ticker]
+            missed_at = self._ids['not_found'].get(ticker)
+            if missed_at and time.time() - missed_at < NOT_FOUND_TTL:
+                return None
+
+        print(f"⚠️  Unknown ticker {ticker}, searching CoinGecko...")
+        data = self.get_json('/search', {'query': ticker})
+        if data is None:
+            return None  # Request failed: don't record a miss
+
+        coins = data.get('coins') or []
+        with self._ids_lock:
+            if coins:
+                coin = coins[0]
+                self._ids['ids'][ticker] = coin['id']
+                self._ids['not_found'].pop(ticker, None)
+                print(f"✓ Found {ticker} → {coin['id']} (name: {coin['name']})")
+            else:
+                self._ids['not_found'][ticker] = time.time()
+                print(f"❌ Could not find {ticker} on CoinGecko")
+            self._save_ids()
+            return self._ids['ids'].get(ticker)
+
+
+_clients: Dict[str, CoinGeckoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_coingecko_client(cache_dir: str = '.') -> CoinGeckoClient:
+    """Process-wide client per cache directory (shares connection + limiter)"""
+    key = os.path.abspath(cache_dir)
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = CoinGeckoClient(cache_dir)
+        return _clients[key]
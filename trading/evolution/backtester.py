@@ -1,13 +1,31 @@
 """
 Backtester - Simulate strategies on historical data
 """
-import yfinance as yf
+import sys
+import io
+import json
+import urllib.request
+from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple
 from strategy_dna import StrategyDNA
 
+sys.path.append(str(Path(__file__).parent.parent))
+from bar_store import get_bar_store
+
+# Indicator columns packed into the (ticker × bar × feature) tensor
+FEATURES = ['Close', 'SMA_20', 'SMA_50', 'SMA_100', 'SMA_200',
+            'RSI_7', 'RSI_14', 'RSI_21', 'Volume_Ratio']
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURES)}
+
+WARMUP_BARS = 200  # Bars of history needed before the first entry
+MIN_BARS = 250     # Tickers with less history are skipped
+
+SP500_CACHE = Path(__file__).parent / "sp500_tickers.json"
+SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+
 class Backtester:
     """Backtest trading strategies on historical data"""
     
@@ -20,6 +38,14 @@ class Backtester:
         self.universe = universe
         self.lookback_days = lookback_days
         self.historical_data = {}
+        self.bar_store = get_bar_store()
+        self._prefetched = False
+        
+        # Indicator tensor (built once per universe, see build_tensor)
+        self.tensor = None
+        self.tensor_tickers: List[str] = []
+        self.tensor_lengths = None
+        self.tensor_dates: List[pd.DatetimeIndex] = []
         
     def load_data(self, ticker: str) -> pd.DataFrame:
         """Load historical data for a ticker"""
@@ -30,7 +56,12 @@ class Backtester:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=self.lookback_days + 100)  # Extra for indicators
             
-            df = yf.download(ticker, start=start_date, end=end_date, progress=False)
+            # Top up the whole universe in one bulk request the first time
+            if not self._prefetched:
+                self.bar_store.update(self.universe, start_date, end_date)
+                self._prefetched = True
+            
+            df = self.bar_store.get_bars(ticker, start_date, end_date)
             
             if df.empty:
                 return None
@@ -163,30 +194,143 @@ class Backtester:
             "reason": "time_exit"
         }
     
-    def backtest_strategy(self, strategy: StrategyDNA) -> Dict:
-        """Run full backtest on strategy across universe"""
-        all_trades = []
+    def build_tensor(self) -> np.ndarray:
+        """
+        Pack every ticker's indicators into one contiguous array
         
+        Shape is (ticker, bar, feature). Each ticker's bars are left-aligned
+        (bar 0 = its first loaded day) and padded with NaN, so bar positions
+        match the per-ticker DataFrames exactly.
+        """
+        if self.tensor is not None:
+            return self.tensor
+        
+        frames = []
         for ticker in self.universe:
             df = self.load_data(ticker)
-            if df is None or len(df) < 250:
+            if df is None or len(df) < MIN_BARS:
                 continue
-            
-            # Scan for entry signals
-            i = 200  # Start after enough history for indicators
-            while i < len(df) - 1:
-                if self.check_entry_signal(df, i, strategy):
-                    trade = self.simulate_trade(df, i, strategy)
-                    trade['ticker'] = ticker
-                    all_trades.append(trade)
-                    
-                    # Skip ahead to avoid overlapping trades
-                    i += strategy.genes["exit"]["max_hold_days"]
-                else:
-                    i += 1
+            frames.append((ticker, df))
+        
+        n_bars = max((len(df) for _, df in frames), default=0)
+        tensor = np.full((len(frames), n_bars, len(FEATURES)), np.nan)
+        for t, (ticker, df) in enumerate(frames):
+            tensor[t, :len(df)] = df[FEATURES].to_numpy(dtype=float)
+        
+        self.tensor = np.ascontiguousarray(tensor)
+        self.tensor_tickers = [ticker for ticker, _ in frames]
+        self.tensor_lengths = np.array([len(df) for _, df in frames], dtype=int)
+        self.tensor_dates = [df.index for _, df in frames]
+        return self.tensor
+    
+    def entry_mask(self, strategy: StrategyDNA) -> np.ndarray:
+        """Boolean (ticker, bar) mask of bars where check_entry_signal holds"""
+        tensor = self.build_tensor()
+        n_tickers, n_bars = tensor.shape[:2]
+        
+        entry = strategy.genes["entry"]
+        filters = strategy.genes["filters"]
+        rsi_col = f"RSI_{entry['rsi_period']}"
+        sma_col = f"SMA_{entry['price_above_sma']}"
+        if rsi_col not in FEATURE_INDEX or sma_col not in FEATURE_INDEX:
+            return np.zeros((n_tickers, n_bars), dtype=bool)
+        
+        close = tensor[:, :, FEATURE_INDEX['Close']]
+        rsi = tensor[:, :, FEATURE_INDEX[rsi_col]]
+        sma = tensor[:, :, FEATURE_INDEX[sma_col]]
+        volume_ratio = tensor[:, :, FEATURE_INDEX['Volume_Ratio']]
+        
+        bars = np.arange(n_bars)
+        scan_range = (bars >= WARMUP_BARS)[None, :] & (bars[None, :] < self.tensor_lengths[:, None] - 1)
+        
+        # Negated comparisons keep the row-wise NaN semantics
+        with np.errstate(invalid='ignore'):
+            return (scan_range
+                    & ~(close < filters['min_market_cap'])
+                    & (rsi < entry['rsi_oversold'])
+                    & ~(volume_ratio < entry['volume_spike'])
+                    & ~np.isnan(sma)
+                    & ~(close <= sma)
+                    & ~(close < entry['min_price']))
+    
+    def select_entries(self, mask: np.ndarray, hold_days: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Greedy non-overlapping entries: after a trade the scan skips hold_days bars"""
+        ticker_idx, entry_idx = [], []
+        for t in range(mask.shape[0]):
+            next_free = 0
+            for i in np.flatnonzero(mask[t]):
+                if i >= next_free:
+                    ticker_idx.append(t)
+                    entry_idx.append(i)
+                    next_free = i + hold_days
+        return np.array(ticker_idx, dtype=int), np.array(entry_idx, dtype=int)
+    
+    def simulate_exits(self, ticker_idx: np.ndarray, entry_idx: np.ndarray,
+                       strategy: StrategyDNA) -> Dict[str, np.ndarray]:
+        """Vectorized simulate_trade for many entries at once"""
+        exit_rules = strategy.genes["exit"]
+        hold_days = max(int(exit_rules['max_hold_days']), 0)
+        close_plane = self.tensor[:, :, FEATURE_INDEX['Close']]
+        n_bars = close_plane.shape[1]
+        
+        entry_price = close_plane[ticker_idx, entry_idx]
+        profit_target = entry_price * (1 + exit_rules['profit_target'])
+        last_idx = np.minimum(entry_idx + hold_days, self.tensor_lengths[ticker_idx] - 1)
+        
+        # Closes for the bars after entry, NaN past each trade's last bar
+        window = entry_idx[:, None] + np.arange(1, hold_days + 1)[None, :]
+        in_trade = window <= last_idx[:, None]
+        closes = np.where(in_trade, close_plane[ticker_idx[:, None], np.minimum(window, n_bars - 1)], np.nan)
+        
+        if exit_rules['trailing_stop']:
+            highest = np.fmax(np.fmax.accumulate(closes, axis=1), entry_price[:, None])
+            stops = highest * (1 - exit_rules['stop_loss'])
+        else:
+            stops = np.broadcast_to((entry_price * (1 - exit_rules['stop_loss']))[:, None], closes.shape)
+        
+        with np.errstate(invalid='ignore'):
+            hit_target = closes >= profit_target[:, None]
+            hit_stop = closes <= stops
+        hit = hit_target | hit_stop
+        
+        # First bar hitting either level; the target wins ties (checked first)
+        rows = np.arange(len(entry_idx))
+        if hold_days:
+            first = hit.argmax(axis=1)
+            has_hit = hit[rows, first]
+            is_target = has_hit & hit_target[rows, first]
+            stop_price = stops[rows, first]
+        else:
+            first = np.zeros(len(entry_idx), dtype=int)
+            has_hit = is_target = np.zeros(len(entry_idx), dtype=bool)
+            stop_price = entry_price
+        is_stop = has_hit & ~is_target
+        
+        exit_idx = np.where(has_hit, entry_idx + 1 + first, last_idx)
+        exit_price = np.where(is_target, profit_target,
+                              np.where(is_stop, stop_price, close_plane[ticker_idx, last_idx]))
+        returns = np.where(is_target, exit_rules['profit_target'],
+                           (exit_price - entry_price) / entry_price)
+        reasons = np.where(is_target, 'profit_target', np.where(is_stop, 'stop_loss', 'time_exit'))
+        
+        return {
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "exit_idx": exit_idx,
+            "return": returns,
+            "reason": reasons
+        }
+    
+    def backtest_strategy(self, strategy: StrategyDNA) -> Dict:
+        """Run full backtest on strategy across universe"""
+        self.build_tensor()
+        
+        # Entry masks and exits as array ops over the indicator tensor
+        mask = self.entry_mask(strategy)
+        ticker_idx, entry_idx = self.select_entries(mask, strategy.genes["exit"]["max_hold_days"])
         
         # Calculate performance metrics
-        if not all_trades:
+        if len(entry_idx) == 0:
             return {
                 "total_trades": 0,
                 "roi": 0,
@@ -195,7 +339,22 @@ class Backtester:
                 "sharpe": 0
             }
         
-        returns = [t['return'] for t in all_trades]
+        exits = self.simulate_exits(ticker_idx, entry_idx, strategy)
+        
+        all_trades = []
+        for k in range(min(10, len(entry_idx))):
+            dates = self.tensor_dates[ticker_idx[k]]
+            all_trades.append({
+                "entry_price": exits['entry_price'][k],
+                "exit_price": exits['exit_price'][k],
+                "entry_date": dates[entry_idx[k]],
+                "exit_date": dates[exits['exit_idx'][k]],
+                "return": exits['return'][k],
+                "reason": str(exits['reason'][k]),
+                "ticker": self.tensor_tickers[ticker_idx[k]]
+            })
+        
+        returns = exits['return'].tolist()
         winning_trades = [r for r in returns if r > 0]
         
         total_return = sum(returns)
@@ -212,13 +371,13 @@ class Backtester:
         sharpe = (avg_return / np.std(returns)) * np.sqrt(252) if np.std(returns) > 0 else 0
         
         results = {
-            "total_trades": len(all_trades),
+            "total_trades": len(returns),
             "roi": total_return,
             "win_rate": win_rate,
             "max_drawdown": max_drawdown,
             "sharpe": sharpe,
             "avg_return_per_trade": avg_return,
-            "trades": all_trades[:10]  # Save first 10 trades as examples
+            "trades": all_trades  # First 10 trades as examples
         }
         
         # Update strategy fitness
@@ -231,6 +390,23 @@ class Backtester:
         
         return results
 
+def _load_sp500_constituents() -> List[str]:
+    """Full S&P 500 list (fetched once, then read from sp500_tickers.json)"""
+    if SP500_CACHE.exists():
+        with open(SP500_CACHE, 'r') as f:
+            return json.load(f)
+    
+    request = urllib.request.Request(SP500_URL, headers={'User-Agent': 'Mozilla/5.0'})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        html = response.read().decode('utf-8')
+    table = pd.read_html(io.StringIO(html))[0]
+    
+    # yfinance uses '-' for share classes (BRK.B → BRK-B)
+    tickers = [str(t).strip().replace('.', '-') for t in table['Symbol']]
+    with open(SP500_CACHE, 'w') as f:
+        json.dump(tickers, f)
+    return tickers
+
 def get_sp500_tickers(limit: int = 50) -> List[str]:
     """Get top N tickers from S&P 500 for testing"""
     # Start with most liquid stocks
@@ -242,4 +418,14 @@ def get_sp500_tickers(limit: int = 50) -> List[str]:
         'DIS', 'TXN', 'WFC', 'PM', 'ORCL', 'BMY', 'INTC', 'CMCSA', 'UNP',
         'AMD', 'LOW', 'QCOM', 'NEE', 'HON'
     ]
-    return top_tickers[:limit]
+    if limit <= len(top_tickers):
+        return top_tickers[:limit]
+    
+    # Beyond the built-in list, extend with the full constituent list
+    try:
+        constituents = _load_sp500_constituents()
+    except Exception as e:
+        print(f"⚠️  Could not load S&P 500 constituents ({e}), using top {len(top_tickers)}")
+        return top_tickers
+    
+    return list(dict.fromkeys(top_tickers + constituents))[:limit]
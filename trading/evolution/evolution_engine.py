@@ -3,10 +3,13 @@ Evolution Engine - Genetic algorithm for strategy optimization
 """
 import random
 import json
-from typing import List, Dict
+import os
+import atexit
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from strategy_dna import StrategyDNA
 from backtester import Backtester, get_sp500_tickers
+from parallel_eval import ParallelEvaluator
 
 class EvolutionEngine:
     """Evolves trading strategies using genetic algorithms"""
@@ -15,13 +18,17 @@ class EvolutionEngine:
                  population_size: int = 50,
                  elite_size: int = 10,
                  mutation_rate: float = 0.3,
-                 new_blood_rate: float = 0.2):
+                 new_blood_rate: float = 0.2,
+                 universe_size: int = 500,
+                 workers: Optional[int] = None):
         """
         Args:
             population_size: Total strategies per generation
             elite_size: Top N to keep + breed from
             mutation_rate: Probability of mutation (30% new traits)
             new_blood_rate: Fraction of population that's completely new each gen
+            universe_size: Number of S&P 500 stocks to backtest on
+            workers: Backtest processes (None = all cores, 1 = serial)
         """
         self.population_size = population_size
         self.elite_size = elite_size
@@ -33,8 +40,14 @@ class EvolutionEngine:
         self.best_ever: StrategyDNA = None
         
         # Backtester setup
-        self.universe = get_sp500_tickers(limit=30)  # Start with 30 stocks for speed
+        # Vectorized backtests make the full index cheap (indicator tensor is built once)
+        self.universe = get_sp500_tickers(limit=universe_size)
         self.backtester = Backtester(self.universe, lookback_days=365)
+        self.workers = workers
+        self.evaluator = None  # Process pool, started on first evaluation
+        
+        # gene hash → (fitness, backtest results); data is fixed per engine
+        self.fitness_cache: Dict[str, Tuple[float, Dict]] = {}
         
         # History tracking
         self.history = []
@@ -49,12 +62,58 @@ class EvolutionEngine:
         """Backtest all strategies in current population"""
         print(f"\n📊 Evaluating Generation {self.generation}...")
         
-        for i, strategy in enumerate(self.population):
-            print(f"   Testing strategy {i+1}/{len(self.population)}...", end='\r')
-            results = self.backtester.backtest_strategy(strategy)
-            strategy.backtest_results = results
-        
-        print(f"\n✅ Generation {self.generation} evaluated")
+        # Only backtest genes we haven't seen (elites carry over unchanged)
+        pending: Dict[str, List[StrategyDNA]] = {}
+        cached = 0
+        for strategy in self.population:
+            gene_hash = strategy.gene_hash()
+            if gene_hash in self.fitness_cache:
+                self._apply_result(strategy, self.fitness_cache[gene_hash])
+                cached += 1
+            else:
+                pending.setdefault(gene_hash, []).append(strategy)
+        
+        if pending:
+            evaluated = self._backtest_genes([group[0].genes for group in pending.values()])
+            for (gene_hash, group), result in zip(pending.items(), evaluated):
+                self.fitness_cache[gene_hash] = result
+                for strategy in group:
+                    self._apply_result(strategy, result)
+        
+        print(f"\n✅ Generation {self.generation} evaluated "
+              f"({len(pending)} backtested, {cached} cached)")
+    
+    def _apply_result(self, strategy: StrategyDNA, result: Tuple[float, Dict]):
+        fitness, results = result
+        strategy.fitness = fitness
+        strategy.backtest_results = dict(results)
+    
+    def _backtest_genes(self, gene_dicts: List[Dict]) -> List[Tuple[float, Dict]]:
+        """(fitness, results) per gene dict, on the process pool when enabled"""
+        workers = self.workers if self.workers is not None else os.cpu_count() or 1
+        
+        if workers <= 1 or len(gene_dicts) <= 1:
+            evaluated = []
+            for i, genes in enumerate(gene_dicts):
+                print(f"   Testing strategy {i+1}/{len(gene_dicts)}...", end='\r')
+                strategy = StrategyDNA(genes)
+                results = self.backtester.backtest_strategy(strategy)
+                evaluated.append((strategy.fitness, results))
+            return evaluated
+        
+        if self.evaluator is None:
+            # Data loads once in this process, then goes to shared memory
+            self.evaluator = ParallelEvaluator(self.backtester, workers=workers)
+            atexit.register(self.close)
+        
+        print(f"   Testing {len(gene_dicts)} strategies on {self.evaluator.workers} processes...")
+        return self.evaluator.evaluate(gene_dicts)
+    
+    def close(self):
+        """Stop the evaluation pool and free its shared memory"""
+        if self.evaluator is not None:
+            self.evaluator.close()
+            self.evaluator = None
     
     def select_elite(self) -> List[StrategyDNA]:
         """Select top performers"""
@@ -0,0 +1,108 @@
+"""
+Parallel Evaluation - Backtest a population on a process pool
+
+The Backtester's indicator tensor (and bar dates) are copied into shared
+memory once. Pool workers attach to that block at startup, so each task
+ships only a strategy's gene dict and returns (fitness, results).
+"""
+import os
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from strategy_dna import StrategyDNA
+from backtester import Backtester
+
+
+class SharedTensor:
+    """A Backtester's indicator tensor + bar dates held in shared memory"""
+
+    def __init__(self, backtester: Backtester):
+        tensor = backtester.build_tensor()
+        n_tickers, n_bars = tensor.shape[:2]
+
+        # Bar dates as int64 nanoseconds, NaT-padded like the tensor
+        dates = np.full((n_tickers, n_bars), np.datetime64('NaT'), dtype='datetime64[ns]')
+        for t, index in enumerate(backtester.tensor_dates):
+            dates[t, :len(index)] = index.values.astype('datetime64[ns]')
+
+        self._blocks = []
+        self.spec = {
+            "tickers": list(backtester.tensor_tickers),
+            "lengths": backtester.tensor_lengths.tolist(),
+            "tensor": self._share(tensor),
+            "dates": self._share(dates.view('int64'))
+        }
+
+    def _share(self, array: np.ndarray) -> Dict:
+        block = SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        self._blocks.append(block)
+        return {"name": block.name, "shape": array.shape, "dtype": array.dtype.str}
+
+    def close(self):
+        """Release and unlink the shared blocks (owner process only)"""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+
+def _attach(spec: Dict) -> Tuple[SharedMemory, np.ndarray]:
+    block = SharedMemory(name=spec["name"])
+    array = np.ndarray(tuple(spec["shape"]), dtype=np.dtype(spec["dtype"]), buffer=block.buf)
+    return block, array
+
+
+def attach_backtester(spec: Dict) -> Tuple[Backtester, List[SharedMemory]]:
+    """Backtester whose tensor is a zero-copy view of the shared block"""
+    tensor_block, tensor = _attach(spec["tensor"])
+    dates_block, dates = _attach(spec["dates"])
+
+    lengths = np.array(spec["lengths"], dtype=int)
+    dates = dates.view('datetime64[ns]')
+    backtester = Backtester(spec["tickers"])
+    backtester.tensor = tensor
+    backtester.tensor_tickers = list(spec["tickers"])
+    backtester.tensor_lengths = lengths
+    backtester.tensor_dates = [pd.DatetimeIndex(dates[t, :n]) for t, n in enumerate(lengths)]
+    return backtester, [tensor_block, dates_block]
+
+
+# Per-worker state (set by the pool initializer)
+_worker_backtester: Optional[Backtester] = None
+_worker_blocks: List[SharedMemory] = []
+
+
+def _init_worker(spec: Dict):
+    global _worker_backtester, _worker_blocks
+    _worker_backtester, _worker_blocks = attach_backtester(spec)
+
+
+def _evaluate_genes(genes: Dict) -> Tuple[float, Dict]:
+    strategy = StrategyDNA(genes)
+    results = _worker_backtester.backtest_strategy(strategy)
+    return strategy.fitness, results
+
+
+class ParallelEvaluator:
+    """Process pool that backtests gene dicts against a shared tensor"""
+
+    def __init__(self, backtester: Backtester, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.shared = SharedTensor(backtester)
+        self.pool = get_context().Pool(self.workers, initializer=_init_worker,
+                                       initargs=(self.shared.spec,))
+
+    def evaluate(self, gene_dicts: List[Dict]) -> List[Tuple[float, Dict]]:
+        """(fitness, backtest results) for each gene dict, in order"""
+        chunksize = max(1, len(gene_dicts) // (self.workers * 4))
+        return self.pool.map(_evaluate_genes, gene_dicts, chunksize=chunksize)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        self.shared.close()
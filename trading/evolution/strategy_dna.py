@@ -4,6 +4,7 @@ Each strategy has genes that define entry/exit logic
 """
 import random
 import json
+import hashlib
 from typing import Dict, Any, List
 
 class StrategyDNA:
@@ -129,6 +130,10 @@ class StrategyDNA:
             "fitness": self.fitness
         }
     
+    def gene_hash(self) -> str:
+        """Stable hash of the genes (strategies with identical genes share it)"""
+        return hashlib.sha1(json.dumps(self.genes, sort_keys=True).encode()).hexdigest()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Export strategy as dict"""
         return {
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher for roostr Trading
+Per-category keyword counts for a text in one lowercase + one scan per keyword
+
+Feature extraction and the deliberation rules score text by counting which
+keywords of a list appear in it (case-insensitive substring match). Done
+list by list, the same text is lowercased over and over and shared keywords
+('earnings', 'partnership', 'fda', ...) are searched once per list.
+
+A KeywordMatcher is built once per set of keyword categories:
+- every distinct keyword is searched once, however many categories use it
+- the text is lowercased once per call
+- hits are mapped back to categories through precomputed index tuples
+
+Counts match `sum(1 for kw in keywords if kw in text.lower())` exactly.
+(A pure-Python Aho-Corasick automaton and a trie-compiled regex were both
+slower than CPython's C substring search at these list sizes.)
+
+Usage:
+    matcher = KeywordMatcher({'positive': ['bullish', 'strong'], 'negative': ['dump', 'scam']})
+    matcher.counts("Strong chart, not a dump")    # {'positive': 1, 'negative': 1}
+    matcher.found("Strong chart, not a dump")     # {'strong', 'dump'}
+
+Benchmark:
+    python keyword_matcher.py     # messages/second vs. per-list scans
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """Case-insensitive substring keyword counts for many categories at once"""
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Args:
+            categories: category name → keywords (duplicates within a
+                category count once, as in a `set`)
+        """
+        self.categories: Dict[str, Tuple[str, ...]] = {
+            name: tuple(dict.fromkeys(kw.lower() for kw in keywords))
+            for name, keywords in categories.items()
+        }
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(
+            kw for keywords in self.categories.values() for kw in keywords
+        ))
+        names = list(self.categories)
+        # keyword → indexes (into names) of every category containing it
+        owners: Dict[str, List[int]] = {}
+        for i, name in enumerate(names):
+            for kw in self.categories[name]:
+                owners.setdefault(kw, []).append(i)
+        self._names = names
+        self._owners: Tuple[Tuple[str, Tuple[int, ...]], ...] = tuple(
+            (kw, tuple(owners[kw])) for kw in self.keywords
+        )
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """category → number of its keywords found in text"""
+        totals = [0] * len(self._names)
+        if text:
+            text = text.lower()
+            for kw, owners in self._owners:
+                if kw in text:
+                    for i in owners:
+                        totals[i] += 1
+        return dict(zip(self._names, totals))
+
+    __call__ = counts
+
+    def found(self, text: str) -> Set[str]:
+        """Every keyword (lowercased) present in text"""
+        if not text:
+            return set()
+        text = text.lower()
+        return {kw for kw in self.keywords if kw in text}
+
+    def counts_many(self, texts: Iterable[str]) -> List[Dict[str, int]]:
+        return [self.counts(text) for text in texts]
+
+
+def _benchmark(n_messages: int = 100_000):
+    import random
+    import time
+
+    random.seed(0)
+    categories = {
+        'quality': ['revenue', 'growth', 'earnings', 'profit', 'market share', 'moat',
+                    'competitive advantage', 'addressable market', 'tam', 'partnership',
+                    'patent', 'first mover', 'network effect'],
+        'hype': ['moon', 'lambo', 'to the moon', '100x', '1000x', 'life changing'],
+        'catalyst': ['approval', 'fda', 'fcc', 'earnings', 'launch', 'release',
+                     'partnership announced', 'acquisition', 'merger'],
+        'positive': ['bullish', 'great', 'strong', 'buying', 'accumulating',
+                     'undervalued', 'opportunity', 'conviction'],
+        'negative': ['bearish', 'weak', 'risky', 'overvalued', 'dump', 'scam'],
+    }
+    words = ('the team is strong and revenue growth looks great with a partnership announced '
+             'waiting on FDA approval could go to the moon not financial advice dyor gm frens '
+             'chart volume breakout bag dev community').split()
+    messages = [' '.join(random.choices(words, k=random.randint(10, 80))) for _ in range(1000)]
+    messages = (messages * (n_messages // len(messages) + 1))[:n_messages]
+
+    started = time.perf_counter()
+    for message in messages:
+        lower = message.lower()
+        {name: sum(1 for kw in keywords if kw in lower) for name, keywords in categories.items()}
+    naive = time.perf_counter() - started
+
+    matcher = KeywordMatcher(categories)
+    started = time.perf_counter()
+    matcher.counts_many(messages)
+    elapsed = time.perf_counter() - started
+
+    print(f"⚡ {n_messages:,} messages: per-list scans {naive:.2f}s, "
+          f"KeywordMatcher {elapsed:.2f}s ({n_messages / elapsed:,.0f} msg/s)")
+
+
+if __name__ == "__main__":
+    _benchmark()
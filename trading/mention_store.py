@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Mention Store for roostr Trading
+Append-only SQLite time series of ticker mention counts
+
+Replaces the Reddit scraper's JSON mention cache (.reddit_cache.json), which
+was loaded whole, truncated to 30 runs per ticker and rewritten on every
+run. Here each run appends one (source, ticker, ts, mentions) row, and
+history is never truncated.
+
+Alongside the rows, every (source, ticker) keeps precomputed rolling stats
+(count, sum, sum of squares) over the last window_days of observations.
+Appending a run updates them in place: new counts are added and rows that
+slid out of the window are subtracted with one indexed range scan. A
+baseline mean / stdev / z-score lookup is therefore a primary-key read,
+however many months of history are stored.
+
+As in the JSON cache, a run only records tickers it mentioned: the
+baseline is "mentions on runs where the ticker came up".
+
+Usage:
+    store = get_mention_store()
+    baselines = store.record({'NVDA': 12, 'ASTS': 4}, source='reddit')  # score + append
+    z = zscore(12, baselines['NVDA'])
+    store.history('NVDA')                                               # [(ts, mentions)]
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(BASE_DIR, 'mentions.db')
+LEGACY_REDDIT_CACHE = os.path.join(BASE_DIR, '.reddit_cache.json')
+
+WINDOW_DAYS = 90   # Rolling baseline span
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mentions (
+    source TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    ts REAL NOT NULL,
+    mentions INTEGER NOT NULL,
+    PRIMARY KEY (source, ticker, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS mention_stats (
+    source TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    total_sq INTEGER NOT NULL,
+    window_start REAL NOT NULL,
+    last_ts REAL,
+    last_mentions INTEGER,
+    PRIMARY KEY (source, ticker)
+) WITHOUT ROWID;
+"""
+
+
+def zscore(value: float, baseline: Optional[Dict]) -> Optional[float]:
+    """(value - mean) / stdev against a baseline, None without enough spread"""
+    if not baseline or baseline['n'] < 2 or not baseline['stdev']:
+        return None
+    return (value - baseline['mean']) / baseline['stdev']
+
+
+class MentionStore:
+    """Per-ticker mention time series with rolling mean / stdev"""
+
+    def __init__(self, db_path: str = DEFAULT_DB,
+                 window_days: float = WINDOW_DAYS,
+                 timeout: float = 30.0):
+        self.db_path = db_path
+        self.window = window_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=timeout, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Rolling stats
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _baseline(row: Optional[Tuple]) -> Dict:
+        if row is None:
+            return {'n': 0, 'mean': 0.0, 'stdev': 0.0, 'last_ts': None, 'last_mentions': None}
+        n, total, total_sq, last_ts, last_mentions = row
+        mean = total / n if n else 0.0
+        # Sample stdev from integer sums (exact until the final division)
+        variance = (total_sq - total * total / n) / (n - 1) if n > 1 else 0.0
+        return {'n': n, 'mean': mean, 'stdev': math.sqrt(max(variance, 0.0)),
+                'last_ts': last_ts, 'last_mentions': last_mentions}
+
+    def _expire(self, source: str, ticker: str, cutoff: float) -> Optional[Tuple]:
+        """Drop observations before cutoff from a ticker's stats; returns its stats row"""
+        row = self._conn.execute(
+            "SELECT n, total, total_sq, window_start, last_ts, last_mentions FROM mention_stats "
+            "WHERE source = ? AND ticker = ?", (source, ticker)).fetchone()
+        if row is None:
+            return None
+        n, total, total_sq, window_start, last_ts, last_mentions = row
+        if window_start < cutoff:
+            gone, gone_sum, gone_sq = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(mentions), 0), COALESCE(SUM(mentions * mentions), 0) "
+                "FROM mentions WHERE source = ? AND ticker = ? AND ts >= ? AND ts < ?",
+                (source, ticker, window_start, cutoff)).fetchone()
+            n, total, total_sq = n - gone, total - gone_sum, total_sq - gone_sq
+            self._conn.execute(
+                "UPDATE mention_stats SET n = ?, total = ?, total_sq = ?, window_start = ? "
+                "WHERE source = ? AND ticker = ?", (n, total, total_sq, cutoff, source, ticker))
+        return n, total, total_sq, last_ts, last_mentions
+
+    def _append(self, source: str, ticker: str, ts: float, mentions: int, cutoff: float) -> bool:
+        cursor = self._conn.execute(
+            "INSERT INTO mentions (source, ticker, ts, mentions) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (source, ticker, ts) DO NOTHING", (source, ticker, ts, mentions))
+        if not cursor.rowcount or ts < cutoff:
+            return bool(cursor.rowcount)
+        self._conn.execute(
+            "INSERT INTO mention_stats (source, ticker, n, total, total_sq, window_start, "
+            "last_ts, last_mentions) VALUES (?, ?, 1, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (source, ticker) DO UPDATE SET n = n + 1, "
+            "total = total + excluded.total, total_sq = total_sq + excluded.total_sq, "
+            "last_ts = MAX(COALESCE(last_ts, 0), excluded.last_ts), "
+            "last_mentions = CASE WHEN excluded.last_ts >= COALESCE(last_ts, 0) "
+            "THEN excluded.last_mentions ELSE last_mentions END",
+            (source, ticker, mentions, mentions * mentions, cutoff, ts, mentions))
+        return True
+
+    # ------------------------------------------------------------------
+    # Write API
+    # ------------------------------------------------------------------
+
+    def record(self, counts: Mapping[str, int],
+               timestamp: Optional[float] = None,
+               source: str = 'reddit') -> Dict[str, Dict]:
+        """
+        Append one run's mention counts, returning each ticker's prior baseline
+
+        Args:
+            counts: ticker → mentions this run
+            timestamp: Run time (unix seconds, default: now)
+            source: Mention source ('reddit', 'discord', ...)
+
+        Returns:
+            ticker → {'n', 'mean', 'stdev', 'last_ts', 'last_mentions'} over
+            the window before this run (n == 0 for a ticker with no history)
+        """
+        ts = time.time() if timestamp is None else timestamp
+        cutoff = ts - self.window
+        baselines = {}
+        with self._lock, self._conn:
+            for ticker, mentions in counts.items():
+                baselines[ticker] = self._baseline(self._expire(source, ticker, cutoff))
+                self._append(source, ticker, ts, int(mentions), cutoff)
+        return baselines
+
+    def append_many(self, rows: Iterable[Tuple[str, float, int]], source: str = 'reddit') -> int:
+        """Append (ticker, ts, mentions) rows in ts order (backfills); returns rows added"""
+        added = 0
+        with self._lock, self._conn:
+            for ticker, ts, mentions in rows:
+                cutoff = ts - self.window
+                self._expire(source, ticker, cutoff)
+                added += self._append(source, ticker, ts, int(mentions), cutoff)
+        return added
+
+    # ------------------------------------------------------------------
+    # Query API
+    # ------------------------------------------------------------------
+
+    def baselines(self, tickers: Iterable[str], source: str = 'reddit',
+                  now: Optional[float] = None) -> Dict[str, Dict]:
+        """Rolling baseline per ticker as of now (read-only counterpart of record())"""
+        cutoff = (time.time() if now is None else now) - self.window
+        with self._lock, self._conn:
+            return {t: self._baseline(self._expire(source, t, cutoff)) for t in tickers}
+
+    def history(self, ticker: str, source: str = 'reddit',
+                since: Optional[float] = None) -> List[Tuple[float, int]]:
+        """(ts, mentions) rows for a ticker, oldest first"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT ts, mentions FROM mentions WHERE source = ? AND ticker = ? AND ts >= ? "
+                "ORDER BY ts", (source, ticker, since or 0)).fetchall()
+
+    def count(self, source: Optional[str] = None) -> int:
+        sql, params = "SELECT COUNT(*) FROM mentions", ()
+        if source is not None:
+            sql, params = sql + " WHERE source = ?", (source,)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def import_reddit_cache(self, cache_path: str = LEGACY_REDDIT_CACHE,
+                            source: str = 'reddit') -> int:
+        """Backfill from a RedditScraper JSON cache ({ticker: {'history': [...]}})"""
+        try:
+            with open(cache_path, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return 0
+
+        rows = []
+        for ticker, data in cache.items():
+            for entry in data.get('history', []):
+                try:
+                    ts = datetime.fromisoformat(entry['timestamp']).timestamp()
+                    rows.append((ticker, ts, int(entry['mentions'])))
+                except (KeyError, TypeError, ValueError):
+                    continue
+        rows.sort(key=lambda r: r[1])
+        return self.append_many(rows, source=source)
+
+
+_default_store: Optional[MentionStore] = None
+_default_lock = threading.Lock()
+
+
+def get_mention_store() -> MentionStore:
+    """
+    Process-wide MentionStore at trading/mentions.db
+
+    The first time the store has no Reddit rows, .reddit_cache.json is
+    imported (one-shot migration).
+    """
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            store = MentionStore()
+            if store.count('reddit') == 0 and os.path.exists(LEGACY_REDDIT_CACHE):
+                imported = store.import_reddit_cache(LEGACY_REDDIT_CACHE)
+                print(f"📥 Imported {imported} mention counts from {os.path.basename(LEGACY_REDDIT_CACHE)}")
+            _default_store = store
+        return _default_store
+
+
+# CLI Interface
+def main():
+    """Show a ticker's mention history and current baseline"""
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python mention_store.py TICKER [SOURCE]")
+        sys.exit(1)
+
+    ticker = sys.argv[1].upper()
+    source = sys.argv[2] if len(sys.argv) > 2 else 'reddit'
+    store = get_mention_store()
+    for ts, mentions in store.history(ticker, source):
+        print(f"{datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')}  {mentions:>5}")
+    baseline = store.baselines([ticker], source)[ticker]
+    print(f"\n📊 {ticker} ({source}): {baseline['n']} runs in window, "
+          f"mean {baseline['mean']:.2f}, stdev {baseline['stdev']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Feature Store for the Conviction Model
+Incremental, on-disk cache of FeatureEngineer output
+
+Every raw signal is keyed by a hash of its contents plus the
+FeatureEngineer version. Features are stored partitioned by date_found:
+
+    data/feature_store/version=2/date_found=2025-09-15/features.parquet
+
+A training run hashes its signals, reads only the partitions they fall in,
+and runs batch_extract() just for the signals that are new or changed since
+the last run. Bumping FEATURE_VERSION starts a fresh version=N directory, so
+old features are never served for new definitions.
+
+Parquet needs pyarrow; without it partitions are written as pickles
+(features.pkl) in the same layout.
+
+Usage:
+    store = FeatureStore()
+    feature_df = store.get_features(raw_signals_df)   # same as batch_extract()
+    print(store.hits, store.misses)
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from feature_engineering import FeatureEngineer, _as_frame
+
+try:
+    import pyarrow  # noqa: F401  (pandas Parquet engine)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'feature_store')
+
+HASH_COLUMN = 'signal_hash'
+UNDATED = 'undated'
+
+
+# Odd 64-bit multiplier used to mix each column's value hash with its salt
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _json_default(value: Any):
+    if hasattr(value, 'item'):
+        return value.item()   # NumPy scalars
+    return str(value)
+
+
+def _canonical(value: Any) -> str:
+    """Type-stable text for one raw cell (5, 5.0 and True/1.0 hash alike across dtypes)"""
+    if hasattr(value, 'item') and not isinstance(value, (dict, list, str)):
+        value = value.item()
+    if isinstance(value, (bool, int, float)):
+        return f"#{float(value)!r}"
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, sort_keys=True, default=_json_default, ensure_ascii=False)
+
+
+def _column_hash(series: pd.Series, salt: np.uint64) -> np.ndarray:
+    """Per-row uint64 hash of one column, 0 where the cell is missing"""
+    present = series.notna().to_numpy()
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        text = np.array([f"#{v!r}" for v in series.astype('float64').tolist()], dtype=object)
+    elif isinstance(series.dtype, pd.StringDtype):
+        text = series.fillna('').to_numpy(dtype=object)
+    else:
+        text = np.array([_canonical(v) if p else '' for v, p in zip(series.tolist(), present)],
+                        dtype=object)
+    hashed = (pd.util.hash_array(text, categorize=False) ^ salt) * _MIX
+    return np.where(present, hashed, np.uint64(0))
+
+
+class FeatureStore:
+    """Signal-hash keyed feature cache partitioned by date_found"""
+
+    def __init__(self,
+                 root: str = DEFAULT_ROOT,
+                 engineer: Optional[FeatureEngineer] = None,
+                 ignore_columns: Iterable[str] = ('hit_target',)):
+        """
+        Args:
+            root: Store directory
+            engineer: FeatureEngineer to compute misses with
+            ignore_columns: Raw columns left out of the signal hash (labels
+                and other fields that don't feed any feature)
+        """
+        self.engineer = engineer or FeatureEngineer()
+        self.version = self.engineer.version
+        self.root = os.path.join(root, f"version={self.version}")
+        self.ignore_columns = frozenset(ignore_columns)
+        self.feature_names = self.engineer.get_feature_names()
+        self.extension = 'parquet' if PARQUET_AVAILABLE else 'pkl'
+
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def _salt(self, column: str) -> np.uint64:
+        digest = hashlib.sha1(f"{self.version}:{column}".encode('utf-8')).digest()
+        return np.uint64(int.from_bytes(digest[:8], 'little'))
+
+    def signal_hashes(self, df: pd.DataFrame) -> List[str]:
+        """
+        Stable key per raw signal row (+ feature version)
+
+        Each column is hashed vectorized and the per-column hashes are
+        summed, so column order, missing/NaN cells and columns that are
+        absent for a row don't change its key.
+        """
+        total = np.zeros(len(df), dtype=np.uint64)
+        for column in df.columns:
+            if column in self.ignore_columns:
+                continue
+            total += _column_hash(df[column], self._salt(str(column)))
+        return [f"{h:016x}" for h in total.tolist()]
+
+    def signal_hash(self, signal: Dict[str, Any]) -> str:
+        return self.signal_hashes(pd.DataFrame([signal]))[0]
+
+    @staticmethod
+    def partitions_of(df: pd.DataFrame) -> List[str]:
+        if 'date_found' not in df.columns:
+            return [UNDATED] * len(df)
+        return [re.sub(r'[^0-9A-Za-z_-]', '_', d) if isinstance(d, str) and d else UNDATED
+                for d in df['date_found'].tolist()]
+
+    # ------------------------------------------------------------------
+    # Partitions
+    # ------------------------------------------------------------------
+
+    def _partition_path(self, partition: str) -> str:
+        return os.path.join(self.root, f"date_found={partition}", f"features.{self.extension}")
+
+    def _read_partition(self, partition: str) -> Optional[pd.DataFrame]:
+        path = self._partition_path(partition)
+        if not os.path.exists(path):
+            return None
+        try:
+            if PARQUET_AVAILABLE:
+                frame = pd.read_parquet(path)
+            else:
+                frame = pd.read_pickle(path)
+        except Exception as e:
+            print(f"⚠️  Unreadable feature partition {path}: {e}")
+            return None
+        if list(frame.columns) != self.feature_names:
+            return None  # Written by a different feature set: recompute
+        return frame
+
+    def _write_partition(self, partition: str, frame: pd.DataFrame):
+        path = self._partition_path(partition)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        if PARQUET_AVAILABLE:
+            frame.to_parquet(tmp_path)
+        else:
+            frame.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+    # ------------------------------------------------------------------
+    # Features
+    # ------------------------------------------------------------------
+
+    def get_features(self, signals) -> pd.DataFrame:
+        """
+        batch_extract() output for signals, computing only cache misses
+
+        Args:
+            signals: List of signal dicts, DataFrame or pyarrow Table
+
+        Returns:
+            DataFrame with the input's index and batch_extract()'s columns
+        """
+        df = _as_frame(signals)
+        hashes = self.signal_hashes(df)
+        partitions = self.partitions_of(df)
+
+        stored: Dict[str, pd.DataFrame] = {}
+        for partition in dict.fromkeys(partitions):
+            frame = self._read_partition(partition)
+            if frame is not None:
+                stored[partition] = frame
+
+        known = set()
+        for frame in stored.values():
+            known.update(frame.index)
+        missing = np.fromiter((h not in known for h in hashes), dtype=bool, count=len(hashes))
+        self.misses = int(missing.sum())
+        self.hits = len(hashes) - self.misses
+
+        if self.misses:
+            computed = self.engineer.batch_extract(df[missing])[self.feature_names]
+            computed.index = pd.Index([h for h, m in zip(hashes, missing) if m], name=HASH_COLUMN)
+            new_partitions = pd.Series([p for p, m in zip(partitions, missing) if m],
+                                       index=computed.index)
+            for partition, rows in computed.groupby(new_partitions.to_numpy(), sort=False):
+                frame = pd.concat([stored[partition], rows]) if partition in stored else rows
+                frame = frame[~frame.index.duplicated(keep='last')]
+                self._write_partition(partition, frame)
+                stored[partition] = frame
+
+        if stored:
+            cached = pd.concat(stored.values())
+            cached = cached[~cached.index.duplicated(keep='last')]
+            features = cached.loc[hashes]
+        else:
+            features = pd.DataFrame(columns=self.feature_names, dtype=float)
+        features.index = df.index
+
+        return pd.concat([self.engineer.batch_metadata(df), features], axis=1)
+
+    def partitions(self) -> List[str]:
+        """date_found partitions stored for the current feature version"""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(self.root)
+                      if name.startswith('date_found='))
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Conviction Scoring Service
+Long-lived, low-latency ConvictionModel scoring for scanners
+
+ConvictionModel.score_signal() builds a DataFrame, runs StandardScaler and
+goes through the XGBClassifier wrapper on every call, and load() unpickles
+the model each time. ScoringService loads a model version once and keeps:
+
+- the feature order as a fixed tuple: a signal's feature dict becomes one
+  row of a float32 matrix without any DataFrame
+- the scaler as mean / scale arrays applied with NumPy
+- the raw XGBoost Booster, called with inplace_predict (no DMatrix, one
+  thread: micro-batches are too small to be worth fanning out)
+- p50 / p99 latency counters over the most recent calls
+
+Predictions are identical to ConvictionModel.predict_proba.
+
+Usage:
+    service = get_scoring_service()                  # newest model in ml/models
+    score, prob = service.score_signal(raw_signal)   # 1-10, P(2x in 30d)
+    results = service.score_signals(raw_signals)     # micro-batch
+    service.latency_report()                         # {'p50_ms': ..., 'p99_ms': ...}
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from feature_engineering import FeatureEngineer
+
+DEFAULT_MODEL_DIR = Path(__file__).parent / 'models'
+
+LATENCY_WINDOW = 10_000   # Calls kept for the latency percentiles
+
+
+class LatencyStats:
+    """Rolling per-call latency percentiles (thread-safe)"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.rows = 0
+
+    def record(self, seconds: float, rows: int):
+        with self._lock:
+            self._samples.append(seconds)
+            self.calls += 1
+            self.rows += rows
+
+    def report(self) -> Dict[str, float]:
+        with self._lock:
+            samples = np.array(self._samples, dtype=float)
+            calls, rows = self.calls, self.rows
+        if not len(samples):
+            return {'calls': calls, 'rows': rows}
+        p50, p99 = np.percentile(samples, [50, 99]) * 1000
+        return {'calls': calls, 'rows': rows, 'p50_ms': round(float(p50), 4),
+                'p99_ms': round(float(p99), 4), 'max_ms': round(float(samples.max()) * 1000, 4)}
+
+
+def latest_version(model_dir: Union[str, Path] = DEFAULT_MODEL_DIR) -> Optional[str]:
+    """Most recently trained model version saved in model_dir"""
+    newest = None
+    for path in Path(model_dir).glob('metadata_*.json'):
+        try:
+            with open(path, 'r') as f:
+                trained = json.load(f).get('training_date') or ''
+        except (json.JSONDecodeError, ValueError, OSError):
+            continue
+        version = path.stem[len('metadata_'):]
+        if newest is None or trained > newest[0]:
+            newest = (trained, version)
+    return newest[1] if newest else None
+
+
+def to_conviction(prob: float) -> int:
+    """P(2x) → 1-10 conviction (same mapping as ConvictionModel.score_signal)"""
+    return max(1, min(10, int(np.round(prob * 10))))
+
+
+class ScoringService:
+    """One loaded ConvictionModel, scored through the raw booster"""
+
+    def __init__(self, model=None,
+                 model_dir: Union[str, Path] = DEFAULT_MODEL_DIR,
+                 version: Optional[str] = None,
+                 engineer: Optional[FeatureEngineer] = None):
+        """
+        Args:
+            model: Trained ConvictionModel (default: load version from model_dir)
+            model_dir: Directory of saved models
+            version: Model version to load (default: newest in model_dir)
+            engineer: FeatureEngineer for raw signals
+        """
+        if model is None:
+            from conviction_model import ConvictionModel
+
+            version = version or latest_version(model_dir)
+            if version is None:
+                raise FileNotFoundError(f"No trained conviction model in {model_dir}")
+            model = ConvictionModel(model_version=version)
+            model.load(str(model_dir), version)
+
+        self.model_version = model.model_version
+        self.engineer = engineer or FeatureEngineer()
+        self.feature_names: Tuple[str, ...] = tuple(model.feature_names)
+        self._features = itemgetter(*self.feature_names)
+        self.stats = LatencyStats()
+
+        # StandardScaler as arrays: (x - mean) / scale
+        scaler = model.scaler
+        n = len(self.feature_names)
+        mean = getattr(scaler, 'mean_', None)
+        scale = getattr(scaler, 'scale_', None)
+        self._mean = np.zeros(n) if mean is None else np.asarray(mean, dtype=np.float64)
+        self._scale = np.ones(n) if scale is None else np.asarray(scale, dtype=np.float64)
+
+        self._booster = model.model.get_booster()
+        self._booster.set_param({'nthread': 1})
+        # Respect early stopping like XGBClassifier.predict_proba does
+        try:
+            best = model.model.best_iteration
+            self._iterations = (0, int(best) + 1) if best is not None else (0, 0)
+        except AttributeError:
+            self._iterations = (0, 0)
+
+    # ------------------------------------------------------------------
+    # Vectors
+    # ------------------------------------------------------------------
+
+    def vectorize(self, features: Dict[str, float]) -> np.ndarray:
+        """Feature dict → float64 row in the model's feature order"""
+        return np.array(self._features(features), dtype=np.float64)
+
+    def _matrix(self, rows: Union[np.ndarray, Sequence[Dict[str, float]]]) -> np.ndarray:
+        if isinstance(rows, np.ndarray):
+            X = rows.astype(np.float64, copy=False).reshape(-1, len(self.feature_names))
+        else:
+            X = np.array([self._features(row) for row in rows], dtype=np.float64)
+            X = X.reshape(len(rows), len(self.feature_names))
+        # Scale in float64 like sklearn, then hand XGBoost the float32 it uses internally
+        return ((X - self._mean) / self._scale).astype(np.float32)
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def predict_proba(self, rows: Union[np.ndarray, Sequence[Dict[str, float]]]) -> np.ndarray:
+        """
+        P(2x in 30 days) for a micro-batch of feature rows
+
+        Args:
+            rows: Feature dicts (extract_features output) or an
+                (n, n_features) array already in feature_names order
+        """
+        started = time.perf_counter()
+        X = self._matrix(rows)
+        if len(X):
+            probs = self._booster.inplace_predict(X, iteration_range=self._iterations)
+            probs = np.asarray(probs, dtype=np.float64).reshape(len(X), -1)[:, -1]
+        else:
+            probs = np.empty(0)
+        self.stats.record(time.perf_counter() - started, len(X))
+        return probs
+
+    def score_features(self, rows: Union[np.ndarray, Sequence[Dict[str, float]]]) -> List[Tuple[int, float]]:
+        """(conviction 1-10, probability) per feature row"""
+        return [(to_conviction(p), float(p)) for p in self.predict_proba(rows)]
+
+    def score_signals(self, signals: Sequence[Dict[str, Any]]) -> List[Tuple[int, float]]:
+        """(conviction 1-10, probability) per raw signal"""
+        return self.score_features([self.engineer.extract_features(s) for s in signals])
+
+    def score_signal(self, signal: Dict[str, Any]) -> Tuple[int, float]:
+        """(conviction 1-10, probability) for one raw signal"""
+        return self.score_signals([signal])[0]
+
+    def latency_report(self) -> Dict[str, float]:
+        """Model-call latency (vectorize + scale + predict) over recent calls"""
+        return self.stats.report()
+
+
+_services: Dict[Tuple[str, Optional[str]], ScoringService] = {}
+_services_lock = threading.Lock()
+
+
+def get_scoring_service(model_dir: Union[str, Path] = DEFAULT_MODEL_DIR,
+                        version: Optional[str] = None) -> ScoringService:
+    """Process-wide ScoringService per (model_dir, version): the model loads once"""
+    key = (str(Path(model_dir).resolve()), version)
+    with _services_lock:
+        if key not in _services:
+            _services[key] = ScoringService(model_dir=model_dir, version=version)
+        return _services[key]
+
+
+def main():
+    """Benchmark scoring latency on the newest saved model"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Conviction scoring service benchmark')
+    parser.add_argument('--models', default=str(DEFAULT_MODEL_DIR), help='Model directory')
+    parser.add_argument('--version', default=None, help='Model version (default: newest)')
+    parser.add_argument('--calls', type=int, default=5000, help='Single-signal calls to time')
+    args = parser.parse_args()
+
+    service = get_scoring_service(args.models, args.version)
+    signal = {'ticker': 'TAO', 'source': 'Yieldschool-YieldHub', 'dan_endorsed': True,
+              'message': 'Undervalued AI play, partnership with Foundry. High conviction.',
+              'reactions': {'🔥': 34, '🚀': 18}, 'asset_type': 'crypto', 'onchain_data': {}}
+
+    features = service.engineer.extract_features(signal)
+    for _ in range(args.calls):
+        service.score_features([features])
+
+    print(f"⚡ Model {service.model_version}: {service.score_signal(signal)}")
+    print(f"   Latency: {service.latency_report()}")
+
+
+if __name__ == "__main__":
+    main()
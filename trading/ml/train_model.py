@@ -16,6 +16,7 @@ import sys
 
 # Import our modules
 from feature_engineering import FeatureEngineer
+from feature_store import FeatureStore, DEFAULT_ROOT as FEATURE_STORE_ROOT
 from conviction_model import ConvictionModel
 
 
@@ -25,7 +26,8 @@ class TrainingPipeline:
     def __init__(self, 
                  data_path: str,
                  output_dir: str = 'models',
-                 model_version: str = None):
+                 model_version: str = None,
+                 feature_store_dir: str = FEATURE_STORE_ROOT):
         """
         Initialize training pipeline
         
@@ -33,6 +35,7 @@ class TrainingPipeline:
             data_path: Path to training data CSV
             output_dir: Directory to save trained model
             model_version: Model version string (auto-generated if None)
+            feature_store_dir: Incremental feature cache (None = recompute everything)
         """
         self.data_path = data_path
         self.output_dir = output_dir
@@ -45,6 +48,8 @@ class TrainingPipeline:
             self.model_version = model_version
         
         self.engineer = FeatureEngineer()
+        self.feature_store = (FeatureStore(feature_store_dir, engineer=self.engineer)
+                              if feature_store_dir else None)
         self.model = ConvictionModel(model_version=self.model_version)
         
         self.training_report = {}
@@ -91,11 +96,14 @@ class TrainingPipeline:
             # Raw signals - need feature engineering
             print("Detected raw signals, running feature engineering...")
             
-            # Convert to list of signal dicts
-            signals = df.to_dict('records')
-            
-            # Extract features
-            feature_df = self.engineer.batch_extract(signals)
+            # Extract features (column-wise, straight from the DataFrame);
+            # the feature store only computes signals it hasn't seen
+            if self.feature_store is not None:
+                feature_df = self.feature_store.get_features(df)
+                print(f"Feature store: {self.feature_store.hits} cached, "
+                      f"{self.feature_store.misses} computed")
+            else:
+                feature_df = self.engineer.batch_extract(df)
             
             # Get target
             y = df['hit_target']
@@ -321,6 +329,10 @@ def main():
                        help='Model version (auto-generated if not specified)')
     parser.add_argument('--test-size', type=float, default=0.2,
                        help='Test set fraction (default: 0.2)')
+    parser.add_argument('--feature-store', type=str, default=FEATURE_STORE_ROOT,
+                       help='Feature cache directory (default: ml/data/feature_store)')
+    parser.add_argument('--no-feature-store', action='store_true',
+                       help='Recompute every feature instead of using the cache')
     
     args = parser.parse_args()
     
@@ -328,7 +340,8 @@ def main():
     pipeline = TrainingPipeline(
         data_path=args.data,
         output_dir=args.output,
-        model_version=args.version
+        model_version=args.version,
+        feature_store_dir=None if args.no_feature_store else args.feature_store
     )
     
     pipeline.run_full_pipeline()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Price Cache for roostr Trading
+Per-ticker TTL cache for PriceFetcher, backed by SQLite
+
+Each ticker is its own row in .price_cache.db (WAL mode), stamped with the
+time it was fetched. Entries expire individually, so one stale ticker no
+longer empties the whole cache, and concurrent cron runs upsert rows
+instead of racing to rewrite one JSON file.
+
+.price_cache.json is still exported (atomically, once per batch) for the
+dashboard and summary scripts that read it directly.
+
+Usage:
+    cache = PriceCache('.')
+    cache.put_many({'SOL': {...}, 'TAO': {...}})
+    entry, age = cache.get('SOL')
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+DB_FILE = '.price_cache.db'
+JSON_FILE = '.price_cache.json'
+
+
+class PriceCache:
+    """Per-ticker price entries with fetch timestamps"""
+
+    def __init__(self, cache_dir: str = '.', timeout: float = 30.0):
+        self.db_path = os.path.join(cache_dir, DB_FILE)
+        self.json_path = os.path.join(cache_dir, JSON_FILE)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, timeout=timeout, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS prices (
+                ticker TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+        if not self.count():
+            self._import_json()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _import_json(self):
+        """Seed an empty cache from a legacy .price_cache.json"""
+        if not os.path.exists(self.json_path):
+            return
+        try:
+            with open(self.json_path, 'r') as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, ValueError, OSError):
+            return
+
+        entries = {}
+        for ticker, entry in legacy.items():
+            if not isinstance(entry, dict) or 'timestamp' not in entry:
+                continue
+            try:
+                fetched_at = datetime.fromisoformat(entry['timestamp']).timestamp()
+            except (TypeError, ValueError):
+                continue
+            entries[ticker] = (entry, fetched_at)
+        self._write(entries)
+
+    def _write(self, entries: Dict[str, Tuple[Dict, float]]):
+        rows = [(ticker, json.dumps(entry), fetched_at)
+                for ticker, (entry, fetched_at) in entries.items()]
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO prices (ticker, data, fetched_at) VALUES (?, ?, ?)
+                ON CONFLICT(ticker) DO UPDATE SET
+                    data = excluded.data, fetched_at = excluded.fetched_at
+                WHERE excluded.fetched_at >= prices.fetched_at
+            """, rows)
+
+    def get(self, ticker: str) -> Optional[Tuple[Dict, float]]:
+        """(entry, age in seconds) for a ticker, or None if never cached"""
+        return self.get_many([ticker]).get(ticker.upper())
+
+    def get_many(self, tickers: Iterable[str]) -> Dict[str, Tuple[Dict, float]]:
+        """ticker → (entry, age in seconds) for every cached ticker requested"""
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        if not tickers:
+            return {}
+        placeholders = ','.join('?' * len(tickers))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT ticker, data, fetched_at FROM prices WHERE ticker IN ({placeholders})",
+                tickers
+            ).fetchall()
+        now = time.time()
+        return {ticker: (json.loads(data), now - fetched_at) for ticker, data, fetched_at in rows}
+
+    def put_many(self, entries: Dict[str, Dict]):
+        """Store freshly fetched entries and refresh the JSON export"""
+        if not entries:
+            return
+        now = time.time()
+        self._write({ticker.upper(): (entry, now) for ticker, entry in entries.items()})
+        self.export_json()
+
+    def newest_age(self) -> Optional[float]:
+        """Seconds since the most recent fetch of any ticker"""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(fetched_at) FROM prices").fetchone()
+        return time.time() - row[0] if row and row[0] is not None else None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+
+    def export_json(self):
+        """Atomically rewrite .price_cache.json (legacy format) from the table"""
+        with self._lock:
+            rows = self._conn.execute("SELECT ticker, data, fetched_at FROM prices").fetchall()
+        if not rows:
+            return
+
+        export = {ticker: json.loads(data) for ticker, data, _ in rows}
+        export['timestamp'] = datetime.fromtimestamp(max(r[2] for r in rows)).isoformat()
+
+        tmp_path = f"{self.json_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(export, f, indent=2)
+            os.replace(tmp_path, self.json_path)
+        except OSError as e:
+            print(f"Warning: Could not save cache: {e}")
@@ -5,13 +5,13 @@ Uses CoinGecko API (free tier, no API key needed)
 Fetches live prices for BTC, ETH, SOL, TAO, and any crypto ticker
 """
 
-import json
 import time
-import os
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime
 from typing import Dict, Optional, List
-import urllib.request
-import urllib.error
+
+from coingecko_client import get_coingecko_client
+from price_cache import PriceCache
 
 class PriceFetcher:
     """Fetch real-time crypto prices from CoinGecko"""
@@ -36,65 +36,20 @@ class PriceFetcher:
     }
     
     BASE_URL = 'https://api.coingecko.com/api/v3'
-    CACHE_FILE = '.price_cache.json'
     CACHE_TTL = 60  # Cache valid for 60 seconds
+    STALE_TTL = 15 * 60  # With allow_stale: past CACHE_TTL, serve cached (marked stale) and refresh
     
     def __init__(self, cache_dir: str = '.'):
         """Initialize price fetcher with cache directory"""
         self.cache_dir = cache_dir
-        self.cache_path = os.path.join(cache_dir, self.CACHE_FILE)
-        self.cache = self._load_cache()
-    
-    def _load_cache(self) -> Dict:
-        """Load price cache from disk"""
-        if not os.path.exists(self.cache_path):
-            return {}
-        
-        try:
-            with open(self.cache_path, 'r') as f:
-                cache = json.load(f)
-                # Validate cache age
-                if 'timestamp' in cache:
-                    cache_time = datetime.fromisoformat(cache['timestamp'])
-                    if datetime.now() - cache_time > timedelta(seconds=self.CACHE_TTL):
-                        return {}  # Cache expired
-                return cache
-        except (json.JSONDecodeError, ValueError):
-            return {}
-    
-    def _save_cache(self):
-        """Save price cache to disk"""
-        self.cache['timestamp'] = datetime.now().isoformat()
-        try:
-            with open(self.cache_path, 'w') as f:
-                json.dump(self.cache, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save cache: {e}")
+        self.cache = PriceCache(cache_dir)
+        self.client = get_coingecko_client(cache_dir)
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
     
     def _fetch_from_api(self, url: str, timeout: int = 10) -> Optional[Dict]:
-        """Fetch JSON data from CoinGecko API"""
-        try:
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'roostr-trading-bot/1.0')
-            
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                data = response.read()
-                return json.loads(data.decode('utf-8'))
-        
-        except urllib.error.HTTPError as e:
-            if e.code == 429:
-                print(f"⚠️  Rate limited by CoinGecko (429). Using cached data.")
-            else:
-                print(f"❌ HTTP Error {e.code}: {e.reason}")
-            return None
-        
-        except urllib.error.URLError as e:
-            print(f"❌ Network error: {e.reason}")
-            return None
-        
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
-            return None
+        """Fetch JSON data from CoinGecko API (kept-alive, rate-limited)"""
+        return self.client.get_json(url)
     
     def get_coingecko_id(self, ticker: str) -> Optional[str]:
         """Convert ticker to CoinGecko ID"""
@@ -104,28 +59,37 @@ class PriceFetcher:
         if ticker in self.TICKER_MAP:
             return self.TICKER_MAP[ticker]
         
-        # Try searching CoinGecko (rate-limited, use sparingly)
-        print(f"⚠️  Unknown ticker {ticker}, searching CoinGecko...")
-        url = f"{self.BASE_URL}/search?query={ticker}"
-        data = self._fetch_from_api(url)
-        
-        if data and 'coins' in data and len(data['coins']) > 0:
-            # Take first result
-            coin = data['coins'][0]
-            coingecko_id = coin['id']
-            print(f"✓ Found {ticker} → {coingecko_id} (name: {coin['name']})")
-            
-            # Cache this mapping
-            self.TICKER_MAP[ticker] = coingecko_id
-            return coingecko_id
-        
-        print(f"❌ Could not find {ticker} on CoinGecko")
-        return None
+        # Learned mappings are persisted, so /search runs once per ticker
+        return self.client.lookup_id(ticker)
+    
+    def _build_result(self, ticker: str, coingecko_id: str, coin_data: Dict) -> Dict:
+        """Normalize a /simple/price entry into our price dict"""
+        return {
+            'ticker': ticker,
+            'coingecko_id': coingecko_id,
+            'price': coin_data.get('usd', 0),
+            'price_change_24h': coin_data.get('usd_24h_change', 0),
+            'market_cap': coin_data.get('usd_market_cap', 0),
+            'last_updated': datetime.fromtimestamp(
+                coin_data.get('last_updated_at', time.time())
+            ).isoformat(),
+            'source': 'coingecko',
+            'timestamp': datetime.now().isoformat(),
+            'age_seconds': 0.0,
+            'stale': False
+        }
     
-    def get_price(self, ticker: str, use_cache: bool = True) -> Optional[Dict]:
+    def get_price(self, ticker: str, use_cache: bool = True,
+                  allow_stale: bool = False) -> Optional[Dict]:
         """
         Get current price for a ticker
         
+        Args:
+            ticker: Ticker symbol
+            use_cache: Serve a cached quote younger than CACHE_TTL
+            allow_stale: Also serve quotes up to STALE_TTL old (marked
+                'stale': True) while they refresh in the background
+        
         Returns:
             {
                 'ticker': 'SOL',
@@ -133,129 +97,126 @@ class PriceFetcher:
                 'price_change_24h': -2.5,
                 'market_cap': 42000000000,
                 'last_updated': '2026-02-06T12:08:00Z',
-                'source': 'coingecko'
+                'source': 'coingecko',
+                'age_seconds': 0.0,   # Seconds since this quote was fetched
+                'stale': False        # True: older than CACHE_TTL (allow_stale only)
             }
         """
         ticker = ticker.upper()
         
         # Check cache first
-        if use_cache and ticker in self.cache:
-            cached = self.cache[ticker]
-            if 'timestamp' in cached:
-                cache_time = datetime.fromisoformat(cached['timestamp'])
-                if datetime.now() - cache_time < timedelta(seconds=self.CACHE_TTL):
-                    return cached
-        
-        # Get CoinGecko ID
-        coingecko_id = self.get_coingecko_id(ticker)
-        if not coingecko_id:
-            return None
-        
-        # Fetch live price
-        url = (f"{self.BASE_URL}/simple/price"
-               f"?ids={coingecko_id}"
-               f"&vs_currencies=usd"
-               f"&include_market_cap=true"
-               f"&include_24hr_change=true"
-               f"&include_last_updated_at=true")
+        if use_cache:
+            cached = self._cached([ticker], allow_stale).get(ticker)
+            if cached:
+                return cached
         
-        data = self._fetch_from_api(url)
-        
-        if not data or coingecko_id not in data:
-            print(f"❌ No price data for {ticker}")
-            return None
-        
-        coin_data = data[coingecko_id]
+        return self._fetch([ticker]).get(ticker)
+    
+    def _cached(self, tickers: List[str], allow_stale: bool = False) -> Dict[str, Dict]:
+        """
+        Usable cache entries, stamped with 'age_seconds' / 'stale'
         
-        result = {
-            'ticker': ticker,
-            'coingecko_id': coingecko_id,
-            'price': coin_data.get('usd', 0),
-            'price_change_24h': coin_data.get('usd_24h_change', 0),
-            'market_cap': coin_data.get('usd_market_cap', 0),
-            'last_updated': datetime.fromtimestamp(
-                coin_data.get('last_updated_at', time.time())
-            ).isoformat(),
-            'source': 'coingecko',
-            'timestamp': datetime.now().isoformat()
-        }
+        Fresh ones (within CACHE_TTL) always; with allow_stale, ones within
+        STALE_TTL too, with a refresh scheduled so callers don't wait on it.
+        """
+        results = {}
+        stale = []
+        for ticker, (entry, age) in self.cache.get_many(tickers).items():
+            if age < self.CACHE_TTL:
+                results[ticker] = {**entry, 'age_seconds': round(age, 1), 'stale': False}
+            elif allow_stale and age < self.STALE_TTL:
+                results[ticker] = {**entry, 'age_seconds': round(age, 1), 'stale': True}
+                stale.append(ticker)
+        if stale:
+            self._refresh_in_background(stale)
+        return results
+    
+    def _refresh_in_background(self, tickers: List[str]):
+        with self._refresh_lock:
+            tickers = [t for t in tickers if t not in self._refreshing]
+            self._refreshing.update(tickers)
+        if not tickers:
+            return
         
-        # Cache result
-        self.cache[ticker] = result
-        self._save_cache()
+        def refresh():
+            try:
+                self._fetch(tickers)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.difference_update(tickers)
         
-        return result
+        # Not a daemon: a short-lived process waits for the refresh to land at exit
+        threading.Thread(target=refresh, name='price-refresh').start()
     
-    def get_multiple_prices(self, tickers: List[str], use_cache: bool = True) -> Dict[str, Dict]:
-        """
-        Fetch prices for multiple tickers (batch)
-        More efficient than calling get_price() multiple times
-        """
+    def _fetch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """Fetch live prices and write them through to the cache"""
         results = {}
         
         # Convert all tickers to CoinGecko IDs
         ticker_to_id = {}
         for ticker in tickers:
-            ticker = ticker.upper()
             coingecko_id = self.get_coingecko_id(ticker)
             if coingecko_id:
                 ticker_to_id[ticker] = coingecko_id
         
         if not ticker_to_id:
-            print("❌ No valid tickers found")
             return results
         
-        # Build batch request
-        ids = ','.join(ticker_to_id.values())
-        url = (f"{self.BASE_URL}/simple/price"
-               f"?ids={ids}"
-               f"&vs_currencies=usd"
-               f"&include_market_cap=true"
-               f"&include_24hr_change=true"
-               f"&include_last_updated_at=true")
-        
-        data = self._fetch_from_api(url)
+        if len(ticker_to_id) == 1:
+            # Single price (merged with concurrent get_price calls)
+            [(ticker, coingecko_id)] = ticker_to_id.items()
+            coin_data = self.client.price(coingecko_id)
+            data = {coingecko_id: coin_data} if coin_data else None
+        else:
+            # One batch request for every ID
+            data = self.client.simple_price(list(ticker_to_id.values()))
         
         if not data:
-            print("❌ Failed to fetch batch prices")
+            print(f"❌ No price data for {', '.join(ticker_to_id)}")
             return results
         
-        # Parse results
         for ticker, coingecko_id in ticker_to_id.items():
             if coingecko_id in data:
-                coin_data = data[coingecko_id]
-                
-                result = {
-                    'ticker': ticker,
-                    'coingecko_id': coingecko_id,
-                    'price': coin_data.get('usd', 0),
-                    'price_change_24h': coin_data.get('usd_24h_change', 0),
-                    'market_cap': coin_data.get('usd_market_cap', 0),
-                    'last_updated': datetime.fromtimestamp(
-                        coin_data.get('last_updated_at', time.time())
-                    ).isoformat(),
-                    'source': 'coingecko',
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                results[ticker] = result
-                
-                # Cache result
-                self.cache[ticker] = result
+                results[ticker] = self._build_result(ticker, coingecko_id, data[coingecko_id])
         
-        # Save cache after batch update
-        self._save_cache()
+        # One cache transaction (and JSON export) per fetch
+        self.cache.put_many(results)
+        return results
+    
+    def cached_prices(self, tickers: List[str], allow_stale: bool = True) -> Dict[str, Dict]:
+        """
+        Cached quotes only, never blocking on the network
+        
+        For display / monitoring readers: stale quotes (up to STALE_TTL old,
+        marked 'stale': True) are served and refreshed in the background.
+        Tickers with no usable entry are omitted.
+        """
+        return self._cached(list(dict.fromkeys(t.upper() for t in tickers)), allow_stale)
+    
+    def get_multiple_prices(self, tickers: List[str], use_cache: bool = False,
+                            allow_stale: bool = False) -> Dict[str, Dict]:
+        """
+        Fetch prices for multiple tickers (batch)
+        More efficient than calling get_price() multiple times
+        
+        Live by default; use_cache / allow_stale as in get_price().
+        """
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        results = self._cached(tickers, allow_stale) if use_cache else {}
+        
+        missing = [t for t in tickers if t not in results]
+        if missing:
+            fetched = self._fetch(missing)
+            if not fetched and not results:
+                print("❌ Failed to fetch batch prices")
+            results.update(fetched)
         
         return results
     
     def is_cache_fresh(self, max_age_seconds: int = 60) -> bool:
         """Check if cache is fresh enough"""
-        if not self.cache or 'timestamp' not in self.cache:
-            return False
-        
-        cache_time = datetime.fromisoformat(self.cache['timestamp'])
-        age = (datetime.now() - cache_time).total_seconds()
-        return age < max_age_seconds
+        age = self.cache.newest_age()
+        return age is not None and age < max_age_seconds
 
 
 # CLI Interface
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Price Service for roostr Trading
+One get_quotes() for every script that needs current prices
+
+Each provider takes a whole batch of tickers in one call:
+- coingecko:   PriceFetcher (one /simple/price request, crypto only)
+- yahoo:       one bulk yf.download for stocks and crypto (SOL → SOL-USD)
+- tradingview: one get_multiple_analysis scan per screener, for tickers
+               with a configured EXCHANGE:SYMBOL (adds RSI + recommendation)
+
+get_quotes() runs every healthy provider concurrently on an asyncio loop
+and keeps the first good quote per ticker, returning as soon as every
+ticker has one. Each provider carries a health score (success rate and
+latency, exponentially weighted); providers that have been failing are only
+asked for the tickers the healthy ones could not price.
+
+Trading paths always race live providers. Display and monitoring readers
+pass allow_stale=True: quotes already in PriceFetcher's cache (up to
+STALE_TTL old, marked 'stale') are returned without waiting on the network
+and refreshed in the background; only uncached tickers are fetched.
+
+Inside a running event loop use `await service.get_quotes_async(...)`;
+the blocking get_quotes() refuses to nest a second loop.
+
+Usage:
+    from price_service import get_quotes
+    quotes = get_quotes(['SOL', 'TAO', 'ASTS', 'NVDA'])
+    quotes['ASTS']['price'], quotes['ASTS']['source']
+    quotes = get_quotes(['SOL', 'TAO'], allow_stale=True)   # dashboards
+
+    with PriceService() as service:      # own instance: pool shut down on exit
+        quotes = service.get_quotes(['SOL'])
+"""
+
+import abc
+import asyncio
+import atexit
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from price_fetcher import PriceFetcher
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+try:
+    from tradingview_ta import get_multiple_analysis, Interval
+    TRADINGVIEW_AVAILABLE = True
+except ImportError:
+    TRADINGVIEW_AVAILABLE = False
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+QUOTE_TIMEOUT = 15.0    # Seconds get_quotes() waits for providers overall
+HEALTH_ALPHA = 0.3      # Weight of the newest observation in the health EWMA
+HEALTHY_SCORE = 0.5     # Below this a provider becomes fallback-only
+SLOW_SECONDS = 5.0      # Latency at which a provider's score is halved
+
+
+class ProviderHealth:
+    """Exponentially weighted success rate and latency for one provider"""
+
+    def __init__(self):
+        self.success = 1.0
+        self.latency = 0.0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def record(self, requested: int, returned: int, seconds: float):
+        ok = returned / requested if requested else 0.0
+        with self._lock:
+            self.success += HEALTH_ALPHA * (ok - self.success)
+            self.latency += HEALTH_ALPHA * (seconds - self.latency)
+            self.calls += 1
+
+    @property
+    def score(self) -> float:
+        return self.success / (1.0 + self.latency / SLOW_SECONDS)
+
+    def to_dict(self) -> Dict:
+        return {'score': round(self.score, 3), 'success': round(self.success, 3),
+                'latency': round(self.latency, 3), 'calls': self.calls}
+
+
+class PriceProvider(abc.ABC):
+    """A source that can price many tickers in one blocking call"""
+
+    name = 'provider'
+
+    def supports(self, ticker: str) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def fetch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """ticker → quote dict (at least 'price'); omit tickers it can't price"""
+
+    def cached(self, tickers: List[str]) -> Dict[str, Dict]:
+        """Quotes available without a network call (allow_stale readers)"""
+        return {}
+
+
+class CoinGeckoProvider(PriceProvider):
+    name = 'coingecko'
+
+    # Live by default: a cached quote would beat live providers to the race
+    def __init__(self, cache_dir: str = BASE_DIR, use_cache: bool = False):
+        self.fetcher = PriceFetcher(cache_dir)
+        self.use_cache = use_cache
+
+    def supports(self, ticker: str) -> bool:
+        # Only known coins: a /search for a stock ticker can match an unrelated token
+        return (ticker in PriceFetcher.TICKER_MAP
+                or self.fetcher.client.known_id(ticker) is not None)
+
+    def fetch(self, tickers: List[str]) -> Dict[str, Dict]:
+        return self.fetcher.get_multiple_prices(tickers, use_cache=self.use_cache)
+
+    def cached(self, tickers: List[str]) -> Dict[str, Dict]:
+        return self.fetcher.cached_prices([t for t in tickers if self.supports(t)])
+
+
+class YahooProvider(PriceProvider):
+    name = 'yahoo'
+
+    def supports(self, ticker: str) -> bool:
+        return YFINANCE_AVAILABLE
+
+    @staticmethod
+    def symbol(ticker: str) -> str:
+        return f"{ticker}-USD" if ticker in PriceFetcher.TICKER_MAP else ticker
+
+    def fetch(self, tickers: List[str]) -> Dict[str, Dict]:
+        symbols = {self.symbol(t): t for t in tickers}
+        data = yf.download(list(symbols), period='5d', interval='1d', group_by='ticker',
+                           progress=False, threads=True, auto_adjust=False)
+        if data is None or data.empty:
+            return {}
+
+        now = datetime.now().isoformat()
+        quotes = {}
+        for symbol, ticker in symbols.items():
+            try:
+                closes = data[symbol]['Close'] if symbol in data.columns.get_level_values(0) \
+                    else data['Close']
+            except KeyError:
+                continue
+            closes = closes.dropna()
+            if closes.empty:
+                continue
+            quotes[ticker] = {
+                'ticker': ticker,
+                'price': float(closes.iloc[-1]),
+                'last_updated': closes.index[-1].isoformat(),
+                'source': self.name,
+                'timestamp': now
+            }
+        return quotes
+
+
+class TradingViewProvider(PriceProvider):
+    name = 'tradingview'
+
+    def __init__(self, symbols: Optional[Dict[str, Dict]] = None,
+                 interval: Optional[str] = None):
+        """
+        Args:
+            symbols: ticker → {'symbol': 'TAOUSD', 'exchange': 'BINANCE',
+                     'screener': 'crypto'} (tickers without an entry are skipped)
+            interval: TradingView interval (default 1h)
+        """
+        self.symbols = {t.upper(): s for t, s in (symbols or {}).items()}
+        self.interval = interval or (Interval.INTERVAL_1_HOUR if TRADINGVIEW_AVAILABLE else '1h')
+
+    def supports(self, ticker: str) -> bool:
+        return TRADINGVIEW_AVAILABLE and ticker in self.symbols
+
+    def fetch(self, tickers: List[str]) -> Dict[str, Dict]:
+        by_screener: Dict[str, Dict[str, str]] = {}
+        for ticker in tickers:
+            spec = self.symbols[ticker]
+            key = f"{spec['exchange']}:{spec['symbol']}".upper()
+            by_screener.setdefault(spec.get('screener', 'crypto'), {})[key] = ticker
+
+        now = datetime.now().isoformat()
+        quotes = {}
+        for screener, keys in by_screener.items():
+            analyses = get_multiple_analysis(screener=screener, interval=self.interval,
+                                             symbols=list(keys))
+            for key, analysis in (analyses or {}).items():
+                ticker = keys.get(key.upper())
+                if ticker is None or analysis is None:
+                    continue
+                quotes[ticker] = {
+                    'ticker': ticker,
+                    'price': analysis.indicators['close'],
+                    'rsi': analysis.indicators.get('RSI', 0),
+                    'recommendation': analysis.summary['RECOMMENDATION'],
+                    'source': self.name,
+                    'timestamp': now
+                }
+        return quotes
+
+
+def _good_quote(quote: Optional[Dict]) -> bool:
+    try:
+        price = float(quote['price'])
+    except (TypeError, KeyError, ValueError):
+        return False
+    return price > 0 and not math.isnan(price)
+
+
+class PriceService:
+    """Concurrent, health-routed quotes across every price provider"""
+
+    def __init__(self, providers: Optional[List[PriceProvider]] = None,
+                 timeout: float = QUOTE_TIMEOUT):
+        self.providers = providers if providers is not None else [
+            CoinGeckoProvider(), YahooProvider()
+        ]
+        self.timeout = timeout
+        self.health = {p.name: ProviderHealth() for p in self.providers}
+        # Owned pool: get_quotes() returns without waiting on slow providers
+        self._pool = ThreadPoolExecutor(max_workers=max(4, 2 * len(self.providers)),
+                                        thread_name_prefix='price-provider')
+
+    def close(self):
+        """Shut down the provider pool (calls still running are not waited on)"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add_provider(self, provider: PriceProvider):
+        self.providers.append(provider)
+        self.health.setdefault(provider.name, ProviderHealth())
+
+    def _call(self, provider: PriceProvider, tickers: List[str]) -> Dict[str, Dict]:
+        started = time.time()
+        try:
+            quotes = {t: q for t, q in (provider.fetch(tickers) or {}).items() if _good_quote(q)}
+        except Exception as e:
+            print(f"⚠️  {provider.name}: {e}")
+            quotes = {}
+        self.health[provider.name].record(len(tickers), len(quotes), time.time() - started)
+        return quotes
+
+    async def _gather(self, providers: List[PriceProvider], tickers: List[str],
+                      quotes: Dict[str, Dict], deadline: float):
+        loop = asyncio.get_running_loop()
+        pending = set()
+        for provider in providers:
+            wanted = [t for t in tickers if t not in quotes and provider.supports(t)]
+            if wanted:
+                pending.add(loop.run_in_executor(self._pool, self._call, provider, wanted))
+
+        while pending and any(t not in quotes for t in tickers):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                for ticker, quote in future.result().items():
+                    quotes.setdefault(ticker, quote)
+
+    async def get_quotes_async(self, tickers: Iterable[str],
+                               allow_stale: bool = False) -> Dict[str, Dict]:
+        """
+        ticker → first good quote (tickers nobody could price are omitted)
+
+        With allow_stale, cached quotes (possibly 'stale') are used first and
+        only the remaining tickers go to the providers.
+        """
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        quotes: Dict[str, Dict] = {}
+        if allow_stale:
+            for provider in self.providers:
+                wanted = [t for t in tickers if t not in quotes]
+                for ticker, quote in provider.cached(wanted).items():
+                    if _good_quote(quote):
+                        quotes.setdefault(ticker, quote)
+        deadline = time.monotonic() + self.timeout
+
+        ranked = sorted(self.providers, key=lambda p: self.health[p.name].score, reverse=True)
+        primary = [p for p in ranked if self.health[p.name].score >= HEALTHY_SCORE]
+        fallback = [p for p in ranked if self.health[p.name].score < HEALTHY_SCORE]
+
+        await self._gather(primary or fallback, tickers, quotes, deadline)
+        if primary and fallback and time.monotonic() < deadline:
+            await self._gather(fallback, tickers, quotes, deadline)
+        return quotes
+
+    def get_quotes(self, tickers: Iterable[str], allow_stale: bool = False) -> Dict[str, Dict]:
+        """Blocking get_quotes_async() for synchronous scripts"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.get_quotes_async(tickers, allow_stale))
+        raise RuntimeError("get_quotes() called from a running event loop; "
+                           "use 'await service.get_quotes_async(tickers)' instead")
+
+    def health_report(self) -> Dict[str, Dict]:
+        return {name: health.to_dict() for name, health in self.health.items()}
+
+
+_default_service: Optional[PriceService] = None
+_default_lock = threading.Lock()
+
+
+def get_price_service() -> PriceService:
+    """Process-wide PriceService (health scores persist across calls)"""
+    global _default_service
+    with _default_lock:
+        if _default_service is None:
+            _default_service = PriceService()
+            atexit.register(_default_service.close)
+        return _default_service
+
+
+def get_quotes(tickers: Iterable[str], allow_stale: bool = False) -> Dict[str, Dict]:
+    """Current quotes for tickers from the shared PriceService"""
+    return get_price_service().get_quotes(tickers, allow_stale)
+
+
+# CLI Interface
+def main():
+    """Command-line interface for testing"""
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python price_service.py <TICKER> [TICKER2 TICKER3 ...]")
+        print("Example: python price_service.py SOL TAO ASTS NVDA")
+        sys.exit(1)
+
+    service = get_price_service()
+    started = time.time()
+    quotes = service.get_quotes(sys.argv[1:])
+    print(f"\n✅ {len(quotes)} quotes in {time.time() - started:.2f}s:\n")
+    for ticker, quote in quotes.items():
+        print(f"{ticker:8} ${quote['price']:>12,.4f}   ({quote['source']})")
+
+    failed = set(t.upper() for t in sys.argv[1:]) - set(quotes)
+    if failed:
+        print(f"\n❌ Failed to fetch: {', '.join(sorted(failed))}")
+
+    print("\nProvider health:")
+    for name, health in service.health_report().items():
+        print(f"  {name:12} {health}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,9 +6,27 @@ Prevents garbage signals from polluting the trading system
 
 import json
 import csv
+import sys
+from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Tuple, List, Dict, Any
-import re
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ticker_extractor import COMMON_WORDS, TICKER_FORMAT, TickerExtractor
+
+# Wrapped/equivalent tickers: a signal for one is a duplicate of the others
+TICKER_EQUIVALENTS = {
+    'BTC': ['WBTC', 'BTCB', 'RENBTC'],
+    'ETH': ['WETH', 'BETH'],
+    'USD': ['USDT', 'USDC', 'BUSD', 'DAI', 'TUSD']
+}
+
+# Any ticker in TICKER_EQUIVALENTS → its base
+CANONICAL_TICKERS = {
+    ticker: base
+    for base, variants in TICKER_EQUIVALENTS.items()
+    for ticker in [base] + variants
+}
 
 
 class DataQualityChecker:
@@ -26,10 +44,17 @@ class DataQualityChecker:
             blacklist_file: Path to ticker blacklist (common words)
             database_file: Path to existing signal database (for duplicate check)
         """
-        self.blacklist = self._load_blacklist(blacklist_file)
+        self.blacklist = frozenset(self._load_blacklist(blacklist_file))
+        self.extractor = TickerExtractor(blacklist=self.blacklist)
         self.database_file = database_file
         self.existing_signals = self._load_existing_signals()
         
+        # Duplicate indexes, built once and kept current by record_signal()
+        self._seen_days = set()          # (TICKER, Date_Found)
+        self._seen_equivalents = {}      # base → existing tickers of that family
+        for existing in self.existing_signals:
+            self._index_signal(existing.get('Ticker', ''), existing.get('Date_Found'))
+        
         # Approved sources
         self.approved_sources = [
             'Yieldschool', 'Yieldschool-YieldHub', 'Yieldschool-BlueChips', 'Yieldschool-MidCaps',
@@ -71,70 +96,11 @@ class DataQualityChecker:
     
     def _get_default_blacklist(self) -> set:
         """Return comprehensive blacklist of non-ticker words"""
-        common_words = {
-            # Common short words
-            'A', 'I', 'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL',
-            'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'GET', 'HAS', 'HIM',
-            'HIS', 'HOW', 'MAN', 'NEW', 'NOW', 'OLD', 'SEE', 'TWO', 'WAY', 'WHO',
-            'BOY', 'DID', 'ITS', 'LET', 'PUT', 'SAY', 'SHE', 'TOO', 'USE',
-            
-            # Finance/trading jargon (not tickers)
-            'CEO', 'CFO', 'CTO', 'IPO', 'ATH', 'ATL', 'FOMO', 'FUD', 'DYOR',
-            'NFA', 'IMO', 'IMHO', 'TBH', 'HODL', 'REKT', 'BTFD', 'WAGMI',
-            
-            # Exchanges/platforms (not tickers)
-            'NYSE', 'NASDAQ', 'CME', 'CBOE', 'DEX', 'CEX', 'USA', 'USD',
-            
-            # Common crypto (exclude from signals to avoid noise)
-            'BTC', 'ETH', 'USDT', 'USDC', 'BUSD',  # Too common, scrape separately
-            
-            # Days/months
-            'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN',
-            'JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC',
-            
-            # Common verbs/adjectives often in caps
-            'BIG', 'GOOD', 'BEST', 'HIGH', 'LOW', 'LONG', 'SHORT', 'STOP', 'WAIT',
-            'LOVE', 'HATE', 'NICE', 'COOL', 'EPIC', 'HUGE', 'MEGA', 'SUPER',
-            
-            # Numbers/measurements
-            'ONE', 'TWO', 'TEN', 'HUNDRED', 'MILLION', 'BILLION',
-            
-            # Reactions/emotions
-            'LOL', 'LMAO', 'ROFL', 'WTF', 'OMG', 'YOLO', 'GG', 'EZ', 'RIP',
-            
-            # More finance terms
-            'CALL', 'PUT', 'BULL', 'BEAR', 'MOON', 'DUMP', 'PUMP', 'SCAM',
-            'TRADE', 'CHART', 'LONG', 'SWING', 'SCALE', 'EXIT', 'ENTRY'
-        }
-        
-        # Add common 3-letter words
-        three_letter_common = {
-            'ADD', 'AGE', 'AGO', 'AID', 'AIM', 'AIR', 'ANY', 'APE', 'APT', 'ARC',
-            'ARM', 'ART', 'ASK', 'ATE', 'BAD', 'BAG', 'BAR', 'BAT', 'BAY', 'BED',
-            'BET', 'BID', 'BIT', 'BOX', 'BUG', 'BUS', 'BUY', 'CAB', 'CAP', 'CAR',
-            'CAT', 'COW', 'CRY', 'CUP', 'CUT', 'DAM', 'DIG', 'DOG', 'DOT', 'DRY',
-            'DUE', 'EAR', 'EAT', 'EGG', 'END', 'ERA', 'EYE', 'FAN', 'FAR', 'FAT',
-            'FEE', 'FEW', 'FIG', 'FIT', 'FIX', 'FLY', 'FOE', 'FOG', 'FUN', 'FUR',
-            'GAP', 'GAS', 'GAY', 'GEM', 'GUN', 'GUT', 'GUY', 'GYM', 'HAD', 'HAM',
-            'HAT', 'HIT', 'HOT', 'HUB', 'HUG', 'ICE', 'ILL', 'INK', 'INN', 'JAM',
-            'JAR', 'JAW', 'JET', 'JOB', 'JOY', 'KEY', 'KID', 'KIT', 'LAB', 'LAD',
-            'LAP', 'LAW', 'LAY', 'LEG', 'LID', 'LIE', 'LIP', 'LOG', 'LOT', 'LOW',
-            'MAD', 'MAP', 'MAT', 'MAY', 'MEN', 'MET', 'MID', 'MIX', 'MOB', 'MUD',
-            'NET', 'NOR', 'NUT', 'OAK', 'ODD', 'OFF', 'OIL', 'OPT', 'ORB', 'OWE',
-            'OWN', 'PAD', 'PAL', 'PAN', 'PAT', 'PAW', 'PAY', 'PEA', 'PEN', 'PET',
-            'PIE', 'PIG', 'PIN', 'PIT', 'POT', 'PRO', 'PUB', 'RAG', 'RAN', 'RAT',
-            'RAW', 'RAY', 'RED', 'REP', 'RID', 'RIG', 'RIM', 'ROB', 'ROD', 'ROT',
-            'ROW', 'RUB', 'RUG', 'RUM', 'RUN', 'RUT', 'SAD', 'SAG', 'SAT', 'SAW',
-            'SET', 'SEW', 'SHY', 'SIN', 'SIP', 'SIR', 'SIT', 'SIX', 'SKI', 'SKY',
-            'SOB', 'SON', 'SOT', 'SOW', 'SOY', 'SPA', 'SPY', 'STY', 'SUM', 'SUN',
-            'TAB', 'TAG', 'TAN', 'TAP', 'TAR', 'TAX', 'TEA', 'TEN', 'TIE', 'TIN',
-            'TIP', 'TOE', 'TON', 'TOP', 'TOT', 'TOW', 'TOY', 'TRY', 'TUB', 'TUG',
-            'VAN', 'VAT', 'VIA', 'VIE', 'VOW', 'WAD', 'WAG', 'WAR', 'WAX', 'WEB',
-            'WED', 'WET', 'WIG', 'WIN', 'WIT', 'WOE', 'WOK', 'WON', 'WOO', 'YAK',
-            'YAM', 'YAP', 'YAW', 'YEA', 'YES', 'YET', 'YEW', 'YIN', 'ZIP', 'ZOO'
-        }
-        
-        return common_words | three_letter_common
+        return set(COMMON_WORDS)
+    
+    def extract_tickers(self, text: str) -> List[str]:
+        """Tickers in raw message text, filtered by this checker's blacklist"""
+        return self.extractor.extract(text)
     
     def _load_existing_signals(self) -> List[Dict[str, Any]]:
         """Load existing signals from database for duplicate checking"""
@@ -151,6 +117,19 @@ class DataQualityChecker:
         
         return signals
     
+    def _index_signal(self, ticker: str, date_found: Any):
+        self._seen_days.add((ticker.upper(), date_found))
+        base = CANONICAL_TICKERS.get(ticker)
+        if base is not None:
+            self._seen_equivalents.setdefault(base, set()).add(ticker)
+    
+    def record_signal(self, signal: Dict[str, Any]):
+        """Count an accepted signal as existing for later duplicate checks"""
+        ticker = signal.get('ticker', '').strip().upper()
+        date_found = signal.get('date_found', datetime.now().strftime('%Y-%m-%d'))
+        self.existing_signals.append({'Ticker': ticker, 'Date_Found': date_found})
+        self._index_signal(ticker, date_found)
+    
     def validate_signal(self, signal: Dict[str, Any]) -> Tuple[bool, str, List[str]]:
         """
         Run 3-layer validation on signal
@@ -174,7 +153,7 @@ class DataQualityChecker:
         if not ticker:
             return (False, 'RED', ['Missing ticker'])
         
-        if not re.match(r'^[A-Z]{1,6}$', ticker):
+        if not TICKER_FORMAT.match(ticker):
             return (False, 'RED', [f'Invalid ticker format: {ticker}'])
         
         # Blacklist check
@@ -294,37 +273,21 @@ class DataQualityChecker:
         ticker = signal.get('ticker', '').upper()
         date_found = signal.get('date_found', datetime.now().strftime('%Y-%m-%d'))
         
-        for existing in self.existing_signals:
-            # Exact duplicate (same ticker, same day)
-            if existing.get('Ticker', '').upper() == ticker:
-                if existing.get('Date_Found') == date_found:
-                    return True
-        
-        # Check equivalent tickers (BTC vs WBTC)
-        if self._are_equivalent_tickers(ticker, [s.get('Ticker', '') for s in self.existing_signals]):
+        # Exact duplicate (same ticker, same day)
+        if (ticker, date_found) in self._seen_days:
             return True
         
-        return False
+        # Check equivalent tickers (BTC vs WBTC)
+        return self._are_equivalent_tickers(ticker)
     
-    def _are_equivalent_tickers(self, ticker: str, existing_tickers: List[str]) -> bool:
-        """Check if ticker is wrapped/equivalent version of existing"""
-        equivalents = {
-            'BTC': ['WBTC', 'BTCB', 'RENBTC'],
-            'ETH': ['WETH', 'BETH'],
-            'USD': ['USDT', 'USDC', 'BUSD', 'DAI', 'TUSD']
-        }
-        
-        for base, variants in equivalents.items():
-            if ticker == base:
-                # Check if any variant exists
-                if any(v in existing_tickers for v in variants):
-                    return True
-            elif ticker in variants:
-                # Check if base exists
-                if base in existing_tickers or any(v in existing_tickers for v in variants if v != ticker):
-                    return True
-        
-        return False
+    def _are_equivalent_tickers(self, ticker: str) -> bool:
+        """Check if ticker is wrapped/equivalent version of an existing one"""
+        base = CANONICAL_TICKERS.get(ticker)
+        if base is None:
+            return False
+        
+        # Any other member of the family (base or another variant) already exists
+        return any(existing != ticker for existing in self._seen_equivalents.get(base, ()))
     
     def batch_validate(self, signals: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
         """
@@ -345,6 +308,10 @@ class DataQualityChecker:
         for signal in signals:
             is_valid, status, reasons = self.validate_signal(signal)
             
+            # Later signals in the batch are checked against accepted ones
+            if is_valid:
+                self.record_signal(signal)
+            
             # Add validation metadata
             signal['validation_status'] = status
             signal['validation_reasons'] = '; '.join(reasons)
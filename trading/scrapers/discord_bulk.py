@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Discord Bulk Ingestion Helpers
+Shared rate limiting, paged history and cheap reaction counts for the
+Discord scrapers (DiscordFetcher, DumbMoneyScanner)
+
+Counting reactions used to mean `[user async for user in reaction.users()]`
+for every reaction on every message: one paginated API call per reaction,
+just to drop bot users. Channels were also scanned one after another with a
+fixed asyncio.sleep(0.5) between them. Here:
+
+- reaction.count (minus our own bot's reaction) is used by default, which
+  costs no API calls; users are only resolved, to drop bot reactions, for
+  messages whose total reactions exceed an engagement threshold
+- every request (history page, user lookup, channel fetch) goes through one
+  DiscordRateLimiter shared by all channels, so channels can be scanned
+  concurrently with asyncio.gather and stay under Discord's global limit
+  (discord.py still handles per-route buckets and 429 retries itself)
+
+Usage:
+    limiter = DiscordRateLimiter()
+    async for message in recent_messages(channel, cutoff, limiter, limit=1000):
+        reactions = await count_reactions(message, limiter)   # {'🚀': 12, ...}
+"""
+
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional
+
+RATE_PER_SECOND = 40       # Discord's global limit is 50 requests/s per bot
+MAX_IN_FLIGHT = 8          # Concurrent requests across all channels
+PAGE_SIZE = 100            # Messages per history request (Discord maximum)
+RESOLVE_USERS_ABOVE = 25   # Resolve reaction users only above this many reactions
+
+
+class DiscordRateLimiter:
+    """
+    Request pacing shared by every concurrent channel scan
+
+    `async with limiter:` around each API call: at most max_in_flight
+    calls run at once, and call starts are spaced 1/rate seconds apart.
+    """
+
+    def __init__(self, rate: float = RATE_PER_SECOND, max_in_flight: int = MAX_IN_FLIGHT):
+        self.interval = 1.0 / rate
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._next_at = 0.0
+        self.requests = 0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        # No await between reading and bumping _next_at: atomic on the event loop
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_at)
+        self._next_at = start + self.interval
+        self.requests += 1
+        if start > now:
+            await asyncio.sleep(start - now)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._semaphore.release()
+
+
+async def recent_messages(channel, cutoff: datetime,
+                          limiter: DiscordRateLimiter,
+                          limit: int = 1000) -> AsyncIterator:
+    """
+    Channel messages newer than cutoff (naive UTC), newest first
+
+    History is read one rate-limited page of up to 100 messages at a time
+    and stops at the first message older than cutoff.
+    """
+    before = None
+    fetched = 0
+    while fetched < limit:
+        size = min(PAGE_SIZE, limit - fetched)
+        async with limiter:
+            page = [m async for m in channel.history(limit=size, before=before)]
+        for message in page:
+            if message.created_at.replace(tzinfo=None) < cutoff:
+                return
+            yield message
+        fetched += len(page)
+        if len(page) < size:
+            return
+        before = page[-1]
+
+
+async def count_reactions(message,
+                          limiter: Optional[DiscordRateLimiter] = None,
+                          resolve_users_above: Optional[int] = RESOLVE_USERS_ABOVE) -> Dict[str, int]:
+    """
+    Human reaction count per emoji
+
+    Args:
+        message: discord.Message
+        limiter: Rate limiter for user lookups
+        resolve_users_above: Total reactions above which users are fetched
+            to exclude bots exactly (None: never; 0: always, the old
+            one-call-per-reaction behaviour)
+
+    Returns:
+        emoji → count (emojis with no human reactions left out)
+    """
+    reactions = message.reactions
+    resolve = (resolve_users_above is not None
+               and sum(r.count for r in reactions) > resolve_users_above)
+
+    counts = {}
+    for reaction in reactions:
+        if resolve:
+            # One request per 100 users; almost every reaction fits in one page
+            if limiter is not None:
+                async with limiter:
+                    users = [user async for user in reaction.users()]
+            else:
+                users = [user async for user in reaction.users()]
+            count = sum(1 for user in users if not user.bot)
+        else:
+            # reaction.me: our own bot reacted
+            count = reaction.count - (1 if getattr(reaction, 'me', False) else 0)
+
+        if count > 0:
+            counts[str(reaction.emoji)] = count
+    return counts
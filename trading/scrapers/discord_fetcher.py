@@ -2,14 +2,21 @@
 """
 Discord Message Fetcher - Automated message collection from multiple servers
 Replaces manual message passing with real Discord API integration
+
+Channels are fetched concurrently under one shared rate limiter, and
+reaction counts come from reaction.count: reaction users are only resolved
+(to exclude bots) on messages above --resolve-users-above reactions.
 """
 
 import asyncio
 import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
 
+from discord_bulk import (DiscordRateLimiter, RESOLVE_USERS_ABOVE,
+                          count_reactions, recent_messages)
+
 try:
     import discord
     from discord.ext import commands
@@ -21,13 +28,17 @@ except ImportError:
 class DiscordFetcher:
     """Fetch messages from Discord channels via bot"""
     
-    def __init__(self, token: str = None, config_file: str = 'config/channel_ids.json'):
+    def __init__(self, token: str = None, config_file: str = 'config/channel_ids.json',
+                 resolve_users_above: Optional[int] = RESOLVE_USERS_ABOVE):
         """
         Initialize Discord fetcher
         
         Args:
             token: Discord bot token (or set DISCORD_BOT_TOKEN env var)
             config_file: Path to channel ID configuration
+            resolve_users_above: Resolve reaction users (exact bot filtering)
+                only on messages with more reactions than this
+                (None: never, 0: every message)
         """
         self.token = token or os.getenv('DISCORD_BOT_TOKEN')
         if not self.token:
@@ -45,6 +56,10 @@ class DiscordFetcher:
         
         self.client = discord.Client(intents=intents)
         
+        # One request budget for every channel fetched concurrently
+        self.rate_limiter = DiscordRateLimiter()
+        self.resolve_users_above = resolve_users_above
+        
         # Storage for fetched messages
         self.fetched_messages = {}
     
@@ -110,22 +125,14 @@ class DiscordFetcher:
         cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
         
         try:
-            channel = await self.client.fetch_channel(channel_id)
+            async with self.rate_limiter:
+                channel = await self.client.fetch_channel(channel_id)
             
-            async for message in channel.history(limit=limit):
-                # Stop if we've gone past the cutoff time
-                if message.created_at.replace(tzinfo=None) < cutoff_time:
-                    break
-                
-                # Extract reactions
-                reactions = {}
-                for reaction in message.reactions:
-                    # Filter out bot reactions (optional)
-                    users = [user async for user in reaction.users()]
-                    human_count = sum(1 for user in users if not user.bot)
-                    
-                    if human_count > 0:
-                        reactions[str(reaction.emoji)] = human_count
+            # Newest first, stopping at the cutoff time
+            async for message in recent_messages(channel, cutoff_time, self.rate_limiter, limit):
+                # Extract reactions (bots filtered exactly only on high-engagement messages)
+                reactions = await count_reactions(message, self.rate_limiter,
+                                                  self.resolve_users_above)
                 
                 # Build message object
                 msg_data = {
@@ -157,7 +164,7 @@ class DiscordFetcher:
     
     async def fetch_all_configured_channels(self, hours_back: int = 24) -> Dict[str, List[Dict]]:
         """
-        Fetch messages from all channels in config
+        Fetch messages from all channels in config (concurrently)
         
         Args:
             hours_back: How many hours of history to fetch
@@ -165,7 +172,8 @@ class DiscordFetcher:
         Returns:
             Dictionary mapping server+channel names to message lists
         """
-        all_messages = {}
+        keys = []
+        fetches = []
         
         for server_name, server_config in self.channel_config.get('servers', {}).items():
             channels = server_config.get('channels', {})
@@ -177,18 +185,17 @@ class DiscordFetcher:
                 
                 print(f"Fetching {server_name}/{channel_name}...")
                 
-                messages = await self.fetch_channel_messages(
+                keys.append(f"{server_name}_{channel_name}")
+                fetches.append(self.fetch_channel_messages(
                     int(channel_id), 
                     hours_back=hours_back
-                )
-                
-                key = f"{server_name}_{channel_name}"
-                all_messages[key] = messages
-                
-                # Rate limit protection (Discord: 50 req/sec)
-                await asyncio.sleep(0.5)
+                ))
+        
+        # Rate limit protection (Discord: 50 req/sec) is the shared limiter
+        results = await asyncio.gather(*fetches)
+        print(f"📡 {len(keys)} channels, {self.rate_limiter.requests} API requests")
         
-        return all_messages
+        return dict(zip(keys, results))
     
     async def run_fetch(self, hours_back: int = 24, output_file: str = None):
         """
@@ -261,6 +268,9 @@ if __name__ == "__main__":
     parser.add_argument('--hours', type=int, default=24, help='Hours of history to fetch')
     parser.add_argument('--output', type=str, default='fetched_messages.json', help='Output JSON file')
     parser.add_argument('--config', type=str, default='config/channel_ids.json', help='Channel config file')
+    parser.add_argument('--resolve-users-above', type=int, default=RESOLVE_USERS_ABOVE,
+                        help='Resolve reaction users (exclude bots) on messages with more reactions '
+                             'than this (0 = every message)')
     
     args = parser.parse_args()
     
@@ -280,7 +290,8 @@ if __name__ == "__main__":
         exit(1)
     
     # Initialize fetcher
-    fetcher = DiscordFetcher(token=token, config_file=args.config)
+    fetcher = DiscordFetcher(token=token, config_file=args.config,
+                             resolve_users_above=args.resolve_users_above)
     
     # Run async fetch
     asyncio.run(fetcher.run_fetch(hours_back=args.hours, output_file=args.output))
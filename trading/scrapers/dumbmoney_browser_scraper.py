@@ -8,12 +8,13 @@ Usage:
 """
 
 import json
-import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+from ticker_extractor import TickerExtractor
 
 # Conviction emoji weights (same as bot scraper)
 CONVICTION_EMOJIS = {
@@ -27,31 +28,15 @@ CONVICTION_EMOJIS = {
     '⚡': 1.0,
 }
 
+# ALL CAPS words that aren't tickers ($-tagged mentions are always kept)
+EXCLUDED_WORDS = frozenset({'THIS', 'THAT', 'MAKE', 'JUST', 'OVER', 'MORE', 'SOME', 'VERY', 'ONLY',
+                            'LIKE', 'BEEN', 'WHEN', 'WILL', 'CALL', 'PUTS', 'SAME', 'FROM', 'WITH'})
+
+TICKER_EXTRACTOR = TickerExtractor(blacklist=EXCLUDED_WORDS, blacklist_cashtags=False)
+
 def extract_tickers(text):
     """Extract stock tickers from message text"""
-    if not text:
-        return []
-    
-    tickers = []
-    
-    # Match $TICKER format
-    dollar_tickers = re.findall(r'\$([A-Z]{1,5})\b', text)
-    tickers.extend(dollar_tickers)
-    
-    # Match standalone tickers (2-5 chars)
-    excluded = {'THIS', 'THAT', 'MAKE', 'JUST', 'OVER', 'MORE', 'SOME', 'VERY', 'ONLY', 'LIKE', 'BEEN', 'WHEN', 'WILL', 'CALL', 'PUTS', 'SAME', 'FROM', 'WITH'}
-    standalone = re.findall(r'\b([A-Z]{2,5})\b', text)
-    tickers.extend([t for t in standalone if t not in excluded])
-    
-    # Remove duplicates
-    seen = set()
-    unique = []
-    for t in tickers:
-        if t not in seen:
-            seen.add(t)
-            unique.append(t)
-    
-    return unique
+    return TICKER_EXTRACTOR.extract(text)
 
 def calculate_conviction(reactions):
     """Calculate conviction score from emoji reactions"""
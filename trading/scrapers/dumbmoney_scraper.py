@@ -3,16 +3,18 @@
 Dumb Money Discord Scraper - Social Arbitrage Signal Hunter
 Scans Discord for high-engagement stock picks before Wall Street notices
 
+Channels are scanned concurrently under one shared rate limiter.
+
 Usage:
     python3 dumbmoney_scraper.py --hours 24 --min-reactions 20
 """
 
 import asyncio
 import json
-import re
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
 
 try:
@@ -22,6 +24,10 @@ except ImportError:
     exit(1)
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+from ticker_extractor import TickerExtractor
+from discord_bulk import DiscordRateLimiter, count_reactions, recent_messages
+
 TOKEN_FILE = Path.home() / ".openclaw" / "workspace" / ".discord-bot-token"
 
 # Social arbitrage emoji indicators (high conviction)
@@ -36,11 +42,24 @@ CONVICTION_EMOJIS = {
     '⚡': 1.0,  # Lightning = quick move expected
 }
 
+# ALL CAPS words that aren't tickers ($-tagged mentions are always kept)
+EXCLUDED_WORDS = frozenset({'THIS', 'THAT', 'MAKE', 'JUST', 'OVER', 'MORE', 'SOME', 'VERY',
+                            'ONLY', 'LIKE', 'BEEN', 'WHEN', 'WILL', 'CALL', 'PUTS', 'SAME'})
+
+TICKER_EXTRACTOR = TickerExtractor(blacklist=EXCLUDED_WORDS, blacklist_cashtags=False)
+
 class DumbMoneyScanner:
     """Scan Dumb Money Discord for social arbitrage signals"""
     
-    def __init__(self, token: str = None):
-        """Initialize scanner with Discord bot token"""
+    def __init__(self, token: str = None, resolve_users_above: Optional[int] = None):
+        """
+        Initialize scanner with Discord bot token
+        
+        Args:
+            token: Discord bot token (default: token file or DISCORD_BOT_TOKEN)
+            resolve_users_above: Resolve reaction users to exclude bots on
+                messages with more reactions than this (None: reaction.count only)
+        """
         self.token = token or self._load_token()
         
         intents = discord.Intents.default()
@@ -50,6 +69,10 @@ class DumbMoneyScanner:
         
         self.client = discord.Client(intents=intents)
         self.signals = []
+        
+        # One request budget for every channel scanned concurrently
+        self.rate_limiter = DiscordRateLimiter()
+        self.resolve_users_above = resolve_users_above
     
     def _load_token(self) -> str:
         """Load Discord bot token from file"""
@@ -70,30 +93,7 @@ class DumbMoneyScanner:
         Extract stock tickers from message text
         Matches: $TICKER, TICKER (all caps), or common formats
         """
-        if not text:
-            return []
-        
-        tickers = []
-        
-        # Match $TICKER format (most common in trading Discord)
-        dollar_tickers = re.findall(r'\$([A-Z]{1,5})\b', text)
-        tickers.extend(dollar_tickers)
-        
-        # Match standalone ALL CAPS tickers (2-5 chars, common stock symbols)
-        # But exclude common words like "THIS", "MAKE", "JUST", etc.
-        excluded_words = {'THIS', 'THAT', 'MAKE', 'JUST', 'OVER', 'MORE', 'SOME', 'VERY', 'ONLY', 'LIKE', 'BEEN', 'WHEN', 'WILL', 'CALL', 'PUTS', 'SAME'}
-        standalone = re.findall(r'\b([A-Z]{2,5})\b', text)
-        tickers.extend([t for t in standalone if t not in excluded_words])
-        
-        # Remove duplicates, preserve order
-        seen = set()
-        unique_tickers = []
-        for ticker in tickers:
-            if ticker not in seen:
-                seen.add(ticker)
-                unique_tickers.append(ticker)
-        
-        return unique_tickers
+        return TICKER_EXTRACTOR.extract(text)
     
     def calculate_conviction_score(self, reactions: Dict[str, int]) -> float:
         """
@@ -133,31 +133,24 @@ class DumbMoneyScanner:
         cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
         
         try:
-            channel = await self.client.fetch_channel(channel_id)
+            async with self.rate_limiter:
+                channel = await self.client.fetch_channel(channel_id)
             print(f"📊 Scanning #{channel.name} (last {hours_back}h)...")
             
             message_count = 0
-            async for message in channel.history(limit=1000):
+            # Newest first, stopping at the cutoff time
+            async for message in recent_messages(channel, cutoff_time, self.rate_limiter, limit=1000):
                 message_count += 1
                 
-                # Stop if past cutoff
-                if message.created_at.replace(tzinfo=None) < cutoff_time:
-                    break
-                
                 # Extract tickers from message
                 tickers = self.extract_tickers(message.content)
                 if not tickers:
                     continue
                 
-                # Count reactions
-                reactions = {}
-                total_reaction_count = 0
-                
-                for reaction in message.reactions:
-                    emoji = str(reaction.emoji)
-                    count = reaction.count
-                    reactions[emoji] = count
-                    total_reaction_count += count
+                # Count reactions (reaction.count; users only resolved above the threshold)
+                reactions = await count_reactions(message, self.rate_limiter,
+                                                  self.resolve_users_above)
+                total_reaction_count = sum(reactions.values())
                 
                 # Filter: minimum reactions required
                 if total_reaction_count < min_reactions:
@@ -214,20 +207,25 @@ class DumbMoneyScanner:
         Returns:
             Combined list of all signals found
         """
-        all_signals = []
-        
-        for channel_id in channel_ids:
-            channel_signals = await self.scan_channel(
-                channel_id, 
-                hours_back=hours_back,
-                min_reactions=min_reactions
-            )
-            all_signals.extend(channel_signals)
-            
-            # Rate limit protection
-            await asyncio.sleep(0.5)
+        return await self.scan_channels(channel_ids, hours_back, min_reactions)
+    
+    async def scan_channels(
+        self,
+        channel_ids: List[int],
+        hours_back: int = 24,
+        min_reactions: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan channels concurrently (shared rate limiter)
         
-        return all_signals
+        Returns:
+            Combined list of all signals found, in channel_ids order
+        """
+        results = await asyncio.gather(*(
+            self.scan_channel(channel_id, hours_back=hours_back, min_reactions=min_reactions)
+            for channel_id in channel_ids
+        ))
+        return [signal for channel_signals in results for signal in channel_signals]
     
     def aggregate_signals(self, signals: List[Dict]) -> List[Dict]:
         """
@@ -306,14 +304,11 @@ class DumbMoneyScanner:
             print(f"🔍 Scanning {len(channel_ids)} channel(s)...")
             
             # Scan all channels
-            raw_signals = []
-            for channel_id in channel_ids:
-                signals = await self.scan_channel(
-                    channel_id,
-                    hours_back=hours_back,
-                    min_reactions=min_reactions
-                )
-                raw_signals.extend(signals)
+            raw_signals = await self.scan_channels(
+                channel_ids,
+                hours_back=hours_back,
+                min_reactions=min_reactions
+            )
             
             # Aggregate by ticker
             aggregated = self.aggregate_signals(raw_signals)
@@ -353,6 +348,9 @@ async def main():
     parser.add_argument('--hours', type=int, default=24, help='Hours of history')
     parser.add_argument('--min-reactions', type=int, default=5, help='Minimum reactions')
     parser.add_argument('--output', type=str, default='dumbmoney-signals.json', help='Output file')
+    parser.add_argument('--resolve-users-above', type=int, default=None,
+                        help='Exclude bot reactions on messages with more reactions than this '
+                             '(resolves reaction users; default: reaction counts only)')
     
     args = parser.parse_args()
     
@@ -370,7 +368,7 @@ async def main():
         return
     
     # Run scanner
-    scanner = DumbMoneyScanner()
+    scanner = DumbMoneyScanner(resolve_users_above=args.resolve_users_above)
     signals = await scanner.run_scan(
         channel_ids=channel_ids,
         hours_back=args.hours,
@@ -5,16 +5,27 @@ Monitors r/wallstreetbets, r/stocks, r/investing, r/stockmarket
 Tracks ticker mentions, sentiment, conviction signals for social arbitrage
 """
 
-import re
+import sys
 import json
 import csv
 import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict, Counter
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from ticker_extractor import TickerExtractor
+from mention_store import MentionStore, get_mention_store, zscore
+
 try:
     import praw
+    import prawcore
     from praw.models import Submission, Comment
     PRAW_AVAILABLE = True
 except ImportError:
@@ -31,6 +42,103 @@ except ImportError:
     print("⚠️  TextBlob not installed. Run: pip install textblob")
 
 
+# Blacklist common false positives
+TICKER_BLACKLIST = frozenset({
+    'I', 'A', 'THE', 'AND', 'FOR', 'ARE', 'CAN', 'CEO', 'CFO', 'USA',
+    'NYSE', 'NASDAQ', 'IMO', 'OP', 'DD', 'YOLO', 'WSB', 'ATH', 'ATL',
+    'AM', 'PM', 'EST', 'PST', 'UTC', 'IPO', 'ETF', 'SP', 'US', 'UK',
+    'RE', 'IT', 'AI', 'TO', 'OR', 'SO', 'GO', 'NO', 'ON', 'AT', 'BY',
+    'UP', 'ALL', 'NEW', 'OUT', 'NOW', 'EOD', 'AH'
+})
+
+# Standalone (no $) tickers only count in posts mentioning one of these
+FINANCIAL_KEYWORDS = ('stock', 'share', 'buy', 'sell', 'calls', 'puts',
+                      'price', 'target', 'earnings', 'revenue')
+
+TICKER_EXTRACTOR = TickerExtractor(blacklist=TICKER_BLACKLIST,
+                                   context_keywords=FINANCIAL_KEYWORDS)
+
+# Concurrent sweep (scrape_all_subreddits)
+ANALYSIS_WORKERS = 4    # Threads running ticker extraction / sentiment / scoring
+QUEUE_SIZE = 200        # Posts buffered between fetchers and analysis workers
+
+# Shared Reddit budget (RedditRateLimiter)
+RATE_SAMPLE_SECONDS = 60.0  # Recent request rate is measured over this span
+BURST_RESERVE = 10          # Requests always kept back from bursting
+
+
+class RedditRateLimiter:
+    """
+    Request budget shared by every PRAW client in the process
+
+    Reddit limits per OAuth client, so concurrent clients must share one
+    budget. Each response's X-Ratelimit-Remaining / X-Ratelimit-Reset
+    headers update it. Like prawcore, requests go out immediately while the
+    budget comfortably covers the current request rate until the reset;
+    only once consumption outpaces the window are requests spread evenly
+    over what is left of it, and they wait for the reset once it is used up.
+    """
+
+    def __init__(self, sample_seconds: float = RATE_SAMPLE_SECONDS,
+                 reserve: int = BURST_RESERVE):
+        self.remaining = None   # Requests left in the window (unknown until first response)
+        self.reset_at = 0.0     # monotonic time the window resets
+        self.next_at = 0.0      # Earliest time the next paced request may go out
+        self.sample_seconds = sample_seconds
+        self.reserve = reserve
+        self._recent = deque()  # monotonic start times of recent requests
+        self._lock = threading.Lock()
+
+    def _expected(self, now: float) -> float:
+        """Requests expected before the reset at the recent rate"""
+        while self._recent and self._recent[0] < now - self.sample_seconds:
+            self._recent.popleft()
+        return len(self._recent) / self.sample_seconds * (self.reset_at - now)
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            start = now
+            if self.remaining is not None and now < self.reset_at:
+                if self.remaining < 1:
+                    start = self.reset_at
+                elif self.remaining - self.reserve <= self._expected(now):
+                    # Outpacing the window: spread what is left evenly
+                    start = max(now, self.next_at)
+                    self.next_at = start + (self.reset_at - now) / self.remaining
+                self.remaining -= 1
+            self._recent.append(start)
+        if start > now:
+            time.sleep(start - now)
+
+    def update(self, headers):
+        try:
+            remaining = float(headers['x-ratelimit-remaining'])
+            reset = float(headers['x-ratelimit-reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._lock:
+            self.remaining = remaining
+            self.reset_at = time.monotonic() + reset
+
+
+SHARED_RATE_LIMITER = RedditRateLimiter()
+
+if PRAW_AVAILABLE:
+    class RateLimitedRequestor(prawcore.Requestor):
+        """prawcore Requestor that waits on, and feeds, a shared RedditRateLimiter"""
+
+        def __init__(self, *args, rate_limiter: RedditRateLimiter = SHARED_RATE_LIMITER, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.rate_limiter = rate_limiter
+
+        def request(self, *args, **kwargs):
+            self.rate_limiter.acquire()
+            response = super().request(*args, **kwargs)
+            self.rate_limiter.update(response.headers)
+            return response
+
+
 class RedditScraper:
     """Extract social sentiment signals from Reddit"""
     
@@ -43,7 +151,7 @@ class RedditScraper:
         """
         self.subreddits = ['wallstreetbets', 'stocks', 'investing', 'stockmarket']
         self.output_file = '../signals-database.csv'
-        self.cache_file = '../.reddit_cache.json'
+        self.mention_store: Optional[MentionStore] = None  # Default: get_mention_store()
         
         # Thresholds for conviction scoring
         self.min_upvotes = 50  # Minimum post upvotes for consideration
@@ -51,6 +159,10 @@ class RedditScraper:
         self.min_comments = 10  # Minimum comments for engagement
         self.high_comments = 100  # High engagement threshold
         
+        # Thresholds for unusual volume
+        self.volume_zscore = 3.0  # Mentions this many stdevs above the rolling mean
+        self.min_zscore_history = 10  # Past runs needed before z-scores are trusted
+        
         # Load config
         if config_path is None:
             config_path = '../config/reddit_config.json'
@@ -58,14 +170,10 @@ class RedditScraper:
         self.config = self._load_config(config_path)
         
         # Initialize Reddit API
+        self._local = threading.local()
         if PRAW_AVAILABLE and self.config:
             try:
-                self.reddit = praw.Reddit(
-                    client_id=self.config.get('client_id'),
-                    client_secret=self.config.get('client_secret'),
-                    user_agent=self.config.get('user_agent', 'OpenClaw Trading Signal Bot v1.0')
-                )
-                self.reddit.read_only = True
+                self.reddit = self._new_reddit()
                 print("✅ Reddit API initialized")
             except Exception as e:
                 print(f"❌ Reddit API init failed: {e}")
@@ -73,6 +181,34 @@ class RedditScraper:
         else:
             self.reddit = None
     
+    def _new_reddit(self):
+        """Read-only PRAW client on the shared rate-limit budget"""
+        reddit = praw.Reddit(
+            client_id=self.config.get('client_id'),
+            client_secret=self.config.get('client_secret'),
+            user_agent=self.config.get('user_agent', 'OpenClaw Trading Signal Bot v1.0'),
+            requestor_class=RateLimitedRequestor
+        )
+        reddit.read_only = True
+        return reddit
+    
+    def _thread_reddit(self):
+        """
+        Reddit client for the calling thread
+        
+        PRAW clients aren't thread-safe, so each fetcher thread gets its own
+        (all sharing SHARED_RATE_LIMITER). An injected non-PRAW client
+        (tests, mocks) is shared as-is.
+        """
+        if not (PRAW_AVAILABLE and self.config and isinstance(self.reddit, praw.Reddit)):
+            return self.reddit
+        if threading.current_thread() is threading.main_thread():
+            return self.reddit
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = self._local.reddit = self._new_reddit()
+        return reddit
+    
     def _load_config(self, config_path: str) -> Dict[str, str]:
         """Load Reddit API credentials from config file"""
         if not os.path.exists(config_path):
@@ -101,36 +237,7 @@ class RedditScraper:
         Returns:
             List of unique ticker symbols
         """
-        tickers = set()
-        
-        # Pattern 1: $TICKER (primary Reddit format)
-        dollar_tickers = re.findall(r'\$([A-Z]{1,5})\b', text)
-        tickers.update(dollar_tickers)
-        
-        # Pattern 2: TICKER surrounded by spaces or punctuation
-        # Only if text contains financial keywords
-        financial_keywords = ['stock', 'share', 'buy', 'sell', 'calls', 'puts', 
-                              'price', 'target', 'earnings', 'revenue', 'DD', 'YOLO']
-        
-        text_lower = text.lower()
-        has_financial_context = any(kw in text_lower for kw in financial_keywords)
-        
-        if has_financial_context:
-            standalone_tickers = re.findall(r'\b([A-Z]{2,5})\b', text)
-            tickers.update(standalone_tickers)
-        
-        # Blacklist common false positives
-        blacklist = {
-            'I', 'A', 'THE', 'AND', 'FOR', 'ARE', 'CAN', 'CEO', 'CFO', 'USA', 
-            'NYSE', 'NASDAQ', 'IMO', 'OP', 'DD', 'YOLO', 'WSB', 'ATH', 'ATL',
-            'AM', 'PM', 'EST', 'PST', 'UTC', 'IPO', 'ETF', 'SP', 'US', 'UK',
-            'RE', 'IT', 'AI', 'TO', 'OR', 'SO', 'GO', 'NO', 'ON', 'AT', 'BY',
-            'UP', 'ALL', 'NEW', 'OUT', 'NOW', 'EOD', 'AH', 'PM'
-        }
-        
-        tickers = {t for t in tickers if t not in blacklist}
-        
-        return list(tickers)
+        return TICKER_EXTRACTOR.extract(text)
     
     def analyze_sentiment(self, text: str) -> Tuple[str, float]:
         """
@@ -219,6 +326,62 @@ class RedditScraper:
         # Cap between 1-10
         return max(1, min(10, score))
     
+    def _eligible(self, submission) -> bool:
+        """Cheap listing-level filters (no text analysis)"""
+        # Skip stickied/pinned posts; check minimum engagement
+        return not submission.stickied and submission.score >= self.min_upvotes
+    
+    def analyze_submission(self, subreddit_name: str, submission) -> List[Dict[str, Any]]:
+        """
+        Ticker signals for one post (one per ticker mentioned)
+        
+        Args:
+            subreddit_name: Subreddit the post came from
+            submission: Reddit submission object
+            
+        Returns:
+            List of signal dictionaries (empty if no tickers)
+        """
+        # Extract tickers from title and selftext
+        text = f"{submission.title} {submission.selftext}"
+        tickers = self.extract_tickers(text)
+        
+        if not tickers:
+            return []
+        
+        # Analyze sentiment
+        sentiment, polarity = self.analyze_sentiment(text)
+        
+        # Get comment count
+        comment_count = submission.num_comments
+        
+        # Calculate conviction
+        conviction = self.calculate_conviction_score(
+            submission, sentiment, comment_count
+        )
+        
+        # Create signal for each ticker mentioned
+        return [
+            {
+                'ticker': ticker,
+                'source': f'Reddit-{subreddit_name}',
+                'subreddit': subreddit_name,
+                'post_id': submission.id,
+                'post_title': submission.title[:150],
+                'post_url': f"https://reddit.com{submission.permalink}",
+                'upvotes': submission.score,
+                'comments': comment_count,
+                'upvote_ratio': getattr(submission, 'upvote_ratio', 0),
+                'gilded': submission.gilded,
+                'sentiment': sentiment,
+                'sentiment_score': round(polarity, 2),
+                'conviction_score': conviction,
+                'timestamp': datetime.fromtimestamp(submission.created_utc).isoformat(),
+                'text_snippet': text[:300]
+            }
+            for ticker in tickers
+        ]
+    
     def scrape_subreddit(self, subreddit_name: str, 
                          time_filter: str = 'day',
                          limit: int = 100) -> List[Dict[str, Any]]:
@@ -240,57 +403,12 @@ class RedditScraper:
         signals = []
         
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
+            subreddit = self._thread_reddit().subreddit(subreddit_name)
             
             # Get hot posts (most engaging right now)
             for submission in subreddit.hot(limit=limit):
-                # Skip stickied/pinned posts
-                if submission.stickied:
-                    continue
-                
-                # Check minimum engagement
-                if submission.score < self.min_upvotes:
-                    continue
-                
-                # Extract tickers from title and selftext
-                text = f"{submission.title} {submission.selftext}"
-                tickers = self.extract_tickers(text)
-                
-                if not tickers:
-                    continue
-                
-                # Analyze sentiment
-                sentiment, polarity = self.analyze_sentiment(text)
-                
-                # Get comment count
-                comment_count = submission.num_comments
-                
-                # Calculate conviction
-                conviction = self.calculate_conviction_score(
-                    submission, sentiment, comment_count
-                )
-                
-                # Create signal for each ticker mentioned
-                for ticker in tickers:
-                    signal = {
-                        'ticker': ticker,
-                        'source': f'Reddit-{subreddit_name}',
-                        'subreddit': subreddit_name,
-                        'post_id': submission.id,
-                        'post_title': submission.title[:150],
-                        'post_url': f"https://reddit.com{submission.permalink}",
-                        'upvotes': submission.score,
-                        'comments': comment_count,
-                        'upvote_ratio': getattr(submission, 'upvote_ratio', 0),
-                        'gilded': submission.gilded,
-                        'sentiment': sentiment,
-                        'sentiment_score': round(polarity, 2),
-                        'conviction_score': conviction,
-                        'timestamp': datetime.fromtimestamp(submission.created_utc).isoformat(),
-                        'text_snippet': text[:300]
-                    }
-                    
-                    signals.append(signal)
+                if self._eligible(submission):
+                    signals.extend(self.analyze_submission(subreddit_name, submission))
             
             print(f"✅ {subreddit_name}: Found {len(signals)} ticker mentions")
         
@@ -300,23 +418,83 @@ class RedditScraper:
         return signals
     
     def scrape_all_subreddits(self, time_filter: str = 'day', 
-                               limit_per_sub: int = 100) -> List[Dict[str, Any]]:
+                               limit_per_sub: int = 100,
+                               fetch_workers: Optional[int] = None,
+                               analysis_workers: int = ANALYSIS_WORKERS) -> List[Dict[str, Any]]:
         """
-        Scrape all configured subreddits
+        Scrape all configured subreddits concurrently
+        
+        Fetcher threads (one per subreddit by default)
+        page through subreddit.hot and push eligible posts onto a bounded
+        queue; analysis workers pull posts off it and run ticker extraction,
+        sentiment and conviction scoring. Every fetcher waits on the shared
+        Reddit rate limiter, so the sweep takes about as long as the slowest
+        subreddit while staying inside Reddit's budget.
         
         Args:
             time_filter: Time range for posts
             limit_per_sub: Max posts per subreddit
+            fetch_workers: Subreddits fetched at once (default: all of them)
+            analysis_workers: Post analysis threads
             
         Returns:
-            Combined list of all signals
+            Combined list of all signals (subreddit order, then listing order)
         """
-        all_signals = []
+        if not self.reddit:
+            print(f"❌ Reddit API not available")
+            return []
         
         print(f"🔍 Scraping {len(self.subreddits)} subreddits...")
         
-        for subreddit in self.subreddits:
-            signals = self.scrape_subreddit(subreddit, time_filter, limit_per_sub)
+        posts = queue.Queue(maxsize=QUEUE_SIZE)
+        # subreddit → [(listing position, signals)]
+        found = {name: [] for name in self.subreddits}
+        failed = set()
+        
+        def fetch(subreddit_name: str):
+            try:
+                subreddit = self._thread_reddit().subreddit(subreddit_name)
+                for position, submission in enumerate(subreddit.hot(limit=limit_per_sub)):
+                    if self._eligible(submission):
+                        posts.put((subreddit_name, position, submission))
+            except Exception as e:
+                failed.add(subreddit_name)
+                print(f"❌ Error scraping r/{subreddit_name}: {e}")
+        
+        def analyze():
+            while True:
+                item = posts.get()
+                if item is None:
+                    return
+                subreddit_name, position, submission = item
+                try:
+                    signals = self.analyze_submission(subreddit_name, submission)
+                except Exception as e:
+                    print(f"⚠️  r/{subreddit_name} post {getattr(submission, 'id', '?')}: {e}")
+                    continue
+                if signals:
+                    found[subreddit_name].append((position, signals))
+        
+        workers = [threading.Thread(target=analyze, daemon=True)
+                   for _ in range(max(1, analysis_workers))]
+        for worker in workers:
+            worker.start()
+        
+        with ThreadPoolExecutor(max_workers=max(1, fetch_workers or len(self.subreddits)),
+                                thread_name_prefix='reddit-fetch') as pool:
+            list(pool.map(fetch, self.subreddits))
+        
+        for _ in workers:
+            posts.put(None)
+        for worker in workers:
+            worker.join()
+        
+        all_signals = []
+        for subreddit_name in self.subreddits:
+            signals = [signal for _, batch in sorted(found[subreddit_name], key=lambda f: f[0])
+                       for signal in batch]
+            if subreddit_name not in failed:
+                print(f"✅ {subreddit_name}: Found {len(signals)} ticker mentions")
             all_signals.extend(signals)
         
         print(f"\n📊 Total signals extracted: {len(all_signals)}")
@@ -410,7 +588,11 @@ class RedditScraper:
         """
         Flag tickers with unusual mention volume
         
-        Compares current mentions to historical baseline from cache
+        Compares current mentions to each ticker's rolling baseline in the
+        mention store (mean / stdev of past runs), then appends this run:
+        - enough history: flag at volume_zscore stdevs above the mean
+        - short or flat history: flag if current > 3x historical average
+        - new ticker: flag if high mentions
         
         Args:
             current_signals: Current aggregated signals
@@ -418,78 +600,34 @@ class RedditScraper:
         Returns:
             Signals with unusual_volume flag added
         """
-        # Load historical data
-        baseline = self._load_cache()
+        store = self.mention_store or get_mention_store()
+        baselines = store.record({s['ticker']: s['mentions'] for s in current_signals},
+                                 source='reddit')
         
         for signal in current_signals:
-            ticker = signal['ticker']
             current_mentions = signal['mentions']
+            baseline = baselines[signal['ticker']]
             
-            # Get historical average
-            if ticker in baseline:
-                hist_mentions = baseline[ticker].get('avg_mentions', 0)
+            if baseline['n']:
+                hist_mentions = baseline['mean']
+                z = zscore(current_mentions, baseline) if baseline['n'] >= self.min_zscore_history else None
                 
-                # Flag if current > 3x historical average
-                if hist_mentions > 0 and current_mentions > hist_mentions * 3:
-                    signal['unusual_volume'] = True
-                    signal['volume_multiplier'] = round(current_mentions / hist_mentions, 1)
+                if z is not None:
+                    signal['volume_zscore'] = round(z, 2)
+                    unusual = z >= self.volume_zscore
                 else:
-                    signal['unusual_volume'] = False
+                    # Flag if current > 3x historical average
+                    unusual = hist_mentions > 0 and current_mentions > hist_mentions * 3
+                
+                signal['unusual_volume'] = unusual
+                if unusual and hist_mentions > 0:
+                    signal['volume_multiplier'] = round(current_mentions / hist_mentions, 1)
             else:
                 # New ticker, flag if high mentions
                 signal['unusual_volume'] = current_mentions >= 5
         
-        # Update cache
-        self._update_cache(current_signals)
-        
         return current_signals
     
-    def _load_cache(self) -> Dict[str, Any]:
-        """Load historical mention data from cache"""
-        if not os.path.exists(self.cache_file):
-            return {}
-        
-        try:
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-    
-    def _update_cache(self, signals: List[Dict[str, Any]]):
-        """Update cache with current mention data"""
-        cache = self._load_cache()
-        
-        timestamp = datetime.now().isoformat()
-        
-        for signal in signals:
-            ticker = signal['ticker']
-            
-            if ticker not in cache:
-                cache[ticker] = {
-                    'history': [],
-                    'avg_mentions': 0
-                }
-            
-            # Add to history (keep last 30 days)
-            cache[ticker]['history'].append({
-                'timestamp': timestamp,
-                'mentions': signal['mentions']
-            })
-            
-            # Keep only last 30 entries
-            cache[ticker]['history'] = cache[ticker]['history'][-30:]
-            
-            # Recalculate average
-            mention_counts = [h['mentions'] for h in cache[ticker]['history']]
-            cache[ticker]['avg_mentions'] = sum(mention_counts) / len(mention_counts)
-        
-        # Save cache
-        try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache, f, indent=2)
-        except Exception as e:
-            print(f"⚠️  Cache save error: {e}")
-    
     def assign_status(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Assign GREEN/YELLOW/RED status based on conviction + sentiment
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Reddit Stream Mode
+Long-running Reddit ingestion with rolling per-ticker mention counters
+
+RedditScraper.run is a batch job: pull hot(limit), aggregate, compare with
+the mention cache, repeat on the next cron tick. RedditStream instead
+follows subreddit.stream.submissions (and .comments) for all configured
+subreddits and counts each ticker mention the moment it is posted.
+
+Every ticker keeps one time-bucketed ring buffer per window:
+
+    1h   60 x 1 minute buckets
+    24h  96 x 15 minute buckets
+    7d  168 x 1 hour buckets
+
+Adding a mention and reading a window total are O(1) (amortized: expired
+buckets are zeroed as the clock advances), so checking a ticker for
+unusual volume is a lookup rather than a cache reload. A ticker is unusual
+when its last-hour mentions exceed 3x its hourly average over the rest of
+the 7d window (the same 3x rule as the batch scraper), or, with no history
+yet, when it reaches 5 mentions in the hour. Spikes alert within seconds of
+the posts that cause them.
+
+Usage:
+    python reddit_stream.py                       # configured subreddits, posts + comments
+    python reddit_stream.py --no-comments --subreddits wallstreetbets stocks
+
+    stream = RedditStream(RedditScraper(), on_alert=print_alert)
+    stream.run()
+    stream.tracker.counts('ASTS')                 # {'1h': 12, '24h': 40, '7d': 95}
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from reddit_scraper import RedditScraper
+
+# window name → (span seconds, bucket seconds)
+WINDOWS: Dict[str, Tuple[int, int]] = {
+    '1h': (3600, 60),
+    '24h': (86400, 900),
+    '7d': (7 * 86400, 3600),
+}
+
+SPIKE_MULTIPLIER = 3.0   # Last hour vs. baseline hourly average (as detect_unusual_volume)
+MIN_MENTIONS = 5         # Last-hour mentions needed to flag at all (new tickers: this alone)
+ALERT_COOLDOWN = 3600    # Seconds before the same ticker can alert again
+
+
+class RollingWindow:
+    """Fixed-span event count over a ring of time buckets"""
+
+    __slots__ = ('bucket_seconds', 'buckets', 'total', '_head')
+
+    def __init__(self, span: int, bucket_seconds: int):
+        self.bucket_seconds = bucket_seconds
+        self.buckets = [0] * max(1, span // bucket_seconds)
+        self.total = 0
+        self._head: Optional[int] = None   # Absolute index of the newest bucket
+
+    def _advance(self, index: int):
+        head = self._head
+        if head is None or index >= head + len(self.buckets):
+            if head is not None:
+                self.buckets = [0] * len(self.buckets)
+                self.total = 0
+            self._head = index
+            return
+        n = len(self.buckets)
+        for i in range(head + 1, index + 1):
+            slot = i % n
+            self.total -= self.buckets[slot]
+            self.buckets[slot] = 0
+        if index > head:
+            self._head = index
+
+    def add(self, timestamp: float, count: int = 1):
+        """Count events at timestamp (ones already outside the window are dropped)"""
+        index = int(timestamp // self.bucket_seconds)
+        self._advance(index)
+        if index <= self._head - len(self.buckets):
+            return
+        self.buckets[index % len(self.buckets)] += count
+        self.total += count
+
+    def count(self, now: float) -> int:
+        """Events within the window ending at now"""
+        self._advance(int(now // self.bucket_seconds))
+        return self.total
+
+
+class MentionTracker:
+    """Per-ticker 1h / 24h / 7d mention windows with O(1) unusual-volume checks"""
+
+    def __init__(self,
+                 windows: Dict[str, Tuple[int, int]] = WINDOWS,
+                 multiplier: float = SPIKE_MULTIPLIER,
+                 min_mentions: int = MIN_MENTIONS,
+                 started: Optional[float] = None):
+        """
+        Args:
+            windows: window name → (span seconds, bucket seconds); must
+                include '1h' and '7d'
+            multiplier: Spike threshold vs. baseline hourly average
+            min_mentions: Last-hour mentions needed to flag a ticker
+            started: When counting began (default: now); the baseline only
+                averages over hours the tracker has actually observed
+        """
+        self.windows = dict(windows)
+        self.multiplier = multiplier
+        self.min_mentions = min_mentions
+        self.started = time.time() if started is None else started
+        self._tickers: Dict[str, Dict[str, RollingWindow]] = {}
+
+    def _windows_for(self, ticker: str) -> Dict[str, RollingWindow]:
+        windows = self._tickers.get(ticker)
+        if windows is None:
+            windows = self._tickers[ticker] = {
+                name: RollingWindow(span, bucket) for name, (span, bucket) in self.windows.items()
+            }
+        return windows
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._tickers
+
+    def __len__(self) -> int:
+        return len(self._tickers)
+
+    def record(self, ticker: str, timestamp: Optional[float] = None, count: int = 1):
+        """Count mention(s) of ticker at timestamp (default: now)"""
+        timestamp = time.time() if timestamp is None else timestamp
+        for window in self._windows_for(ticker).values():
+            window.add(timestamp, count)
+
+    def counts(self, ticker: str, now: Optional[float] = None) -> Dict[str, int]:
+        """window name → mentions of ticker"""
+        now = time.time() if now is None else now
+        windows = self._tickers.get(ticker)
+        if windows is None:
+            return {name: 0 for name in self.windows}
+        return {name: window.count(now) for name, window in windows.items()}
+
+    def volume(self, ticker: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Unusual-volume verdict for one ticker
+
+        Returns:
+            {'unusual_volume': bool, 'volume_multiplier': float or None,
+             'mentions_1h': int, 'mentions_24h': int, 'mentions_7d': int,
+             'baseline_hourly': float}
+        """
+        now = time.time() if now is None else now
+        counts = self.counts(ticker, now)
+        hour, week = counts['1h'], counts['7d']
+
+        # Hours of 7d history before the current hour that we actually observed
+        week_span = self.windows['7d'][0]
+        observed = min(now - self.started, week_span) / 3600 - 1
+        baseline = (week - hour) / observed if observed >= 1 else 0.0
+
+        result = {f'mentions_{name}': n for name, n in counts.items()}
+        result['baseline_hourly'] = round(baseline, 2)
+        if baseline > 0:
+            multiplier = hour / baseline
+            result['volume_multiplier'] = round(multiplier, 1)
+            result['unusual_volume'] = hour >= self.min_mentions and multiplier > self.multiplier
+        else:
+            # No history: flag on raw volume
+            result['volume_multiplier'] = None
+            result['unusual_volume'] = hour >= self.min_mentions
+        return result
+
+    def is_unusual(self, ticker: str, now: Optional[float] = None) -> bool:
+        return self.volume(ticker, now)['unusual_volume']
+
+    def detect_unusual_volume(self, signals: List[Dict[str, Any]],
+                              now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """RedditScraper.detect_unusual_volume contract, from the live windows"""
+        for signal in signals:
+            volume = self.volume(signal['ticker'], now)
+            signal['unusual_volume'] = volume['unusual_volume']
+            if volume['unusual_volume'] and volume['volume_multiplier'] is not None:
+                signal['volume_multiplier'] = volume['volume_multiplier']
+        return signals
+
+    def top(self, n: int = 10, window: str = '1h', now: Optional[float] = None) -> List[Tuple[str, int]]:
+        """Most-mentioned tickers in a window"""
+        now = time.time() if now is None else now
+        totals = ((ticker, w[window].count(now)) for ticker, w in self._tickers.items())
+        return sorted((t for t in totals if t[1]), key=lambda t: t[1], reverse=True)[:n]
+
+
+class RedditStream:
+    """Follows new posts/comments and raises mention-spike alerts as they happen"""
+
+    def __init__(self, scraper: RedditScraper,
+                 subreddits: Optional[Iterable[str]] = None,
+                 comments: bool = True,
+                 tracker: Optional[MentionTracker] = None,
+                 on_alert: Optional[Callable[[Dict], None]] = None,
+                 cooldown: float = ALERT_COOLDOWN):
+        """
+        Args:
+            scraper: Configured RedditScraper (API client + text analysis)
+            subreddits: Subreddits to follow (default: scraper.subreddits)
+            comments: Also count mentions in comments
+            tracker: MentionTracker to update (default: a new one)
+            on_alert: Called with each spike alert
+            cooldown: Seconds before the same ticker can alert again
+        """
+        self.scraper = scraper
+        self.subreddits = list(subreddits or scraper.subreddits)
+        self.comments = comments
+        self.tracker = tracker or MentionTracker()
+        self.on_alert = on_alert
+        self.cooldown = cooldown
+        self.latest: Dict[str, Dict[str, Any]] = {}   # ticker → most recent mention
+        self._alerted: Dict[str, float] = {}          # ticker → last alert time
+        self.seen = 0
+
+    # ------------------------------------------------------------------
+    # Items
+    # ------------------------------------------------------------------
+
+    def on_submission(self, submission) -> List[Dict]:
+        """Count a new post's tickers; returns alerts it triggered"""
+        if getattr(submission, 'stickied', False):
+            return []
+        signals = self.scraper.analyze_submission(str(submission.subreddit), submission)
+        return self._record(submission.created_utc, signals)
+
+    def on_comment(self, comment) -> List[Dict]:
+        """Count a new comment's tickers; returns alerts it triggered"""
+        body = comment.body or ''
+        tickers = self.scraper.extract_tickers(body)
+        if not tickers:
+            return []
+        subreddit = str(comment.subreddit)
+        signals = [{
+            'ticker': ticker,
+            'source': f'Reddit-{subreddit}',
+            'subreddit': subreddit,
+            'post_id': comment.id,
+            'post_url': f"https://reddit.com{comment.permalink}",
+            'upvotes': comment.score,
+            'timestamp': datetime.fromtimestamp(comment.created_utc).isoformat(),
+            'text_snippet': body[:300]
+        } for ticker in tickers]
+        return self._record(comment.created_utc, signals)
+
+    def _record(self, created: float, signals: List[Dict[str, Any]]) -> List[Dict]:
+        self.seen += 1
+        now = time.time()
+        alerts = []
+        for signal in signals:
+            ticker = signal['ticker']
+            self.tracker.record(ticker, created)
+            self.latest[ticker] = signal
+            if now - self._alerted.get(ticker, float('-inf')) < self.cooldown:
+                continue
+            volume = self.tracker.volume(ticker, now)
+            if volume['unusual_volume']:
+                self._alerted[ticker] = now
+                alerts.append({**volume, 'ticker': ticker, 'subreddit': signal['subreddit'],
+                               'post_url': signal['post_url'],
+                               'timestamp': datetime.now().isoformat()})
+        if self.on_alert:
+            for alert in alerts:
+                self.on_alert(alert)
+        return alerts
+
+    # ------------------------------------------------------------------
+    # Streams
+    # ------------------------------------------------------------------
+
+    def run(self, max_items: Optional[int] = None):
+        """
+        Follow the streams until Ctrl-C (or max_items posts/comments)
+
+        Posts and comments are multiplexed on one thread with PRAW's
+        pause_after=-1, which yields None whenever a stream has nothing new.
+        """
+        if not self.scraper.reddit:
+            print("❌ Reddit API not available")
+            return
+
+        subreddit = self.scraper.reddit.subreddit('+'.join(self.subreddits))
+        streams = [(subreddit.stream.submissions(skip_existing=True, pause_after=-1),
+                    self.on_submission)]
+        if self.comments:
+            streams.append((subreddit.stream.comments(skip_existing=True, pause_after=-1),
+                            self.on_comment))
+
+        print(f"📡 Streaming {len(self.subreddits)} subreddits "
+              f"({'posts + comments' if self.comments else 'posts'})...")
+        while max_items is None or self.seen < max_items:
+            for stream, handle in streams:
+                for item in stream:
+                    if item is None:
+                        break
+                    try:
+                        handle(item)
+                    except Exception as e:
+                        print(f"⚠️  Stream item {getattr(item, 'id', '?')}: {e}")
+                    if max_items is not None and self.seen >= max_items:
+                        return
+
+
+def print_alert(alert: Dict):
+    multiplier = alert['volume_multiplier']
+    spike = f"{multiplier}x baseline" if multiplier is not None else "new ticker"
+    print(f"[{alert['timestamp']}] 🚨 {alert['ticker']}: {alert['mentions_1h']} mentions in 1h "
+          f"({spike}, {alert['mentions_24h']} in 24h) | r/{alert['subreddit']} {alert['post_url']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream Reddit and alert on ticker mention spikes')
+    parser.add_argument('--subreddits', nargs='+', help='Subreddits to follow (default: configured)')
+    parser.add_argument('--no-comments', action='store_true', help='Only follow new posts')
+    parser.add_argument('--config', default=None, help='reddit_config.json path')
+    args = parser.parse_args()
+
+    scraper = RedditScraper(args.config)
+    if not scraper.reddit:
+        print("❌ Reddit API not configured (see REDDIT-SETUP.md)")
+        return
+
+    stream = RedditStream(scraper, subreddits=args.subreddits,
+                          comments=not args.no_comments, on_alert=print_alert)
+    try:
+        stream.run()
+    except KeyboardInterrupt:
+        print(f"\n📊 Top mentions (1h) after {stream.seen} items:")
+        for ticker, count in stream.tracker.top():
+            print(f"   {ticker:8} {count}")
+
+
+if __name__ == "__main__":
+    main()
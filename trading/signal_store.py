@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Signal Store for roostr Trading
+SQLite-backed replacement for signals-database.csv
+
+Every signal lives in one row of trading/signals-database.db (WAL mode, so
+readers never block the cron jobs writing to it). Writes are row-level
+upserts instead of whole-file rewrites, and lookups by ticker, date found
+or status are index hits.
+
+signals-database.csv is kept as an exported mirror for scripts that still
+read it directly: sync_csv() pulls in rows and cells legacy writers
+changed in the CSV since the last export, then re-exports the full table.
+
+Usage:
+    store = get_signal_store()
+    store.upsert({'Ticker': 'NVDA', 'Source': 'manual', 'Date_Found': '2026-02-18',
+                  'Conviction_Score': 9.2, 'Status': 'new'})
+    latest = store.latest('NVDA')
+    deployed = store.query(deployed='YES')
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(BASE_DIR, 'signals-database.db')
+LEGACY_CSV = os.path.join(BASE_DIR, 'signals-database.csv')
+
+# Canonical schema
+TEXT_COLUMNS = ['Ticker', 'Source', 'Date_Found', 'Status', 'Deployed',
+                'Date_Entry', 'Asset_Class', 'Catalyst', 'Notes']
+REAL_COLUMNS = ['Price_Entry', 'Conviction_Score', 'Position_Size', 'Stop_Loss',
+                'Target_1', 'Target_2', 'Current_Price', 'PnL_Dollars', 'PnL_Percent',
+                'Entry_Clarity']
+COLUMNS = ['Ticker', 'Source', 'Date_Found', 'Price_Entry', 'Conviction_Score', 'Status',
+           'Deployed', 'Position_Size', 'Stop_Loss', 'Target_1', 'Target_2',
+           'Current_Price', 'PnL_Dollars', 'PnL_Percent', 'Notes',
+           'Date_Entry', 'Asset_Class', 'Catalyst', 'Entry_Clarity']
+
+# Header of the signals-database.csv mirror (what legacy readers expect);
+# other non-empty columns follow it
+LEGACY_HEADER = ['ticker', 'source', 'conviction', 'date_found', 'catalyst', 'status',
+                 'entry_clarity']
+
+# Lowercase / legacy field names written by older scanners
+COLUMN_ALIASES = {
+    'ticker': 'Ticker',
+    'symbol': 'Ticker',
+    'source': 'Source',
+    'date_found': 'Date_Found',
+    'found_date': 'Date_Found',
+    'conviction': 'Conviction_Score',
+    'conviction_score': 'Conviction_Score',
+    'status': 'Status',
+    'deployed': 'Deployed',
+    'price_entry': 'Price_Entry',
+    'entry_price': 'Price_Entry',
+    'current_price': 'Current_Price',
+    'position_size': 'Position_Size',
+    'stop_loss': 'Stop_Loss',
+    'target_1': 'Target_1',
+    'target_2': 'Target_2',
+    'date_entry': 'Date_Entry',
+    'asset_class': 'Asset_Class',
+    'catalyst': 'Catalyst',
+    'notes': 'Notes',
+    'entry_clarity': 'Entry_Clarity'
+}
+
+# Unique (Ticker, Date_Found) index doubles as the ticker index
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    {', '.join(f'{c} TEXT' for c in TEXT_COLUMNS)},
+    {', '.join(f'{c} REAL' for c in REAL_COLUMNS)},
+    extra TEXT,
+    updated_at TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_signals_ticker ON signals (Ticker, Date_Found);
+CREATE INDEX IF NOT EXISTS idx_signals_date_found ON signals (Date_Found);
+CREATE INDEX IF NOT EXISTS idx_signals_status ON signals (Status);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def _to_real(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return None if value != value else float(value)  # NaN → NULL
+    text = str(value).strip().replace(',', '').replace('$', '')
+    if not text or text.lower() in ('nan', 'none', 'n/a'):
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _to_text(value):
+    if value is None:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def normalize_signal(signal: Dict) -> Dict:
+    """Map a signal dict (any legacy schema) onto canonical columns + extras"""
+    row: Dict = {}
+    extra: Dict = {}
+    for key, value in signal.items():
+        if key in ('id', 'extra', 'updated_at'):
+            continue
+        column = key if key in COLUMNS else COLUMN_ALIASES.get(key.lower() if key else key)
+        if column is None:
+            if _to_text(value) is not None:
+                extra[key] = value
+            continue
+        row[column] = _to_real(value) if column in REAL_COLUMNS else _to_text(value)
+
+    if row.get('Ticker'):
+        row['Ticker'] = row['Ticker'].upper()
+    if 'Date_Found' in row:
+        # Key column: '' (not NULL) so undated signals still dedupe
+        row['Date_Found'] = row['Date_Found'] or ''
+    if extra:
+        row['extra'] = json.dumps(extra, default=str)
+    return row
+
+
+def _legacy_name(column: str) -> str:
+    """CSV mirror field name for a canonical column"""
+    return {'Conviction_Score': 'conviction'}.get(column, column.lower())
+
+
+def _canonical_name(field: str) -> Optional[str]:
+    if field in COLUMNS:
+        return field
+    return COLUMN_ALIASES.get(field.lower() if field else field)
+
+
+def _row_key(signal: Dict) -> str:
+    """(Ticker, Date_Found) of a canonical signal, as one string"""
+    return f"{signal.get('Ticker') or ''}|{signal.get('Date_Found') or ''}"
+
+
+class SignalStore:
+    """Indexed SQLite signal database with upsert/query APIs"""
+
+    def __init__(self, db_path: str = DEFAULT_DB, timeout: float = 30.0):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=timeout, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        signal = {c: row[c] for c in COLUMNS}
+        signal['id'] = row['id']
+        if row['extra']:
+            for key, value in json.loads(row['extra']).items():
+                signal.setdefault(key, value)
+        return signal
+
+    def _fetch(self, sql: str, params: Iterable = ()) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(sql, tuple(params)).fetchall()
+        return [self._row_to_dict(r) for r in rows]
+
+    # ------------------------------------------------------------------
+    # Write API
+    # ------------------------------------------------------------------
+
+    def _write_many(self, signals: Iterable[Dict], on_conflict: str) -> int:
+        now = datetime.now().isoformat()
+        written = 0
+        with self._lock, self._conn:
+            for signal in signals:
+                row = normalize_signal(signal)
+                if not row.get('Ticker'):
+                    continue
+                row.setdefault('Date_Found', '')
+                row['updated_at'] = now
+
+                columns = list(row)
+                placeholders = ', '.join('?' for _ in columns)
+                sql = f"INSERT INTO signals ({', '.join(columns)}) VALUES ({placeholders}) "
+                if on_conflict == 'update':
+                    updates = ', '.join(f'{c} = excluded.{c}' for c in columns
+                                        if c not in ('Ticker', 'Date_Found'))
+                    sql += f"ON CONFLICT (Ticker, Date_Found) DO UPDATE SET {updates}"
+                elif on_conflict == 'merge':
+                    # Blank cells never overwrite stored values
+                    updates = ', '.join(f'{c} = COALESCE(excluded.{c}, {c})' for c in columns
+                                        if c not in ('Ticker', 'Date_Found'))
+                    sql += f"ON CONFLICT (Ticker, Date_Found) DO UPDATE SET {updates}"
+                else:
+                    sql += "ON CONFLICT (Ticker, Date_Found) DO NOTHING"
+
+                cursor = self._conn.execute(sql, [row[c] for c in columns])
+                written += cursor.rowcount
+        return written
+
+    def upsert(self, signal: Dict) -> int:
+        """Insert a signal, or update the fields given if (Ticker, Date_Found) exists"""
+        return self._write_many([signal], on_conflict='update')
+
+    def upsert_many(self, signals: Iterable[Dict]) -> int:
+        """Upsert many signals in one transaction"""
+        return self._write_many(signals, on_conflict='update')
+
+    def insert_new(self, signals: Iterable[Dict]) -> int:
+        """Insert signals whose (Ticker, Date_Found) is not stored yet
+
+        Returns:
+            Number of rows actually inserted
+        """
+        return self._write_many(signals, on_conflict='ignore')
+
+    def update(self, signal_id: int, fields: Dict) -> bool:
+        """Update selected fields of one stored signal by id"""
+        return self.update_many({signal_id: fields}) > 0
+
+    def update_many(self, updates: Dict[int, Dict]) -> int:
+        """Update fields on many signals (id → fields) in one transaction"""
+        now = datetime.now().isoformat()
+        changed = 0
+        with self._lock, self._conn:
+            for signal_id, fields in updates.items():
+                row = normalize_signal(fields)
+                row.pop('extra', None)
+                if not row:
+                    continue
+                row['updated_at'] = now
+                assignments = ', '.join(f'{c} = ?' for c in row)
+                cursor = self._conn.execute(f"UPDATE signals SET {assignments} WHERE id = ?",
+                                            list(row.values()) + [signal_id])
+                changed += cursor.rowcount
+        return changed
+
+    # ------------------------------------------------------------------
+    # Query API
+    # ------------------------------------------------------------------
+
+    def latest(self, ticker: str) -> Optional[Dict]:
+        """Most recent signal for a ticker (None if there is none)"""
+        rows = self._fetch("SELECT * FROM signals WHERE Ticker = ? "
+                           "ORDER BY Date_Found DESC, id DESC LIMIT 1", [ticker.upper()])
+        return rows[0] if rows else None
+
+    def query(self,
+              ticker: Optional[str] = None,
+              status: Optional[str] = None,
+              deployed: Optional[str] = None,
+              since: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict]:
+        """
+        Signals matching every given filter, in insertion order
+
+        Args:
+            ticker: Exact ticker (case-insensitive)
+            status: Exact Status value
+            deployed: Exact Deployed value (e.g. 'YES')
+            since: Only signals with Date_Found >= since (YYYY-MM-DD)
+            limit: Maximum number of rows
+        """
+        clauses, params = [], []
+        if ticker is not None:
+            clauses.append('Ticker = ?')
+            params.append(ticker.upper())
+        if status is not None:
+            clauses.append('Status = ?')
+            params.append(status)
+        if deployed is not None:
+            clauses.append('Deployed = ?')
+            params.append(deployed)
+        if since is not None:
+            clauses.append('Date_Found >= ?')
+            params.append(since)
+
+        sql = "SELECT * FROM signals"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return self._fetch(sql, params)
+
+    def all(self) -> List[Dict]:
+        """Every stored signal"""
+        return self.query()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # CSV import / export
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _read_csv(csv_path: str) -> List[Dict]:
+        with open(csv_path, 'r', newline='') as f:
+            return [row for row in csv.DictReader(f)]
+
+    def import_csv(self, csv_path: str = LEGACY_CSV, only_new: bool = False) -> int:
+        """
+        Load rows of a signals CSV (any legacy schema)
+
+        Args:
+            csv_path: CSV to read
+            only_new: Only insert rows whose (Ticker, Date_Found) isn't stored;
+                otherwise existing rows get the CSV's non-blank fields (blank
+                cells never overwrite stored values)
+        """
+        if not os.path.exists(csv_path):
+            return 0
+        rows = self._read_csv(csv_path)
+        if only_new:
+            return self.insert_new(rows)
+        return self._write_many(rows, on_conflict='merge')
+
+    def export_csv(self, csv_path: str = LEGACY_CSV) -> int:
+        """
+        Write every signal to CSV (atomically)
+
+        The mirror keeps the header legacy readers use (LEGACY_HEADER:
+        lowercase names, 'conviction'). Other columns and extras with any
+        value are appended after it, also lowercase.
+        """
+        signals = self.all()
+        fieldnames = list(LEGACY_HEADER)
+        # CSV field → canonical column (None: an extra field, read as-is)
+        sources = {field: _canonical_name(field) for field in fieldnames}
+        covered = set(sources.values())
+        for column in COLUMNS:
+            if column not in covered and any(s.get(column) is not None for s in signals):
+                fieldnames.append(_legacy_name(column))
+                sources[_legacy_name(column)] = column
+                covered.add(column)
+        for signal in signals:
+            for key in signal:
+                if key not in COLUMNS and key != 'id' and key not in sources:
+                    fieldnames.append(key)
+                    sources[key] = None
+
+        def fmt(value):
+            if value is None:
+                return ''
+            if isinstance(value, float) and value.is_integer():
+                return str(int(value))
+            return value
+
+        # Exported cells per row, so sync_csv() can tell which ones a legacy writer edited
+        snapshot = {}
+        tmp_path = f"{csv_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for signal in signals:
+                cells = {field: fmt(signal.get(column or field))
+                         for field, column in sources.items()}
+                writer.writerow(cells)
+                snapshot[_row_key(signal)] = {k: str(v) for k, v in cells.items()}
+        os.replace(tmp_path, csv_path)
+
+        path = os.path.abspath(csv_path)
+        self._set_meta(f'exported_rows:{path}', json.dumps(snapshot))
+        self._set_meta(f'exported:{path}', str(os.path.getmtime(csv_path)))
+        return len(signals)
+
+    def sync_csv(self, csv_path: str = LEGACY_CSV) -> int:
+        """
+        Refresh the CSV mirror
+
+        If the CSV changed since the last export, what legacy scripts wrote
+        to it is imported first, so the re-export never drops it: new rows
+        whole, and for existing rows only the cells that differ from the
+        export (edits, including cleared cells). Cells nobody touched in the
+        CSV don't overwrite newer database values.
+        """
+        if os.path.exists(csv_path):
+            path = os.path.abspath(csv_path)
+            exported = self._get_meta(f'exported:{path}')
+            if exported is None or os.path.getmtime(csv_path) > float(exported):
+                snapshot = self._get_meta(f'exported_rows:{path}')
+                if snapshot is None:
+                    # No record of what was exported: CSV's non-blank cells win
+                    self.import_csv(csv_path)
+                else:
+                    self._import_csv_edits(csv_path, json.loads(snapshot))
+        return self.export_csv(csv_path)
+
+    def _import_csv_edits(self, csv_path: str, snapshot: Dict[str, Dict]) -> int:
+        """Apply CSV rows / cells that differ from the last export's snapshot"""
+        added, edited = [], []
+        for row in self._read_csv(csv_path):
+            before = snapshot.get(_row_key(normalize_signal(row)))
+            if before is None:
+                added.append(row)
+                continue
+            changed = {f for f, v in row.items() if f and (v or '') != before.get(f, '')}
+            if changed:
+                # Key fields and extras (kept whole in one JSON column) ride along
+                edited.append({f: v for f, v in row.items() if f and (
+                    f in changed or _canonical_name(f) in (None, 'Ticker', 'Date_Found'))})
+        return (self._write_many(added, on_conflict='merge')
+                + self._write_many(edited, on_conflict='update'))
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                               "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                               (key, value))
+
+
+_default_store: Optional[SignalStore] = None
+_default_lock = threading.Lock()
+
+
+def get_signal_store() -> SignalStore:
+    """
+    Process-wide SignalStore at trading/signals-database.db
+
+    The first time the database is empty, signals-database.csv is imported
+    (one-shot migration).
+    """
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            store = SignalStore()
+            if store.count() == 0 and os.path.exists(LEGACY_CSV):
+                imported = store.import_csv(LEGACY_CSV)
+                print(f"📥 Imported {imported} signals from {os.path.basename(LEGACY_CSV)}")
+            _default_store = store
+        return _default_store
+
+
+# CLI Interface
+def main():
+    """Command-line interface: import / export / show signals"""
+    import sys
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ('import', 'export', 'sync', 'show'):
+        print("Usage: python signal_store.py import|export|sync [CSV_PATH]")
+        print("       python signal_store.py show [TICKER]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+    arg = sys.argv[2] if len(sys.argv) > 2 else None
+    store = SignalStore()
+
+    if command == 'import':
+        count = store.import_csv(arg or LEGACY_CSV)
+        print(f"✅ Imported {count} signals into {store.db_path}")
+    elif command == 'export':
+        count = store.export_csv(arg or LEGACY_CSV)
+        print(f"✅ Exported {count} signals to {arg or LEGACY_CSV}")
+    elif command == 'sync':
+        count = store.sync_csv(arg or LEGACY_CSV)
+        print(f"✅ Synced {count} signals with {arg or LEGACY_CSV}")
+    else:
+        signals = store.query(ticker=arg) if arg else store.all()
+        for s in signals:
+            print(f"{s['Ticker']:10} {s['Date_Found'] or '-':12} {s['Status'] or '-':12} "
+                  f"{s['Conviction_Score'] if s['Conviction_Score'] is not None else '-':>5}  "
+                  f"{s['Source'] or ''}")
+        print(f"\n{len(signals)} signal(s)")
+
+
+if __name__ == "__main__":
+    main()
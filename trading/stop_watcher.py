@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Stop Watcher for roostr Trading
+Long-running, tick-driven stop-loss / target alerts
+
+Instead of polling every position on a schedule, the watcher reacts to
+each price tick as it arrives. Every ticker keeps its alert levels (stop,
+5% warning band, target 1) in sorted arrays, so a tick finds exactly the
+levels it crossed since the previous tick with two bisects. Open positions
+are also kept ordered by distance-to-stop for a live "closest to stop"
+view.
+
+Ticks come from a feed (an iterator of (ticker, price)):
+- jsonl_feed: tails a local JSONL file ({"ticker": "SOL", "price": 86.1}
+  per line) that any price producer can append to
+- quote_feed: polls price_service.get_quotes as a stand-in stream
+
+Usage:
+    python stop_watcher.py --feed ticks.jsonl
+    python stop_watcher.py --poll 10
+"""
+
+import argparse
+import json
+import os
+import time
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+BASE_DIR = Path(__file__).parent
+ALERT_LOG = BASE_DIR / "risk-alerts.log"
+
+WARNING_PCT = 5.0   # Warn when price is within this % of the stop (as risk_monitor)
+
+STOP_TRIGGERED = 'STOP_TRIGGERED'
+STOP_WARNING = 'STOP_WARNING'
+TARGET_HIT = 'TARGET_HIT'
+
+
+def _level(entry: Tuple[float, str, str]) -> float:
+    return entry[0]
+
+
+class StopWatcher:
+    """Open positions indexed for O(log n) stop / warning / target checks per tick"""
+
+    def __init__(self, warning_pct: float = WARNING_PCT,
+                 on_alert: Optional[Callable[[Dict], None]] = None):
+        self.warning_pct = warning_pct
+        self.on_alert = on_alert
+        self.positions: Dict[str, Dict] = {}
+        self.last_price: Dict[str, float] = {}
+        # ticker → sorted [(level, kind, position_id)]: fire when price falls to level
+        self._down_levels: Dict[str, List[Tuple[float, str, str]]] = {}
+        # ticker → sorted [(level, kind, position_id)]: fire when price rises to level
+        self._up_levels: Dict[str, List[Tuple[float, str, str]]] = {}
+        self._by_ticker: Dict[str, set] = {}
+        # sorted [(distance_pct, position_id)] for positions with a known price
+        self._by_distance: List[Tuple[float, str]] = []
+        self._distance: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------
+    # Positions
+    # ------------------------------------------------------------------
+
+    def add_position(self, ticker: str, stop: float, entry: Optional[float] = None,
+                     target: Optional[float] = None, position_id: Optional[str] = None) -> List[Dict]:
+        """
+        Start watching a position (replaces one with the same position_id)
+
+        Returns:
+            Alerts for levels the ticker's last known price is already past
+        """
+        ticker = ticker.upper()
+        position_id = position_id or ticker
+        if position_id in self.positions:
+            self.remove_position(position_id)
+
+        self.positions[position_id] = {'ticker': ticker, 'stop': stop,
+                                       'entry': entry, 'target': target}
+        self._by_ticker.setdefault(ticker, set()).add(position_id)
+        down = self._down_levels.setdefault(ticker, [])
+        if stop:
+            insort(down, (stop, STOP_TRIGGERED, position_id))
+            # distance (price - stop) / price <= warning_pct  ⇔  price <= stop / (1 - pct)
+            insort(down, (stop / (1 - self.warning_pct / 100), STOP_WARNING, position_id))
+        if target:
+            insort(self._up_levels.setdefault(ticker, []), (target, TARGET_HIT, position_id))
+
+        alerts = []
+        if ticker in self.last_price:
+            price = self.last_price[ticker]
+            self._set_distance(position_id, price)
+            for levels, past in ((down, lambda level: price <= level),
+                                 (self._up_levels.get(ticker, []), lambda level: price >= level)):
+                alerts += [self._alert(kind, pid, price, level)
+                           for level, kind, pid in levels if pid == position_id and past(level)]
+            alerts = self._emit(alerts)
+        return alerts
+
+    def remove_position(self, position_id: str):
+        position = self.positions.pop(position_id, None)
+        if position is None:
+            return
+        ticker = position['ticker']
+        self._by_ticker[ticker].discard(position_id)
+        for levels in (self._down_levels.get(ticker, []), self._up_levels.get(ticker, [])):
+            levels[:] = [lv for lv in levels if lv[2] != position_id]
+        self._clear_distance(position_id)
+
+    def load_signals(self, signals: Iterable[Dict]) -> int:
+        """Watch every deployed signal with a stop (signal store / CSV rows)"""
+        loaded = 0
+        for signal in signals:
+            if signal.get('Deployed') != 'YES':
+                continue
+            try:
+                stop = float(signal.get('Stop_Loss') or 0)
+                entry = float(signal.get('Price_Entry') or 0) or None
+                target = float(signal.get('Target_1') or 0) or None
+            except (TypeError, ValueError):
+                continue
+            if not stop and not target:
+                continue
+            position_id = str(signal.get('id') or signal['Ticker'])
+            self.add_position(signal['Ticker'], stop, entry=entry, target=target,
+                              position_id=position_id)
+            loaded += 1
+        return loaded
+
+    # ------------------------------------------------------------------
+    # Distance-to-stop index
+    # ------------------------------------------------------------------
+
+    def _clear_distance(self, position_id: str):
+        old = self._distance.pop(position_id, None)
+        if old is not None:
+            i = bisect_left(self._by_distance, (old, position_id))
+            del self._by_distance[i]
+
+    def _set_distance(self, position_id: str, price: float):
+        stop = self.positions[position_id]['stop']
+        if not stop or price <= 0:
+            return
+        self._clear_distance(position_id)
+        distance = (price - stop) / price * 100
+        self._distance[position_id] = distance
+        insort(self._by_distance, (distance, position_id))
+
+    def nearest(self, n: int = 5) -> List[Dict]:
+        """Positions closest to (or furthest through) their stop"""
+        return [{'position_id': pid, 'ticker': self.positions[pid]['ticker'],
+                 'distance_pct': distance}
+                for distance, pid in self._by_distance[:n]]
+
+    # ------------------------------------------------------------------
+    # Ticks
+    # ------------------------------------------------------------------
+
+    def on_tick(self, ticker: str, price: float) -> List[Dict]:
+        """
+        Apply one price tick
+
+        Alerts fire when the price crosses a level: down through a stop or
+        into the warning band, up through a target. A position's first tick
+        alerts for any level it is already past.
+
+        Returns:
+            Alerts raised by this tick (also passed to on_alert)
+        """
+        ticker = ticker.upper()
+        prev = self.last_price.get(ticker)
+        self.last_price[ticker] = price
+        alerts = []
+
+        down = self._down_levels.get(ticker)
+        if down:
+            # Levels in [price, prev): crossed on the way down
+            lo = bisect_left(down, price, key=_level)
+            hi = len(down) if prev is None else bisect_left(down, prev, key=_level)
+            for level, kind, position_id in down[lo:hi]:
+                alerts.append(self._alert(kind, position_id, price, level))
+
+        up = self._up_levels.get(ticker)
+        if up:
+            # Levels in (prev, price]: crossed on the way up
+            lo = 0 if prev is None else bisect_right(up, prev, key=_level)
+            hi = bisect_right(up, price, key=_level)
+            for level, kind, position_id in up[lo:hi]:
+                alerts.append(self._alert(kind, position_id, price, level))
+
+        for position_id in self._by_ticker.get(ticker, ()):
+            self._set_distance(position_id, price)
+
+        return self._emit(alerts)
+
+    def _emit(self, alerts: List[Dict]) -> List[Dict]:
+        # A stop breach supersedes the warning for the same position
+        stopped = {a['position_id'] for a in alerts if a['type'] == STOP_TRIGGERED}
+        alerts = [a for a in alerts
+                  if not (a['type'] == STOP_WARNING and a['position_id'] in stopped)]
+        if self.on_alert:
+            for alert in alerts:
+                self.on_alert(alert)
+        return alerts
+
+    def _alert(self, kind: str, position_id: str, price: float, level: float) -> Dict:
+        position = self.positions[position_id]
+        alert = {
+            'type': kind,
+            'ticker': position['ticker'],
+            'position_id': position_id,
+            'price': price,
+            'stop': position['stop'],
+            'timestamp': datetime.now().isoformat()
+        }
+        if kind == TARGET_HIT:
+            alert['target'] = level
+            alert['target_level'] = 1
+        elif position['stop']:
+            alert['distance_pct'] = (price - position['stop']) / price * 100
+        return alert
+
+    def run(self, feed: Iterable[Tuple[str, float]]):
+        """Consume a tick feed until it ends (or Ctrl-C)"""
+        for ticker, price in feed:
+            self.on_tick(ticker, price)
+
+
+# ----------------------------------------------------------------------
+# Feeds
+# ----------------------------------------------------------------------
+
+def jsonl_feed(path: str, follow: bool = True, poll: float = 0.05) -> Iterator[Tuple[str, float]]:
+    """
+    Ticks from a JSONL file ({"ticker": ..., "price": ...} per line)
+
+    With follow=True the file is tailed like `tail -f`: new lines are
+    yielded as soon as a producer appends them. A line caught mid-write
+    (no trailing newline yet) is held until the rest of it arrives.
+    """
+    with open(path, 'r') as f:
+        partial = ''
+        while True:
+            chunk = f.readline()
+            if chunk:
+                partial += chunk
+                if not partial.endswith('\n'):
+                    continue
+            elif follow:
+                time.sleep(poll)
+                continue
+            elif not partial:
+                return
+            # A complete line (or, without follow, the file's unterminated last one)
+            line, partial = partial, ''
+            try:
+                tick = json.loads(line)
+                yield tick['ticker'], float(tick['price'])
+            except (ValueError, KeyError, TypeError):
+                continue
+
+
+def quote_feed(tickers: List[str], interval: float = 10.0) -> Iterator[Tuple[str, float]]:
+    """Stand-in stream: poll price_service.get_quotes and emit each quote as a tick"""
+    from price_service import get_quotes
+
+    while True:
+        started = time.time()
+        for ticker, quote in get_quotes(tickers).items():
+            yield ticker, float(quote['price'])
+        time.sleep(max(0.0, interval - (time.time() - started)))
+
+
+# ----------------------------------------------------------------------
+# Alert output
+# ----------------------------------------------------------------------
+
+def print_alert(alert: Dict):
+    """Console + risk-alerts.log output (matches risk_monitor)"""
+    ticker, price = alert['ticker'], alert['price']
+    if alert['type'] == STOP_TRIGGERED:
+        line = f"🚨 {ticker}: ${price:.2f} <= stop ${alert['stop']:.2f}"
+    elif alert['type'] == STOP_WARNING:
+        line = f"⚠️  {ticker}: ${price:.2f} (stop: ${alert['stop']:.2f}) | {alert['distance_pct']:.1f}% away"
+    else:
+        line = f"🎯 {ticker}: ${price:.2f} >= target ${alert['target']:.2f}"
+    print(f"[{alert['timestamp']}] {line}")
+
+    if alert['type'] == STOP_TRIGGERED:
+        with open(ALERT_LOG, "a") as f:
+            f.write(f"\n[{alert['timestamp']}] STOP LOSS VIOLATION\n")
+            f.write(f"  {ticker}: ${price:.2f} <= ${alert['stop']:.2f}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tick-driven stop-loss watcher')
+    parser.add_argument('--feed', help='JSONL tick file to tail')
+    parser.add_argument('--poll', type=float, default=10.0,
+                        help='Without --feed: seconds between price_service polls')
+    args = parser.parse_args()
+
+    from signal_store import get_signal_store
+
+    watcher = StopWatcher(on_alert=print_alert)
+    loaded = watcher.load_signals(get_signal_store().query(deployed='YES'))
+    tickers = sorted({p['ticker'] for p in watcher.positions.values()})
+    print(f"👀 Watching {loaded} positions: {', '.join(tickers) or 'none'}")
+    if not loaded:
+        return
+
+    if args.feed:
+        if not os.path.exists(args.feed):
+            open(args.feed, 'a').close()
+        feed = jsonl_feed(args.feed)
+    else:
+        feed = quote_feed(tickers, interval=args.poll)
+
+    try:
+        watcher.run(feed)
+    except KeyboardInterrupt:
+        print("\n📊 Closest to stop:")
+        for row in watcher.nearest():
+            print(f"   {row['ticker']:8} {row['distance_pct']:+.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,22 @@ Price Update Worker - Updates prices for all deployed positions
 Called by update_prices.sh every 5 minutes
 """
 
-import csv
 import sys
 from datetime import datetime
 from price_fetcher import PriceFetcher
+from signal_store import get_signal_store
 
 def update_prices():
     """Update all deployed positions with current prices"""
     
-    # Read signals database
-    signals = []
-    with open('signals-database.csv', 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            signals.append(row)
+    # Read deployed positions from the signal store
+    store = get_signal_store()
+    signals = store.query(deployed='YES')
     
     # Find deployed crypto positions
     deployed_tickers = []
     for signal in signals:
-        if signal.get('Deployed') == 'YES' and signal.get('Ticker'):
+        if signal.get('Ticker'):
             ticker = signal['Ticker'].upper()
             # Only update crypto (not stocks/forex)
             if ticker not in ['ASTS', 'TAC', 'AS', 'PYPL', 'EURUSD']:
@@ -45,19 +42,20 @@ def update_prices():
     print(f"✅ Fetched {len(prices)} prices")
     
     # Update signals with new prices
-    updates_made = 0
+    updates = {}
     
     for signal in signals:
         ticker = signal.get('Ticker', '').upper()
         
-        if ticker in prices and signal.get('Deployed') == 'YES':
+        if ticker in prices:
             price_data = prices[ticker]
             current_price = price_data['price']
-            entry_price = float(signal.get('Price_Entry', 0))
-            position_size = float(signal.get('Position_Size', 0))
+            entry_price = float(signal.get('Price_Entry') or 0)
+            position_size = float(signal.get('Position_Size') or 0)
             
             # Update current price
-            signal['Current_Price'] = f"{current_price:.2f}"
+            fields = {'Current_Price': round(current_price, 2)}
+            updates[signal['id']] = fields
             
             # Calculate P&L
             # Position_Size is in USD, so units = Position_Size / Entry_Price
@@ -66,19 +64,15 @@ def update_prices():
                 pnl_dollars = (current_price - entry_price) * position_units
                 pnl_percent = ((current_price - entry_price) / entry_price) * 100
                 
-                signal['PnL_Dollars'] = f"{pnl_dollars:.0f}"
-                signal['PnL_Percent'] = f"{pnl_percent:.2f}"
+                fields['PnL_Dollars'] = round(pnl_dollars)
+                fields['PnL_Percent'] = round(pnl_percent, 2)
                 
                 print(f"   {ticker}: ${current_price:.2f} | P&L: ${pnl_dollars:+,.0f} ({pnl_percent:+.1f}%)")
-                updates_made += 1
     
-    # Write back to CSV
-    if updates_made > 0:
-        with open('signals-database.csv', 'w', newline='') as f:
-            fieldnames = signals[0].keys()
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(signals)
+    # Row-level updates (no whole-file rewrite), then refresh the CSV mirror
+    if updates:
+        updates_made = store.update_many(updates)
+        store.sync_csv()
         
         print(f"✅ Updated {updates_made} positions in database")
     
@@ -9,14 +9,26 @@ Author: Quant Agent
 Version: 1.0.0
 """
 
+import os
 import pandas as pd
 import numpy as np
 from scipy import stats
 from scipy.stats import pearsonr, spearmanr, ttest_ind, kstest
 from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
+from backtest import Backtester, BacktestConfig, FLAT_RETURNS_TOLERANCE, annualized_sharpe
+
+# Simulated trades held in memory per Monte Carlo chunk (~40 MB of float64)
+MC_CHUNK_ELEMENTS = 5_000_000
+
+# Below this many windows a process pool costs more than it saves
+WF_PARALLEL_MIN_WINDOWS = 64
+# Walk-forward windows need this many trades on each side to be summarized
+WF_MIN_TRADES = 3
+
 
 class SignalValidator:
     """
@@ -114,7 +126,9 @@ class SignalValidator:
             test_type = "two-sample (vs benchmark)"
         
         # Effect size (Cohen's d)
-        cohens_d = signal_clean.mean() / signal_clean.std() if signal_clean.std() > 0 else 0
+        std = signal_clean.std()
+        flat = std <= FLAT_RETURNS_TOLERANCE * max(1.0, abs(signal_clean.mean()))
+        cohens_d = 0 if flat else signal_clean.mean() / std
         
         # Interpretation
         if p_value < 0.01:
@@ -235,27 +249,98 @@ class SignalValidator:
     def walk_forward_validation(self,
                                signals_df: pd.DataFrame,
                                window_size: int = 20,
-                               test_size: int = 5) -> Dict:
+                               test_size: int = 5,
+                               backtester: Optional[Backtester] = None,
+                               workers: Optional[int] = None) -> Dict:
         """
         Perform walk-forward validation (rolling window backtesting)
         
-        Splits data into rolling train/test windows to validate consistency.
+        Splits data into rolling train/test windows and backtests each one,
+        comparing out-of-sample performance against in-sample.
         More robust than single train/test split.
         
         Args:
-            signals_df: Signal data with dates
+            signals_df: Signal data with dates (Ticker, Date_Found, Price_Entry)
             window_size: Training window size (number of signals)
             test_size: Test window size
+            backtester: Backtester to use (default: BacktestConfig defaults)
+            workers: Processes for window evaluation (None = all cores)
             
         Returns:
             Walk-forward validation results
         """
-        if len(signals_df) < window_size + test_size:
-            return {'error': 'Insufficient data for walk-forward validation'}
+        return self.walk_forward_sweep(signals_df, [window_size], test_size,
+                                       backtester=backtester, workers=workers)[window_size]
+    
+    def walk_forward_sweep(self,
+                           signals_df: pd.DataFrame,
+                           window_sizes: List[int],
+                           test_size: int = 5,
+                           backtester: Optional[Backtester] = None,
+                           workers: Optional[int] = None) -> Dict[int, Dict]:
+        """
+        Walk-forward validation for several training window sizes
         
+        Every signal's exit only depends on its own price path, so exits are
+        found once over the whole history; each window just re-prices its
+        slice of that shared exit table (sizing, equity curve, metrics).
+        
+        Returns:
+            window_size → walk_forward_validation result
+        """
         # Sort by date
         signals_df = signals_df.sort_values('Date_Found').reset_index(drop=True)
         
+        too_short = [w for w in window_sizes if len(signals_df) < w + test_size]
+        if len(too_short) == len(window_sizes):
+            return {w: {'error': 'Insufficient data for walk-forward validation'} for w in window_sizes}
+        
+        backtester = backtester or Backtester()
+        exits = backtester.find_signal_exits(signals_df)
+        table = _WalkForwardTable(backtester.config, exits, signals_df['Date_Found'].tolist())
+        
+        all_windows = {w: self._walk_forward_windows(signals_df, w, test_size)
+                       for w in window_sizes if w not in too_short}
+        n_windows = sum(len(windows) for windows in all_windows.values())
+        workers = workers or os.cpu_count() or 1
+        
+        executor = None
+        if workers > 1 and n_windows >= WF_PARALLEL_MIN_WINDOWS:
+            # Workers get the exit table once; tasks only carry index ranges
+            executor = ProcessPoolExecutor(max_workers=workers,
+                                           initializer=_init_walk_forward_worker,
+                                           initargs=(table,))
+        
+        results = {}
+        try:
+            for window_size in window_sizes:
+                if window_size in too_short:
+                    results[window_size] = {'error': 'Insufficient data for walk-forward validation'}
+                    continue
+                
+                windows = all_windows[window_size]
+                if executor is not None:
+                    chunksize = max(1, len(windows) // (workers * 4))
+                    evaluated = list(executor.map(_evaluate_walk_forward_window, windows,
+                                                  chunksize=chunksize))
+                else:
+                    evaluated = [table.evaluate(window) for window in windows]
+                
+                results[window_size] = {
+                    'total_windows': len(evaluated),
+                    'window_size': window_size,
+                    'test_size': test_size,
+                    'windows': evaluated,
+                    'summary': self._summarize_walk_forward(evaluated)
+                }
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        return results
+    
+    def _walk_forward_windows(self, signals_df: pd.DataFrame,
+                              window_size: int, test_size: int) -> List[Dict]:
         windows = []
         position = 0
         
@@ -275,26 +360,60 @@ class SignalValidator:
             
             position += test_size  # Slide window
         
+        return windows
+    
+    def _summarize_walk_forward(self, windows: List[Dict],
+                                min_trades: int = WF_MIN_TRADES) -> Dict:
+        """
+        Aggregate out-of-sample stats across windows
+        
+        Only windows with at least min_trades trades on both sides count, and
+        Sharpe ratios are summarized by their median: a window of two or three
+        trades can have an extreme Sharpe that would swamp a mean.
+        """
+        scored = [w for w in windows
+                  if w['in_sample'] and w['out_of_sample']
+                  and w['in_sample']['total_trades'] >= min_trades
+                  and w['out_of_sample']['total_trades'] >= min_trades]
+        if not scored:
+            return {'windows_evaluated': 0, 'windows_skipped': len(windows)}
+        
+        oos_sharpe = np.array([w['oos_sharpe'] for w in scored])
+        is_sharpe = np.array([w['in_sample']['sharpe_ratio'] for w in scored])
+        sharpe_degradation = [w['degradation']['metric_comparisons']['sharpe_ratio']['degradation_pct']
+                              for w in scored]
+        
         return {
-            'total_windows': len(windows),
-            'window_size': window_size,
-            'test_size': test_size,
-            'windows': windows
+            'windows_evaluated': len(scored),
+            'windows_skipped': len(windows) - len(scored),
+            'median_is_sharpe': round(np.median(is_sharpe), 2),
+            'median_oos_sharpe': round(np.median(oos_sharpe), 2),
+            'mean_oos_hit_rate': round(np.mean([w['oos_hit_rate'] for w in scored]), 2),
+            'mean_oos_return_pct': round(np.mean([w['out_of_sample']['total_return_pct'] for w in scored]), 2),
+            'median_sharpe_degradation_pct': round(np.median(sharpe_degradation), 2),
+            'positive_oos_windows_pct': round((oos_sharpe > 0).mean() * 100, 2),
+            'overfit_windows': sum(w['degradation']['overfitting_detected'] for w in scored)
         }
     
     def monte_carlo_simulation(self,
                               trades: List[Dict],
                               n_simulations: int = 1000,
-                              randomize_order: bool = True) -> Dict:
+                              randomize_order: bool = True,
+                              seed: Optional[int] = None,
+                              chunk_elements: int = MC_CHUNK_ELEMENTS) -> Dict:
         """
         Monte Carlo simulation to test strategy robustness
         
         Randomly reorders trades to see if performance was due to luck or skill.
+        Simulations are drawn as (n_sims × n_trades) matrices in chunks, and each
+        row is also compounded into an equity path for drawdown statistics.
         
         Args:
             trades: List of trade results
             n_simulations: Number of random simulations
-            randomize_order: Whether to randomize trade order
+            randomize_order: Bootstrap trades with replacement (False = shuffle only)
+            seed: Seed for the random Generator (None = nondeterministic)
+            chunk_elements: Max simulated trades held in memory per chunk
             
         Returns:
             Monte Carlo results with confidence intervals
@@ -302,30 +421,36 @@ class SignalValidator:
         if len(trades) < 10:
             return {'error': 'Need at least 10 trades for Monte Carlo simulation'}
         
-        trade_returns = np.array([t['return_pct'] for t in trades])
+        trade_returns = np.array([t['return_pct'] for t in trades], dtype=float)
         original_total_return = trade_returns.sum()
+        original_max_drawdown = self._max_drawdown(trade_returns[None, :])[0]
+        n_trades = len(trade_returns)
         
-        simulated_returns = []
+        rng = np.random.default_rng(seed)
+        simulated_returns = np.empty(n_simulations)
+        ending_equity = np.empty(n_simulations)
+        max_drawdowns = np.empty(n_simulations)
         
-        for _ in range(n_simulations):
+        chunk_rows = max(1, chunk_elements // n_trades)
+        for start in range(0, n_simulations, chunk_rows):
+            rows = min(chunk_rows, n_simulations - start)
             if randomize_order:
-                sim_returns = np.random.choice(trade_returns, size=len(trade_returns), replace=True)
+                sims = trade_returns[rng.integers(0, n_trades, size=(rows, n_trades))]
             else:
-                sim_returns = trade_returns.copy()
-                np.random.shuffle(sim_returns)
+                sims = rng.permuted(np.broadcast_to(trade_returns, (rows, n_trades)), axis=1)
             
-            simulated_returns.append(sim_returns.sum())
+            equity = np.cumprod(1 + sims / 100, axis=1)
+            chunk = slice(start, start + rows)
+            simulated_returns[chunk] = sims.sum(axis=1)
+            ending_equity[chunk] = equity[:, -1]
+            max_drawdowns[chunk] = self._max_drawdown(sims, equity)
         
-        simulated_returns = np.array(simulated_returns)
+        ending_return_pct = (ending_equity - 1) * 100
+        max_drawdown_pct = max_drawdowns * 100
+        levels = {'5th': 5, '25th': 25, '50th': 50, '75th': 75, '95th': 95}
         
         # Calculate percentiles
-        percentiles = {
-            '5th': np.percentile(simulated_returns, 5),
-            '25th': np.percentile(simulated_returns, 25),
-            '50th': np.percentile(simulated_returns, 50),
-            '75th': np.percentile(simulated_returns, 75),
-            '95th': np.percentile(simulated_returns, 95)
-        }
+        percentiles = dict(zip(levels, np.percentile(simulated_returns, list(levels.values()))))
         
         # Where does original performance rank?
         percentile_rank = (simulated_returns < original_total_return).mean() * 100
@@ -346,9 +471,31 @@ class SignalValidator:
             'std_simulated_return': round(simulated_returns.std(), 2),
             'percentiles': {k: round(v, 2) for k, v in percentiles.items()},
             'percentile_rank': round(percentile_rank, 2),
-            'interpretation': interpretation
+            'interpretation': interpretation,
+            'ending_equity': {
+                'mean_return': round(ending_return_pct.mean(), 2),
+                'percentiles': {k: round(v, 2) for k, v in zip(
+                    levels, np.percentile(ending_return_pct, list(levels.values())))},
+                'probability_of_loss': round((ending_equity < 1).mean() * 100, 2)
+            },
+            'max_drawdown': {
+                'original': round(original_max_drawdown * 100, 2),
+                'mean': round(max_drawdown_pct.mean(), 2),
+                'percentiles': {k: round(v, 2) for k, v in zip(
+                    levels, np.percentile(max_drawdown_pct, list(levels.values())))}
+            },
+            'seed': seed
         }
     
+    @staticmethod
+    def _max_drawdown(returns_pct: np.ndarray, equity: Optional[np.ndarray] = None) -> np.ndarray:
+        """Max peak-to-trough drawdown (fraction) of each row's compounded equity path"""
+        if equity is None:
+            equity = np.cumprod(1 + returns_pct / 100, axis=1)
+        # Starting equity (1.0) counts as the first peak
+        peaks = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)
+        return (1 - equity / peaks).max(axis=1)
+    
     def sharpe_ratio_significance(self, 
                                   returns: np.ndarray,
                                   risk_free_rate: float = 0.02) -> Dict:
@@ -371,7 +518,7 @@ class SignalValidator:
         
         # Calculate Sharpe ratio
         excess_returns = returns_clean - (risk_free_rate / 252)  # Daily risk-free
-        sharpe = excess_returns.mean() / excess_returns.std() * np.sqrt(252) if excess_returns.std() > 0 else 0
+        sharpe = annualized_sharpe(excess_returns)
         
         # Standard error of Sharpe ratio
         n = len(returns_clean)
@@ -407,6 +554,66 @@ class SignalValidator:
         }
 
 
+WF_METRICS = ['total_trades', 'win_rate_pct', 'sharpe_ratio', 'total_return_pct', 'max_drawdown_pct']
+
+
+class _WalkForwardTable:
+    """Shared exit table that walk-forward windows re-price by index range"""
+    
+    def __init__(self, config: BacktestConfig, exits: List[Tuple], dates: List):
+        self.config = config
+        self.exits = exits
+        self.exit_positions = np.array([e[0] for e in exits], dtype=int)
+        self.dates = dates
+        self._backtester: Optional[Backtester] = None
+    
+    def __getstate__(self):
+        # Workers build their own Backtester
+        state = dict(self.__dict__)
+        state['_backtester'] = None
+        return state
+    
+    def _metrics(self, start: int, end: int) -> Optional[Dict]:
+        lo, hi = np.searchsorted(self.exit_positions, [start, end])
+        # replay_exits starts a fresh equity curve, so one Backtester serves every window
+        if self._backtester is None:
+            self._backtester = Backtester(self.config)
+        backtester = self._backtester
+        backtester.replay_exits(self.exits[lo:hi], self.dates[start])
+        metrics = backtester.calculate_metrics()
+        if 'error' in metrics:
+            return None
+        return {k: metrics[k] for k in WF_METRICS}
+    
+    def evaluate(self, window: Dict) -> Dict:
+        """Backtest one window's train and test slices"""
+        in_sample = self._metrics(*window['train_indices'])
+        out_of_sample = self._metrics(*window['test_indices'])
+        
+        result = dict(window)
+        result.update({
+            'in_sample': in_sample,
+            'out_of_sample': out_of_sample,
+            'oos_sharpe': out_of_sample['sharpe_ratio'] if out_of_sample else None,
+            'oos_hit_rate': out_of_sample['win_rate_pct'] if out_of_sample else None,
+            'degradation': (SignalValidator().detect_overfitting(in_sample, out_of_sample)
+                            if in_sample and out_of_sample else None)
+        })
+        return result
+
+
+_worker_table: Optional[_WalkForwardTable] = None
+
+
+def _init_walk_forward_worker(table: _WalkForwardTable):
+    global _worker_table
+    _worker_table = table
+
+
+def _evaluate_walk_forward_window(window: Dict) -> Dict:
+    return _worker_table.evaluate(window)
+
+
 def generate_validation_report(signals_df: pd.DataFrame, 
                                backtest_results: Dict,
                                output_path: str = None) -> str:
@@ -505,6 +712,13 @@ Percentile Distribution:
   75th: {mc_results['percentiles']['75th']}%
   95th: {mc_results['percentiles']['95th']}%
 
+Compounded Equity Paths:
+  Median Ending Return:    {mc_results['ending_equity']['percentiles']['50th']}%
+  Probability of Loss:     {mc_results['ending_equity']['probability_of_loss']}%
+  Original Max Drawdown:   {mc_results['max_drawdown']['original']}%
+  Median Max Drawdown:     {mc_results['max_drawdown']['percentiles']['50th']}%
+  95th pct Max Drawdown:   {mc_results['max_drawdown']['percentiles']['95th']}%
+
 """
     
     report += "═" * 60 + "\n"